@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark deteksi halaman foto (pklgen.extract.detect_photo_pages).
+
+    python -m benchmarks.bench_detect
+    python -m benchmarks.bench_detect --pages 200 --text-lines 80
+    python -m benchmarks.bench_detect --pdf laporan.pdf
+
+Tanpa --pdf, dibuat PDF sintetis (default 100 halaman) dengan foto di
+halaman 27-34, logo kecil di setiap halaman (harus tidak terdeteksi) dan
+beberapa puluh baris teks per halaman. Dicetak waktu pindai (median, tanpa
+biaya import pypdf), waktu per halaman dan apakah halaman yang terdeteksi
+sama dengan halaman foto sintetis. Tidak ada halaman yang dirender.
+"""
+
+import argparse
+import shutil
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import write_pdf
+from pklgen.content import format_pages
+from pklgen.extract import detect_photo_pages
+
+PHOTO_PAGES = tuple(range(27, 35))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pdf", help="PDF sumber (default: PDF sintetis)")
+    parser.add_argument("--pages", type=int, default=100, help="jumlah halaman PDF sintetis (default: 100)")
+    parser.add_argument("--text-lines", type=int, default=40, help="baris teks per halaman sintetis")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    tmp_dir = None
+    pdf_path = args.pdf
+    if pdf_path is None:
+        tmp_dir = tempfile.mkdtemp(prefix="bench-detect-")
+        pdf_path = write_pdf(Path(tmp_dir) / "synthetic.pdf", args.pages, PHOTO_PAGES,
+                             logo_pages=range(1, args.pages + 1), text_lines=args.text_lines)
+
+    try:
+        start = time.perf_counter()
+        detected = detect_photo_pages(pdf_path)
+        first = time.perf_counter() - start
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            detect_photo_pages(pdf_path)
+            times.append(time.perf_counter() - start)
+        scan = statistics.median(times)
+
+        from pypdf import PdfReader
+
+        with open(pdf_path, "rb") as f:
+            n_pages = len(PdfReader(f).pages)
+        print(f"PDF: {pdf_path}  ({n_pages} halaman, {Path(pdf_path).stat().st_size / 1024 / 1024:.1f} MB)")
+        print(f"  {'pindai pertama (termasuk import pypdf)':<40} {first * 1000:7.1f} ms")
+        print(f"  {f'pindai (median {args.repeat}x)':<40} {scan * 1000:7.1f} ms  "
+              f"({scan * 1000 / max(n_pages, 1):.2f} ms/halaman)")
+        print(f"  halaman foto: {format_pages(detected) or '-'} ({len(detected)} halaman)")
+        if args.pdf is None:
+            print(f"  sesuai halaman foto sintetis: {'ya' if detected == list(PHOTO_PAGES) else 'TIDAK'}")
+    finally:
+        if tmp_dir:
+            shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
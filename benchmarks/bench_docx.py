@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark STEP 2: build_report() + doc.save() lewat python-docx dibandingkan
+render_report() dari template yang sudah dikompilasi.
+
+    python -m benchmarks.bench_docx
+    python -m benchmarks.bench_docx --students 200 --roster contoh_roster.csv
+    python -m benchmarks.bench_docx --photos 8
+
+Juga mencetak ukuran word/document.xml siswa pertama (sebelum dan sesudah
+kompresi). Siswa sintetis dari benchmarks.synthetic.make_students(). Setiap
+dokumen dari jalur cepat
+dicek identik dengan jalur python-docx. --photos N menambahkan Lampiran
+dengan N foto sintetis 800 px (ukuran thumbnail STEP 1B).
+"""
+
+import argparse
+import io
+import time
+import zipfile
+
+from pklgen.content import load_roster
+from pklgen.report import build_report
+from pklgen.report_template import DOCUMENT_PART, render_report
+
+from .synthetic import make_photo_jpeg, make_students
+
+
+def _quiet(msg):
+    pass
+
+
+def docx_python_docx(student, photos):
+    buf = io.BytesIO()
+    build_report(student, photos, log=_quiet).save(buf)
+    return buf.getvalue()
+
+
+def docx_compiled(student, photos):
+    return render_report(student, photos, log=_quiet)
+
+
+def bench(render, students, photos):
+    start = time.perf_counter()
+    outputs = [render(student, photos) for student in students]
+    return time.perf_counter() - start, outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--students", type=int, default=50, help="jumlah siswa sintetis (default: 50)")
+    parser.add_argument("--roster", help="pakai roster ini, bukan siswa sintetis")
+    parser.add_argument("--photos", type=int, default=0, help="jumlah foto di Lampiran (default: 0)")
+    args = parser.parse_args()
+
+    students = load_roster(args.roster) if args.roster else make_students(args.students)
+    photos = [make_photo_jpeg(800, 1131, seed=i, quality=80)[0] for i in range(args.photos)]
+    # Pemanasan: import python-docx, template, kompilasi fragmen
+    docx_python_docx(students[0], photos)
+    first_start = time.perf_counter()
+    docx_compiled(students[0], photos)
+    print(f"{len(students)} siswa, {len(photos)} foto  "
+          f"(kompilasi template: {(time.perf_counter() - first_start) * 1000:.1f} ms, sekali per proses)")
+
+    results = {}
+    for label, render in (("python-docx", docx_python_docx), ("compiled", docx_compiled)):
+        elapsed, outputs = bench(render, students, photos)
+        results[label] = (elapsed, outputs)
+        size = sum(len(data) for data in outputs) / len(outputs)
+        with zipfile.ZipFile(io.BytesIO(outputs[0])) as zf:
+            document = zf.getinfo(DOCUMENT_PART)
+        print(f"  {label:<12} {elapsed * 1000 / len(students):8.2f} ms/siswa  {size / 1024:6.1f} KB/docx  "
+              f"{DOCUMENT_PART} {document.file_size / 1024:.1f} KB ({document.compress_size / 1024:.1f} KB terkompresi)")
+
+    mismatched = 0
+    for reference, fast in zip(results["python-docx"][1], results["compiled"][1]):
+        with zipfile.ZipFile(io.BytesIO(reference)) as a, zipfile.ZipFile(io.BytesIO(fast)) as b:
+            if sorted(a.namelist()) != sorted(b.namelist()) or \
+                    any(a.read(name) != b.read(name) for name in a.namelist()):
+                mismatched += 1
+    print(f"  speedup compiled vs python-docx: {results['python-docx'][0] / results['compiled'][0]:.1f}x")
+    print(f"  {DOCUMENT_PART} + part lain identik: {len(students) - mismatched}/{len(students)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark STEP 1: biaya per halaman dan ukuran output setiap mode ekstraksi
+(``embedded``, ``batch``, ``parallel``, ``per_page``).
+
+    python -m benchmarks.bench_extract
+    python -m benchmarks.bench_extract --pdf laporan.pdf --pages 27-34
+    python -m benchmarks.bench_extract --pages 1-40 --workers 8
+
+Tanpa --pdf, dibuat PDF sintetis 40 halaman dengan foto di halaman 27-34.
+Butuh pdf2image + poppler (pdftoppm) terpasang.
+"""
+
+import argparse
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import write_pdf
+from pklgen.extract import EXTRACT_MODES, extract_photos
+
+
+def parse_pages(spec):
+    pages = []
+    for part in spec.split(","):
+        if "-" in part:
+            first, last = part.split("-")
+            pages.extend(range(int(first), int(last) + 1))
+        else:
+            pages.append(int(part))
+    return pages
+
+
+def bench_mode(pdf_path, pages, mode, dpi, repeat, workers=None):
+    best = None
+    for _ in range(repeat):
+        out_dir = Path(tempfile.mkdtemp(prefix=f"bench-{mode}-"))
+        try:
+            start = time.perf_counter()
+            extracted = extract_photos(pdf_path, pages, out_dir, dpi=dpi, mode=mode, workers=workers,
+                                       log=lambda msg: None)
+            elapsed = time.perf_counter() - start
+            size = sum(path.stat().st_size for path in extracted.values())
+        finally:
+            shutil.rmtree(out_dir)
+        if best is None or elapsed < best[0]:
+            best = (elapsed, len(extracted), size)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pdf", help="PDF sumber (default: PDF sintetis)")
+    parser.add_argument("--pages", default="27-34", help="halaman, mis. 27-34 atau 3,7,27-34")
+    parser.add_argument("--dpi", type=int, default=150)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=None, help="worker mode parallel (default: jumlah CPU)")
+    args = parser.parse_args()
+
+    pages = parse_pages(args.pages)
+    tmp_dir = None
+    pdf_path = args.pdf
+    if pdf_path is None:
+        tmp_dir = tempfile.mkdtemp(prefix="bench-pdf-")
+        pdf_path = write_pdf(Path(tmp_dir) / "synthetic.pdf", max(40, max(pages)), pages)
+
+    try:
+        print(f"PDF: {pdf_path}  halaman: {len(pages)}  dpi: {args.dpi}  repeat: {args.repeat}")
+        results = {}
+        for mode in EXTRACT_MODES:
+            elapsed, count, size = bench_mode(pdf_path, pages, mode, args.dpi, args.repeat, args.workers)
+            results[mode] = elapsed
+            per_page = elapsed / max(count, 1) * 1000
+            print(f"  {mode:<9} {elapsed:7.3f} s total  {per_page:8.1f} ms/halaman  "
+                  f"{size / 1024:8.0f} KB  ({count} foto)")
+        for mode in ("embedded", "batch", "parallel"):
+            if results.get(mode):
+                print(f"  speedup {mode} vs per_page: {results['per_page'] / results[mode]:.2f}x")
+    finally:
+        if tmp_dir:
+            shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
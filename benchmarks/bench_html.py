@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark index.html (STEP 4): ukuran transfer dan waktu render pertama.
+
+    python -m benchmarks.bench_html
+    python -m benchmarks.bench_html --pages 27-40 --no-browser
+
+Paket dibangun dari PDF sintetis (foto JPEG tertanam di halaman 27-34),
+lalu dicetak:
+- waktu render_html() di Python dan ukuran index.html (mentah dan gzip)
+- resource yang diminta saat halaman dibuka (hanya index.html: CSS dan JS
+  inline, foto galeri baru dimuat saat bagian Dokumentasi dibuka)
+- dengan Playwright + Chromium terpasang (pip install playwright &&
+  playwright install chromium): first-contentful-paint, DOMContentLoaded,
+  jumlah request dan byte saat load dan setelah membuka #lampiran, lewat
+  server HTTP lokal. Tanpa Playwright hanya angka statis yang dicetak.
+"""
+
+import argparse
+import functools
+import gzip
+import http.server
+import re
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from benchmarks.bench_extract import parse_pages
+from benchmarks.synthetic import write_pdf
+from pklgen.content import DEFAULT_STUDENT
+from pklgen.images import gallery_entries
+from pklgen.pipeline import build_package
+from pklgen.site import render_html
+
+# Atribut yang membuat browser langsung mengunduh resource saat halaman dimuat
+EAGER_RESOURCE = re.compile(rb'<(?:img|source|link|script)\b[^>]*?\s(?:src|srcset|href)="([^"#][^"]*)"')
+
+
+def _quiet(msg):
+    pass
+
+
+def static_report(root, student, photo_names, thumb_names, repeat):
+    gallery = gallery_entries(photo_names, thumb_names)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render_html(student, gallery)
+        times.append(time.perf_counter() - start)
+    page = (root / "index.html").read_bytes()
+    # Tautan download docx (<a href>) tidak diunduh otomatis
+    eager = [m.group(1).decode() for m in EAGER_RESOURCE.finditer(page)]
+    lazy = sum((root / jpeg).stat().st_size for _, thumbs in gallery for _, jpeg, _ in thumbs[-1:])
+    print(f"  render_html()            {statistics.median(times) * 1000:8.2f} ms")
+    print(f"  index.html               {len(page) / 1024:8.1f} KB  (gzip {len(gzip.compress(page)) / 1024:.1f} KB)")
+    print(f"  resource saat load       {len(eager)} selain index.html{': ' + ', '.join(eager) if eager else ''}")
+    print(f"  galeri (JPEG terbesar)   {lazy / 1024:8.1f} KB, dimuat saat #lampiran dibuka")
+
+
+class _QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+def browser_report(root, repeat):
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        print("  (Playwright tidak terpasang: first-contentful-paint tidak diukur)")
+        return
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0),
+                                             functools.partial(_QuietHandler, directory=str(root)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/index.html"
+    runs = []
+    try:
+        with sync_playwright() as p:
+            browser = p.chromium.launch()
+            for _ in range(repeat):
+                context = browser.new_context()
+                page = context.new_page()
+                responses = []
+                page.on("requestfinished", lambda request: responses.append(request))
+                page.goto(url, wait_until="networkidle")
+                timing = page.evaluate("""() => ({
+                    fcp: (performance.getEntriesByName('first-contentful-paint')[0] || {}).startTime,
+                    dcl: performance.getEntriesByType('navigation')[0].domContentLoadedEventEnd,
+                })""")
+                at_load = list(responses)
+                page.goto(url + "#lampiran")
+                page.wait_for_load_state("networkidle")
+                runs.append((timing, at_load, list(responses)))
+                context.close()
+            browser.close()
+    finally:
+        server.shutdown()
+
+    def size(requests):
+        return sum(request.sizes()['responseBodySize'] for request in requests)
+
+    fcp = statistics.median(timing['fcp'] or 0 for timing, _, _ in runs)
+    dcl = statistics.median(timing['dcl'] for timing, _, _ in runs)
+    _, at_load, after = runs[-1]
+    print(f"  first-contentful-paint   {fcp:8.1f} ms  (median {repeat}x, Chromium headless)")
+    print(f"  DOMContentLoaded         {dcl:8.1f} ms")
+    print(f"  saat load                {len(at_load)} request, {size(at_load) / 1024:.1f} KB")
+    print(f"  setelah buka #lampiran   {len(after)} request, {size(after) / 1024:.1f} KB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", default="27-34", help="halaman foto, mis. 27-34")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--no-browser", action="store_true", help="lewati pengukuran headless")
+    args = parser.parse_args()
+
+    pages = parse_pages(args.pages)
+    tmp_dir = Path(tempfile.mkdtemp(prefix="bench-html-"))
+    try:
+        pdf_path = write_pdf(tmp_dir / "synthetic.pdf", max(40, max(pages)), pages)
+        student = dict(DEFAULT_STUDENT, pdf=str(pdf_path), halaman_foto=pages)
+        root = tmp_dir / "PKL_Complete_Package"
+        build_package(student, root, incremental=False, log=_quiet)
+        photo_names = sorted(p.relative_to(root).as_posix() for p in (root / "images").glob("foto_*.jpg"))
+        thumb_names = sorted(p.relative_to(root).as_posix() for p in (root / "images" / "thumbs").iterdir())
+
+        print(f"Paket: {len(photo_names)} foto, {len(thumb_names)} thumbnail")
+        static_report(root, student, photo_names, thumb_names, args.repeat)
+        if not args.no_browser:
+            browser_report(root, args.repeat)
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark memori STEP 1: RSS puncak ekstraksi untuk PDF 8 s/d 200 halaman.
+
+    python -m benchmarks.bench_memory
+    python -m benchmarks.bench_memory --pages 8 50 100 200 400 --modes embedded batch
+
+Setiap ukuran dibuat PDF sintetis yang semua halamannya berisi foto
+(1240x1753, seukuran render 150 dpi), lalu extract_photos() dijalankan di
+proses Python baru. Yang diukur adalah kenaikan RSS puncak proses itu
+(VmHWM di /proc/self/status, sudah termasuk import pypdf/Pillow/pdf2image)
+di atas RSS sebelum ekstraksi, plus RSS puncak proses anak (pdftoppm) untuk
+mode render. RSS puncak yang tidak ikut naik dari 8 ke 200 halaman berarti
+tidak ada foto/bitmap yang dikumpulkan di memori.
+
+Catatan: ru_maxrss tidak dipakai untuk proses utama karena nilainya ikut
+terbawa dari proses induk lewat fork/exec. Butuh Linux (/proc). Mode selain
+``embedded`` dilewati jika pdf2image + poppler tidak terpasang.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.synthetic import write_pdf
+from pklgen.extract import EXTRACT_MODES
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_PAGES = (8, 50, 100, 200)
+# Kenaikan RSS puncak 8 -> halaman terbanyak yang masih dianggap "datar"
+FLAT_TOLERANCE_MB = 8
+
+CHILD = """
+import json, resource, sys, tempfile
+
+
+def hwm():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+
+
+pdf_path, mode, n = sys.argv[1], sys.argv[2], int(sys.argv[3])
+import pypdf, PIL.Image  # noqa: E401,F401  (biaya import bukan bagian pengukuran)
+if mode != "embedded":
+    import pdf2image  # noqa: F401
+from pklgen.extract import extract_photos
+
+before = hwm()
+with tempfile.TemporaryDirectory(prefix="bench-memory-") as out_dir:
+    extracted = extract_photos(pdf_path, list(range(1, n + 1)), out_dir, mode=mode, log=lambda msg: None)
+print(json.dumps({'photos': len(extracted), 'before': before, 'peak': hwm(),
+                  'children': resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * 1024}))
+"""
+
+
+def raster_available():
+    return importlib.util.find_spec("pdf2image") is not None and shutil.which("pdftoppm") is not None
+
+
+def measure(pdf_path, mode, n):
+    out = subprocess.run([sys.executable, "-c", CHILD, str(pdf_path), mode, str(n)], check=True,
+                         capture_output=True, text=True, env=dict(os.environ, PYTHONPATH=str(ROOT)))
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, nargs="+", default=list(DEFAULT_PAGES),
+                        help="jumlah halaman PDF (default: 8 50 100 200)")
+    parser.add_argument("--modes", nargs="+", choices=EXTRACT_MODES, default=list(EXTRACT_MODES))
+    args = parser.parse_args()
+
+    if not Path("/proc/self/status").exists():
+        parser.error("butuh /proc (Linux)")
+    modes = [mode for mode in args.modes if mode == "embedded" or raster_available()]
+    skipped = sorted(set(args.modes) - set(modes))
+    if skipped:
+        print(f"Dilewati (pdf2image/poppler tidak terpasang): {', '.join(skipped)}")
+
+    mb = 1024 * 1024
+    tmp_dir = Path(tempfile.mkdtemp(prefix="bench-memory-"))
+    try:
+        pdfs = {n: write_pdf(tmp_dir / f"p{n}.pdf", n, range(1, n + 1)) for n in args.pages}
+        print(f"{'mode':<9} {'halaman':>7} {'PDF':>9} {'RSS awal':>9} {'naik':>9} {'anak':>9}")
+        flat = True
+        for mode in modes:
+            growth = {}
+            for n in args.pages:
+                r = measure(pdfs[n], mode, n)
+                growth[n] = (r['peak'] - r['before']) / mb
+                children = f"{r['children'] / mb:6.1f} MB" if mode != "embedded" else "        -"
+                print(f"{mode:<9} {n:7d} {pdfs[n].stat().st_size / mb:6.1f} MB {r['before'] / mb:6.1f} MB "
+                      f"{growth[n]:6.1f} MB {children}  ({r['photos']} foto)")
+            spread = max(growth.values()) - min(growth.values())
+            verdict = "datar" if spread <= FLAT_TOLERANCE_MB else "TUMBUH dengan jumlah halaman"
+            flat = flat and spread <= FLAT_TOLERANCE_MB
+            print(f"  {mode}: selisih kenaikan RSS {min(args.pages)}-{max(args.pages)} halaman "
+                  f"{spread:.1f} MB → {verdict}")
+    finally:
+        shutil.rmtree(tmp_dir)
+    return 0 if flat else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark prefill teks dari PDF (pklgen.ocr): text layer, OCR, cache.
+
+    python -m benchmarks.bench_ocr
+    python -m benchmarks.bench_ocr --pages 40 --scans 8 --workers 1 2 4
+
+PDF sintetis berisi ``--pages`` halaman dengan text layer (bab, judul
+bagian, paragraf) dan ``--scans`` halaman hasil scan (gambar teks tanpa
+text layer). Dicetak:
+
+- halaman/detik text layer (pypdf, tanpa cache)
+- halaman OCR per detik per core untuk setiap jumlah worker (Tesseract;
+  dilewati jika tesseract atau pdf2image tidak terpasang)
+- waktu run ulang dengan cache teks yang sudah terisi (semua halaman
+  dari cache, tanpa pypdf extract_text maupun OCR)
+"""
+
+import argparse
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from pklgen.ocr import PageTextCache, extract_texts, find_sections, ocr_languages, ocr_rate
+
+from .synthetic import write_pdf
+
+DEFAULT_WORKERS = (1, 2, 4)
+
+SECTION_LINES = [
+    "BAB I PENDAHULUAN",
+    "1.1 Latar Belakang",
+    "Praktik Kerja Lapangan adalah kegiatan wajib bagi siswa SMK untuk",
+    "mengenal dunia kerja secara langsung di perusahaan mitra sekolah.",
+    "BAB II PROFIL PERUSAHAAN",
+    "2.1 Profil Perusahaan",
+    "Bengkel sintetis melayani servis berkala, ganti oli dan perbaikan",
+    "mesin sepeda motor untuk pelanggan di kota kecil.",
+]
+
+
+def _quiet(msg):
+    pass
+
+
+def make_pdf(path, pages, scans):
+    filler = [f"Baris isi laporan nomor {i} tentang kegiatan harian di bengkel." for i in range(40)]
+    page_text = {page: filler for page in range(1, pages + 1)}
+    page_text[2] = SECTION_LINES
+    scan_pages = {pages + i: SECTION_LINES + filler[:20] for i in range(1, scans + 1)}
+    write_pdf(path, pages + scans, (), text_lines=0, page_text=page_text, scan_pages=scan_pages)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=40, help="halaman dengan text layer (default: 40)")
+    parser.add_argument("--scans", type=int, default=8, help="halaman hasil scan (default: 8)")
+    parser.add_argument("--workers", type=int, nargs="+", default=list(DEFAULT_WORKERS),
+                        help="jumlah worker OCR (default: 1 2 4)")
+    args = parser.parse_args()
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix="bench-ocr-"))
+    try:
+        pdf = tmp_dir / "laporan.pdf"
+        make_pdf(pdf, args.pages, args.scans)
+        print(f"{args.pages} halaman text layer + {args.scans} halaman scan, "
+              f"{pdf.stat().st_size / 1024:.0f} KB")
+
+        texts, stats = extract_texts(pdf, workers=1, log=_quiet)
+        print(f"text layer : {stats['text_layer'] / stats['text_seconds']:8.1f} halaman/detik "
+              f"({stats['text_seconds']:.3f} s), bagian: {', '.join(find_sections(texts)) or '-'}")
+
+        if ocr_languages() is None:
+            print("OCR dilewati: tesseract tidak terpasang")
+        else:
+            for workers in args.workers:
+                _, stats = extract_texts(pdf, workers=workers, log=_quiet)
+                rate = ocr_rate(stats)
+                if rate is None:
+                    print("OCR dilewati: pdf2image tidak terpasang")
+                    break
+                print(f"OCR {workers:2d} wkr : {stats['ocr'] / stats['ocr_seconds']:8.2f} halaman/detik, "
+                      f"{rate:.2f} halaman/detik/core")
+
+        cache = PageTextCache(tmp_dir / "cache")
+        _, first = extract_texts(pdf, workers=max(args.workers), cache=cache, log=_quiet)
+        start = time.perf_counter()
+        _, again = extract_texts(pdf, workers=max(args.workers), cache=cache, log=_quiet)
+        cached = time.perf_counter() - start
+        print(f"cache      : run ulang {cached:.3f} s, {again['cached']}/{again['pages']} halaman dari cache "
+              f"(run pertama {first['text_seconds'] + first['ocr_seconds']:.3f} s)")
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
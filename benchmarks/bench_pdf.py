@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark STEP 2B: dokumen per menit ekspor docx -> PDF per ukuran pool.
+
+    python -m benchmarks.bench_pdf
+    python -m benchmarks.bench_pdf --sizes 1 2 4 --docs 32 --modes uno cli
+
+Laporan_PKL_*.docx dibuat dari siswa sintetis (render_report() dengan
+--photos foto seukuran thumbnail), lalu dikonversi oleh
+pklgen.pdfexport.ConverterPool berukuran 1, 2, 4 dan 8. Dokumen dikirim
+dari thread sebanyak ukuran pool (seperti worker batch yang mengantri ke
+converter). Dicetak waktu start pool (sekali per batch) dan dokumen/menit
+setelahnya:
+
+- uno: soffice hidup terus, dokumen dikirim lewat socket lokal (butuh
+  modul uno, paket python3-uno)
+- cli: ``soffice --convert-to pdf`` per dokumen dengan profil per converter
+  yang sudah hangat (tanpa UNO)
+
+Throughput berhenti naik di sekitar jumlah core; soffice mengonversi satu
+dokumen di satu thread. Butuh LibreOffice; tanpa soffice benchmark
+dilewati.
+"""
+
+import argparse
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pklgen.pdfexport import ConverterPool, find_soffice, uno_available
+from pklgen.report_template import render_report
+
+from .synthetic import make_photo_jpeg, make_students
+
+DEFAULT_SIZES = (1, 2, 4, 8)
+
+
+def _quiet(msg):
+    pass
+
+
+def make_documents(n, photos):
+    jpegs = [make_photo_jpeg(800, 600, seed=i)[0] for i in range(photos)]
+    return [render_report(student, jpegs, log=_quiet) for student in make_students(n)]
+
+
+def bench_pool(size, mode, docs):
+    start = time.perf_counter()
+    with ConverterPool(size, use_uno=mode == "uno") as pool:
+        startup = time.perf_counter() - start
+        times = []
+
+        def convert(data):
+            t0 = time.perf_counter()
+            pdf = pool.exporter.convert(data)
+            times.append(time.perf_counter() - t0)
+            return len(pdf)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=size) as threads:
+            sizes = list(threads.map(convert, docs))
+        elapsed = time.perf_counter() - start
+    return {'startup': startup, 'elapsed': elapsed, 'per_doc': statistics.median(times),
+            'pdf_bytes': sum(sizes)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="ukuran pool (default: 1 2 4 8)")
+    parser.add_argument("--docs", type=int, default=16, help="jumlah dokumen per ukuran pool (default: 16)")
+    parser.add_argument("--photos", type=int, default=8, help="foto Lampiran per dokumen (default: 8)")
+    parser.add_argument("--modes", nargs="+", choices=("uno", "cli"), default=["uno", "cli"])
+    args = parser.parse_args()
+
+    if find_soffice() is None:
+        print("LibreOffice (soffice) tidak ditemukan: benchmark dilewati")
+        return 0
+    modes = [mode for mode in args.modes if mode != "uno" or uno_available()]
+    if "uno" in args.modes and "uno" not in modes:
+        print("Dilewati (modul uno tidak terpasang): uno")
+
+    docs = make_documents(args.docs, args.photos)
+    print(f"{len(docs)} dokumen, rata-rata {sum(map(len, docs)) / len(docs) / 1024:.0f} KB, "
+          f"{os.cpu_count()} CPU")
+    print(f"{'mode':<5} {'pool':>4} {'start':>8} {'per dok':>8} {'total':>8} {'dok/menit':>10}")
+    for mode in modes:
+        for size in args.sizes:
+            r = bench_pool(size, mode, docs)
+            print(f"{mode:<5} {size:4d} {r['startup']:7.2f}s {r['per_doc']:7.2f}s {r['elapsed']:7.2f}s "
+                  f"{len(docs) / r['elapsed'] * 60:10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
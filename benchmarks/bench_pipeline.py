@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark build_package(): waktu total dibandingkan jalur kritis DAG step.
+
+    python -m benchmarks.bench_pipeline
+    python -m benchmarks.bench_pipeline --extract-mode batch --pages 27-34 --repeat 5
+
+Per run (rebuild penuh, incremental=False) dicetak:
+- total: waktu dinding build_package()
+- jumlah step: jumlah waktu semua step = waktu jika step berjalan berurutan
+- jalur kritis: extract + images + docx + zip (rantai terpanjang di DAG);
+  README, index.html dan file pendukung seharusnya tidak menambah total
+
+Tanpa --pdf, dibuat PDF sintetis 40 halaman dengan foto JPEG tertanam di
+halaman 27-34. Mode selain ``embedded`` butuh pdf2image + poppler.
+"""
+
+import argparse
+import shutil
+import statistics
+import tempfile
+from pathlib import Path
+
+from benchmarks.bench_extract import parse_pages
+from benchmarks.synthetic import write_pdf
+from pklgen.content import DEFAULT_STUDENT
+from pklgen.extract import EXTRACT_MODES
+from pklgen.pipeline import STEPS, build_package
+
+CRITICAL_PATH = ('extract', 'images', 'docx', 'zip')
+
+
+def _quiet(msg):
+    pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pdf", help="PDF sumber (default: PDF sintetis)")
+    parser.add_argument("--pages", default="27-34", help="halaman, mis. 27-34 atau 3,7,27-34")
+    parser.add_argument("--extract-mode", choices=EXTRACT_MODES, default="embedded")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pages = parse_pages(args.pages)
+    tmp_dir = Path(tempfile.mkdtemp(prefix="bench-pipeline-"))
+    try:
+        pdf_path = args.pdf or write_pdf(tmp_dir / "synthetic.pdf", max(40, max(pages)), pages)
+        student = dict(DEFAULT_STUDENT, pdf=str(pdf_path), halaman_foto=pages)
+        runs = []
+        for i in range(args.repeat + 1):
+            result = build_package(student, tmp_dir / f"run{i}" / "PKL_Complete_Package",
+                                   extract_mode=args.extract_mode, incremental=False, log=_quiet)
+            # Run pertama = pemanasan (import, kompilasi template docx)
+            if i:
+                runs.append(result)
+
+        print(f"PDF: {pdf_path}  halaman: {len(pages)}  mode: {args.extract_mode}  repeat: {args.repeat}")
+        for name in STEPS:
+            print(f"  {name:<8} {statistics.median(r['timings'][name] for r in runs) * 1000:8.1f} ms")
+        total = statistics.median(r['elapsed'] for r in runs)
+        serial = statistics.median(sum(r['timings'].values()) for r in runs)
+        critical = statistics.median(sum(r['timings'][name] for name in CRITICAL_PATH) for r in runs)
+        extract = statistics.median(r['timings']['extract'] for r in runs)
+        print(f"  total          {total * 1000:8.1f} ms")
+        print(f"  jumlah step    {serial * 1000:8.1f} ms  (berurutan)")
+        print(f"  jalur kritis   {critical * 1000:8.1f} ms  ({' + '.join(CRITICAL_PATH)})")
+        print(f"  total / extract: {total / extract:.2f}x")
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark indeks pencarian angkatan (pklgen.search): waktu build dan ukuran.
+
+    python -m benchmarks.bench_search
+    python -m benchmarks.bench_search --sizes 500 5000 --query "ganti oli"
+
+Per ukuran roster sintetis, write_cohort_site() dijalankan dua kali (build
+pertama, lalu build ulang tanpa perubahan yang tidak menulis apa pun) dan
+dicetak ukuran indeks total, shard terbesar, serta byte yang diunduh
+browser untuk satu pencarian (meta.json + docs.json + shard per kata).
+"""
+
+import argparse
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from pklgen.search import SEARCH_DIR, SHARD_PREFIX, tokenize, write_cohort_site
+
+from .synthetic import make_students
+
+DEFAULT_SIZES = (50, 500, 5000)
+
+
+def query_bytes(search_dir, query):
+    names = {"meta.json", "docs.json"} | {f"{word[:SHARD_PREFIX]}.json" for word in tokenize(query)}
+    return sum((search_dir / name).stat().st_size for name in names if (search_dir / name).exists())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="jumlah siswa (default: 50 500 5000)")
+    parser.add_argument("--query", default="mengganti kampas rem", help="pencarian contoh untuk ukuran unduhan")
+    args = parser.parse_args()
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix="bench-search-"))
+    try:
+        print(f"{'siswa':>6} {'build':>8} {'ulang':>8} {'kata':>7} {'shard':>6} {'total':>9} "
+              f"{'terbesar':>9} {'1 cari':>9}")
+        for n in args.sizes:
+            students = make_students(n)
+            entries = [(student, f"{i}/index.html") for i, student in enumerate(students)]
+            root = tmp_dir / str(n)
+            site = write_cohort_site(root, entries)
+            start = time.perf_counter()
+            again = write_cohort_site(root, entries)
+            rebuild = time.perf_counter() - start
+            assert again['written'] == 0
+            print(f"{n:6d} {site['seconds']:7.2f}s {rebuild:7.2f}s {site['terms']:7d} {site['shards']:6d} "
+                  f"{site['bytes'] / 1024:6.0f} KB {site['shard_bytes_max'] / 1024:6.1f} KB "
+                  f"{query_bytes(root / SEARCH_DIR, args.query) / 1024:6.1f} KB")
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark waktu start generate_all_pkl.py: import, --help dan --dry-run.
+
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --repeat 20
+
+Setiap perintah dijalankan sebagai proses Python baru (median dari
+--repeat kali). Kolom "tanpa interpreter" = waktu dikurangi ``python -c
+pass``, yaitu biaya script itu sendiri. Juga dicek bahwa dependensi berat
+tidak ikut terimpor oleh import/--dry-run.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPT = ROOT / "generate_all_pkl.py"
+
+# Modul yang hanya boleh dimuat saat step-nya benar-benar jalan
+HEAVY_MODULES = ('docx', 'lxml', 'PIL', 'pdf2image', 'pypdf', 'multiprocessing', 'concurrent.futures.process')
+
+CHECK_HEAVY = f"""
+import sys
+sys.argv = ['generate_all_pkl.py'] + sys.argv[1:]
+import generate_all_pkl
+{{}}
+print('HEAVY:' + ','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))
+"""
+
+
+def run_ms(cmd, cwd, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=cwd, check=True, stdout=subprocess.DEVNULL)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def heavy_loaded(code, cwd, args=()):
+    out = subprocess.run([sys.executable, "-c", code, *args], cwd=cwd, check=True,
+                         capture_output=True, text=True, env=dict(os.environ, PYTHONPATH=str(ROOT)))
+    return out.stdout.rsplit('HEAVY:', 1)[1].strip()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output = str(Path(tmp) / "PKL_Complete_Package")
+        commands = {
+            "python -c pass": [sys.executable, "-c", "pass"],
+            "import generate_all_pkl": [sys.executable, "-c", f"import sys; sys.path.insert(0, {str(ROOT)!r}); "
+                                                              "import generate_all_pkl"],
+            "--help": [sys.executable, str(SCRIPT), "--help"],
+            "--dry-run": [sys.executable, str(SCRIPT), "--dry-run", "--output", output],
+        }
+        # Pemanasan: tulis __pycache__
+        for cmd in commands.values():
+            subprocess.run(cmd, cwd=tmp, check=True, stdout=subprocess.DEVNULL)
+
+        baseline = None
+        print(f"{'perintah':<26} {'median':>9} {'tanpa interpreter':>18}")
+        for label, cmd in commands.items():
+            ms = run_ms(cmd, tmp, args.repeat)
+            if baseline is None:
+                baseline = ms
+            print(f"  {label:<24} {ms:7.1f} ms {ms - baseline:15.1f} ms")
+
+        print()
+        after_import = heavy_loaded(CHECK_HEAVY.format(""), tmp)
+        after_dry_run = heavy_loaded(CHECK_HEAVY.format("generate_all_pkl.main(sys.argv[1:])"), tmp,
+                                     ("--dry-run", "--output", output))
+        print(f"  modul berat setelah import   : {after_import or '-'}")
+        print(f"  modul berat setelah --dry-run: {after_dry_run or '-'}")
+        print(f"  folder output dibuat oleh --dry-run: {'ya' if Path(output).exists() else 'tidak'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark --watch: waktu dari edit file sampai browser dimuat ulang.
+
+    python -m benchmarks.bench_watch
+    python -m benchmarks.bench_watch --edits 20
+
+Salinan pklgen/ dan generate_all_pkl.py di folder sementara dijalankan
+dengan ``--watch --port 0`` atas PDF sintetis. Benchmark berlaku sebagai
+browser: berlangganan event reload (Server-Sent Events), lalu
+berulang kali mengedit visi di content.py (edit teks) dan warna di
+site.py (edit template). Per edit dicatat waktu sampai event reload
+untuk index.html diterima dan sampai index.html baru selesai diunduh
+(isinya dicek memuat teks hasil edit). Targetnya di bawah 200 ms.
+"""
+
+import argparse
+import queue
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+from .synthetic import write_pdf
+
+ROOT = Path(__file__).resolve().parent.parent
+TARGET_MS = 200
+
+
+def _events(url, received):
+    with urllib.request.urlopen(url + "__livereload") as stream:
+        for line in stream:
+            if line.startswith(b"data: "):
+                received.put((time.perf_counter(), line[6:].decode("utf-8")))
+
+
+def _edit(path, pattern, replacement):
+    text = path.read_text(encoding="utf-8")
+    new_text, count = re.subn(pattern, replacement, text, count=1)
+    assert count == 1, pattern
+    path.write_text(new_text, encoding="utf-8")
+
+
+def measure(url, received, edit, expect, timeout=10):
+    """Jalankan ``edit()``; mengembalikan (ms sampai event reload, ms sampai index.html baru terunduh)."""
+    start = time.perf_counter()
+    edit()
+    while True:
+        at, names = received.get(timeout=timeout)
+        if "index.html" in names:
+            break
+    with urllib.request.urlopen(url) as response:
+        page = response.read().decode("utf-8")
+    loaded = time.perf_counter()
+    assert expect in page, expect
+    return (at - start) * 1000, (loaded - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--edits", type=int, default=10, help="jumlah edit per jenis (default: 10)")
+    args = parser.parse_args()
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix="bench-watch-"))
+    proc = None
+    try:
+        shutil.copytree(ROOT / "pklgen", tmp_dir / "pklgen", ignore=shutil.ignore_patterns("__pycache__"))
+        shutil.copy(ROOT / "generate_all_pkl.py", tmp_dir)
+        pdf = tmp_dir / "laporan.pdf"
+        write_pdf(pdf, 12, range(5, 9))
+        proc = subprocess.Popen(
+            [sys.executable, "-u", "generate_all_pkl.py", "--pdf", str(pdf), "--output", "out/PKL_Complete_Package",
+             "--cache-dir", str(tmp_dir / "cache"), "--watch", "--port", "0"],
+            cwd=tmp_dir, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        url = None
+        for line in proc.stdout:
+            found = re.search(r"live reload di (\S+)", line)
+            if found:
+                url = found.group(1)
+                break
+        if url is None:
+            print("--watch tidak jalan:")
+            print(proc.communicate()[0])
+            return 1
+        threading.Thread(target=lambda: [None for _ in proc.stdout], daemon=True).start()
+
+        received = queue.Queue()
+        threading.Thread(target=_events, args=(url, received), daemon=True).start()
+        time.sleep(0.2)
+
+        content = tmp_dir / "pklgen" / "content.py"
+        site = tmp_dir / "pklgen" / "site.py"
+        rows = []
+        for i in range(args.edits):
+            text = f"Visi edit nomor {i}"
+            rows.append(("teks (content.py)", measure(
+                url, received, lambda: _edit(content, r"('visi': ')[^']*'", rf"\g<1>{text}.'"), text)))
+            color = f"#{i:06x}"
+            rows.append(("template (site.py)", measure(
+                url, received, lambda: _edit(site, r"(min-height: 100vh;)[^\n]*", rf"\g<1> color: {color};"), color)))
+
+        print(f"{'edit':<20} {'reload min':>10} {'median':>8} {'maks':>8}   {'halaman baru':>12} {'maks':>8}")
+        for kind in dict.fromkeys(kind for kind, _ in rows):
+            events = [ms[0] for k, ms in rows if k == kind]
+            loads = [ms[1] for k, ms in rows if k == kind]
+            print(f"{kind:<20} {min(events):8.0f} ms {statistics.median(events):5.0f} ms {max(events):5.0f} ms"
+                  f"   {statistics.median(loads):9.0f} ms {max(loads):5.0f} ms")
+        worst = max(ms[1] for _, ms in rows)
+        print(f"{'✅' if worst < TARGET_MS else '⚠️'} maks {worst:.0f} ms (target < {TARGET_MS} ms)")
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+        shutil.rmtree(tmp_dir)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
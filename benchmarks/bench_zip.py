@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Benchmark STEP 6: shutil.make_archive setelah semua file ditulis (cara
+lama) dibandingkan PackageZip yang diisi sambil artefak dibuat.
+
+    python -m benchmarks.bench_zip
+    python -m benchmarks.bench_zip --photos 40 --repeat 5
+
+Paket sintetis: N foto JPEG, satu .docx (sudah ZIP, jadi tidak
+terkompresi lagi) dan file teks (README, index.html, file pendukung).
+I/O diukur dari /proc/self/io (Linux): ``rchar``/``wchar`` = byte yang
+dibaca/ditulis lewat syscall, ``read_bytes``/``write_bytes`` = yang
+benar-benar sampai ke block device.
+"""
+
+import argparse
+import io
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import make_photo_jpeg
+from pklgen.content import DEFAULT_STUDENT, docx_filename
+from pklgen.packager import PackageZip
+from pklgen.site import render_html, render_readme, support_files
+
+IO_FIELDS = ('rchar', 'wchar', 'read_bytes', 'write_bytes')
+
+
+def read_io():
+    try:
+        with open('/proc/self/io') as f:
+            stats = dict(line.split(': ') for line in f.read().splitlines())
+    except OSError:
+        return None
+    return {key: int(stats[key]) for key in IO_FIELDS}
+
+
+def make_artifacts(n_photos):
+    """{arcname: bytes} menyerupai satu paket PKL."""
+    artifacts = {}
+    for i in range(1, n_photos + 1):
+        artifacts[f"images/foto_{i}.jpg"] = make_photo_jpeg(seed=i)[0]
+    try:
+        from pklgen.report import build_report
+
+        buf = io.BytesIO()
+        build_report(DEFAULT_STUDENT, log=lambda msg: None).save(buf)
+        artifacts[docx_filename(DEFAULT_STUDENT)] = buf.getvalue()
+    except ImportError:
+        artifacts["Laporan.docx"] = os.urandom(40 * 1024)
+    artifacts["README.md"] = render_readme(DEFAULT_STUDENT).encode("utf-8")
+    artifacts["index.html"] = render_html(DEFAULT_STUDENT).encode("utf-8")
+    for name, text in support_files(DEFAULT_STUDENT).items():
+        artifacts[name] = text.encode("utf-8")
+    return artifacts
+
+
+def write_tree(package_dir, artifacts):
+    for name, data in artifacts.items():
+        path = package_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+
+def run_make_archive(package_dir, artifacts):
+    write_tree(package_dir, artifacts)
+    zip_path = shutil.make_archive(str(package_dir), 'zip', package_dir.parent, package_dir.name)
+    return Path(zip_path)
+
+
+def run_streaming(package_dir, artifacts):
+    zip_path = package_dir.parent / f"{package_dir.name}.zip"
+    with PackageZip(zip_path) as packer:
+        for name, data in artifacts.items():
+            path = package_dir / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+            packer.add_bytes(name, data)
+    return zip_path
+
+
+def bench(method, artifacts, repeat):
+    best = None
+    for _ in range(repeat):
+        work_dir = Path(tempfile.mkdtemp(prefix="bench-zip-"))
+        try:
+            package_dir = work_dir / "PKL_Complete_Package"
+            package_dir.mkdir()
+            io_before = read_io()
+            start = time.perf_counter()
+            zip_path = method(package_dir, artifacts)
+            # fsync supaya write_bytes mencerminkan data yang benar-benar ke disk
+            with open(zip_path, 'rb') as f:
+                os.fsync(f.fileno())
+            elapsed = time.perf_counter() - start
+            io_after = read_io()
+            size = zip_path.stat().st_size
+        finally:
+            shutil.rmtree(work_dir)
+        io_delta = {key: io_after[key] - io_before[key] for key in IO_FIELDS} if io_before else None
+        if best is None or elapsed < best[0]:
+            best = (elapsed, size, io_delta)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--photos", type=int, default=8, help="jumlah foto di paket (default: 8)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    artifacts = make_artifacts(args.photos)
+    total = sum(len(data) for data in artifacts.values())
+    print(f"Paket sintetis: {len(artifacts)} file, {total / 1024:.0f} KB  repeat: {args.repeat}")
+    results = {}
+    for label, method in (("make_archive", run_make_archive), ("streaming", run_streaming)):
+        elapsed, size, io_delta = bench(method, artifacts, args.repeat)
+        results[label] = elapsed
+        line = f"  {label:<12} {elapsed * 1000:8.1f} ms  zip {size / 1024:8.0f} KB"
+        if io_delta:
+            line += "".join(f"  {key} {io_delta[key] / 1024:7.0f} KB" for key in IO_FIELDS)
+        print(line)
+    print(f"  speedup streaming vs make_archive: {results['make_archive'] / results['streaming']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
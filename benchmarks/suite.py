@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Suite benchmark generator: PDF sintetis + roster sintetis 1, 50 dan 500 siswa.
+
+    python -m benchmarks.suite
+    python -m benchmarks.suite --sizes 1 50 --jobs 4 --output hasil_bench.json
+    python -m benchmarks.suite --sizes 50 --compare hasil_bench_lama.json
+
+Per ukuran roster, seluruh batch dibangun dari nol (pklgen.batch.run_batch,
+incremental=False) lalu sekali lagi tanpa perubahan (rebuild inkremental).
+Waktu per stage diambil dari laporan run setiap paket (pklgen.metrics):
+
+- extraction: STEP 1 (foto dari PDF)
+- images: STEP 1B (thumbnail galeri/Lampiran)
+- docx: STEP 2
+- html_readme: STEP 3-5 (README.md, index.html, file pendukung)
+- zip: STEP 6
+
+Seperempat siswa memakai PDF dengan foto di halaman awal (3-5, 9) dan
+deteksi otomatis (``halaman_foto = auto``); nama foto semua paket dicek
+foto_1..N (``photo_names_ok``).
+
+Hasil ditulis ke JSON (beserta commit git, versi Python dan jumlah CPU)
+supaya bisa dibandingkan antar commit dengan --compare. Semua input dibuat
+di folder sementara; tidak butuh jaringan, poppler atau LibreOffice (foto
+adalah JPEG tertanam, mode ekstraksi ``embedded``).
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import make_students, write_pdf, write_roster
+from pklgen.batch import run_batch
+from pklgen.content import AUTO_PAGES, load_roster
+
+DEFAULT_SIZES = (1, 50, 500)
+PDF_PAGES = 40
+PHOTO_PAGES = tuple(range(27, 35))
+# Foto yang dideteksi jauh sebelum halaman 27 (nama foto bukan nomor halaman)
+EARLY_PHOTO_PAGES = (3, 4, 5, 9)
+# Setiap siswa ke-sekian memakai PDF EARLY_PHOTO_PAGES + deteksi otomatis
+EARLY_EVERY = 4
+
+STAGES = {
+    'extraction': ('extract',),
+    'images': ('images',),
+    'docx': ('docx',),
+    'html_readme': ('readme', 'html', 'support'),
+    'zip': ('zip',),
+}
+
+
+def _quiet(msg):
+    pass
+
+
+def git_commit():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                check=True, cwd=Path(__file__).resolve().parent).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True,
+                               text=True, check=True, cwd=Path(__file__).resolve().parent).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit + ("-dirty" if dirty else "")
+
+
+def photo_names_ok(results):
+    """True jika foto setiap paket bernama foto_1..N sesuai urutan halamannya."""
+    for r in results:
+        if 'error' in r:
+            continue
+        names = [page['photo'] for page in r['metrics']['pages']]
+        if names != [f"foto_{i}.jpg" for i in range(1, len(names) + 1)]:
+            return False
+    return True
+
+
+def summarize(results, elapsed):
+    ok = [r for r in results if 'error' not in r]
+    steps = {}
+    for name in ('extract', 'images', 'docx', 'readme', 'html', 'support', 'zip'):
+        metrics = [r['metrics']['steps'][name] for r in ok if name in r['metrics']['steps']]
+        if not metrics:
+            continue
+        steps[name] = {
+            'wall_total': sum(m['wall'] for m in metrics),
+            'wall_median': statistics.median(m['wall'] for m in metrics),
+            'cpu_total': sum(m['cpu'] for m in metrics),
+            'peak_rss_max': max(m['peak_rss'] or 0 for m in metrics),
+            'bytes_total': sum(m['bytes_written'] for m in metrics),
+        }
+    stages = {stage: sum(steps[name]['wall_total'] for name in names if name in steps)
+              for stage, names in STAGES.items()}
+    return {
+        'students': len(results),
+        'failed': len(results) - len(ok),
+        'batch_seconds': elapsed,
+        'students_per_second': len(results) / elapsed if elapsed else None,
+        'student_seconds_median': statistics.median(r['seconds'] for r in ok) if ok else None,
+        'zip_bytes_total': sum(r.get('zip_size', 0) for r in ok),
+        'photo_names_ok': photo_names_ok(results),
+        'stages': stages,
+        'steps': steps,
+    }
+
+
+def bench_size(n, pdfs, early_pdf, work_dir, jobs):
+    students = make_students(n, pdfs, PHOTO_PAGES)
+    for student in students[EARLY_EVERY - 1::EARLY_EVERY]:
+        student.update(pdf=str(early_pdf), halaman_foto=AUTO_PAGES)
+    roster_path = write_roster(work_dir / f"roster_{n}.jsonl", students)
+    start = time.perf_counter()
+    students = load_roster(roster_path)
+    load_seconds = time.perf_counter() - start
+
+    output_root = work_dir / f"out_{n}"
+    results, elapsed = run_batch(students, output_root, jobs=min(jobs, n), incremental=False, log=_quiet)
+    summary = summarize(results, elapsed)
+    summary['roster_load_seconds'] = load_seconds
+    # Rebuild tanpa perubahan: semua step (termasuk ZIP) harus dilewati
+    _, summary['noop_rebuild_seconds'] = run_batch(students, output_root, jobs=min(jobs, n),
+                                                   incremental=True, log=_quiet)
+    shutil.rmtree(output_root)
+    return summary
+
+
+def print_summary(n, summary):
+    print(f"  {n} siswa: {summary['batch_seconds']:.2f} s "
+          f"({summary['students_per_second']:.2f} siswa/detik, gagal {summary['failed']}), "
+          f"rebuild tanpa perubahan {summary['noop_rebuild_seconds']:.2f} s")
+    if not summary['photo_names_ok']:
+        print("     ⚠️ nama foto tidak berurutan foto_1..N")
+    for stage, seconds in summary['stages'].items():
+        print(f"     {stage:<12} {seconds:8.2f} s total  {seconds * 1000 / n:8.1f} ms/siswa")
+
+
+def compare(old, new):
+    print(f"Perbandingan {old['meta'].get('commit')} → {new['meta'].get('commit')}:")
+    for size, summary in new['sizes'].items():
+        before = old['sizes'].get(size)
+        if before is None:
+            continue
+        rows = [('batch', before['batch_seconds'], summary['batch_seconds']),
+                ('rebuild', before.get('noop_rebuild_seconds'), summary.get('noop_rebuild_seconds'))]
+        rows += [(stage, before['stages'].get(stage), seconds) for stage, seconds in summary['stages'].items()]
+        print(f"  {size} siswa:")
+        for label, a, b in rows:
+            if a and b is not None:
+                print(f"     {label:<12} {a:8.2f} s → {b:8.2f} s  ({(b - a) / a * 100:+6.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="ukuran roster (default: 1 50 500)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="worker batch (default: jumlah CPU)")
+    parser.add_argument("--pdfs", type=int, default=4,
+                        help="jumlah PDF sintetis berbeda yang dipakai bergiliran (default: 4)")
+    parser.add_argument("--output", default="bench_results.json", help="file hasil JSON")
+    parser.add_argument("--compare", help="hasil JSON sebelumnya untuk dibandingkan")
+    args = parser.parse_args()
+
+    work_dir = Path(tempfile.mkdtemp(prefix="bench-suite-"))
+    try:
+        start = time.perf_counter()
+        pdfs = [write_pdf(work_dir / f"laporan_{i}.pdf", PDF_PAGES, PHOTO_PAGES) for i in range(args.pdfs)]
+        early_pdf = write_pdf(work_dir / "laporan_awal.pdf", 12, EARLY_PHOTO_PAGES)
+        print(f"{args.pdfs} PDF sintetis ({PDF_PAGES} halaman, foto di {PHOTO_PAGES[0]}-{PHOTO_PAGES[-1]}) "
+              f"dalam {time.perf_counter() - start:.1f} s, {args.jobs} worker")
+
+        results = {
+            'meta': {
+                'commit': git_commit(),
+                'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'cpu_count': os.cpu_count(),
+                'jobs': args.jobs,
+                'pdfs': args.pdfs,
+                'pdf_pages': PDF_PAGES,
+                'photo_pages': list(PHOTO_PAGES),
+                'early_photo_pages': list(EARLY_PHOTO_PAGES),
+            },
+            'sizes': {},
+        }
+        for n in args.sizes:
+            summary = bench_size(n, pdfs, early_pdf, work_dir, args.jobs)
+            results['sizes'][str(n)] = summary
+            print_summary(n, summary)
+    finally:
+        shutil.rmtree(work_dir)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=1)
+    print(f"Hasil: {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(json.load(f), results)
+
+
+if __name__ == "__main__":
+    main()
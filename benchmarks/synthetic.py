@@ -0,0 +1,165 @@
+"""
+Pembuat PDF dan roster sintetis untuk benchmark.
+
+PDF ditulis manual (tanpa reportlab) supaya bisa dijalankan offline: halaman
+teks biasa berisi satu baris teks, halaman foto berisi satu gambar JPEG
+(DCTDecode) seukuran hampir satu halaman A4. Siswa sintetis dibuat dari
+DEFAULT_STUDENT dengan nama/NIS/teks berbeda supaya tidak ada cache yang
+bisa "curang".
+"""
+
+import io
+import json
+import random
+
+from pklgen.content import DEFAULT_STUDENT
+
+A4_WIDTH, A4_HEIGHT = 595, 842
+
+
+def make_photo_jpeg(width=1240, height=1753, seed=0, quality=85):
+    """JPEG gradien + noise supaya ukurannya mirip foto asli."""
+    from PIL import Image, ImageDraw
+
+    rng = random.Random(seed)
+    img = Image.linear_gradient('L').resize((width, height)).convert('RGB')
+    draw = ImageDraw.Draw(img)
+    for _ in range(400):
+        x, y = rng.randrange(width), rng.randrange(height)
+        r = rng.randrange(10, 80)
+        color = (rng.randrange(256), rng.randrange(256), rng.randrange(256))
+        draw.ellipse((x, y, x + r, y + r), fill=color)
+    buf = io.BytesIO()
+    img.save(buf, 'JPEG', quality=quality)
+    return buf.getvalue(), width, height
+
+
+def make_scan_jpeg(lines, width=1240, height=1753, quality=75):
+    """JPEG halaman hasil scan: baris teks hitam di kertas putih, tanpa text layer."""
+    from PIL import Image, ImageDraw, ImageFont
+
+    img = Image.new('L', (width, height), 255)
+    draw = ImageDraw.Draw(img)
+    try:
+        font = ImageFont.load_default(size=28)
+    except TypeError:  # Pillow < 10.1
+        font = ImageFont.load_default()
+    for i, line in enumerate(lines):
+        draw.text((120, 150 + i * 45), line, fill=0, font=font)
+    buf = io.BytesIO()
+    img.save(buf, 'JPEG', quality=quality)
+    return buf.getvalue(), width, height
+
+
+def _pdf_string(text):
+    return "(" + text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") + ")"
+
+
+def write_pdf(path, n_pages, photo_pages, photo_size=(1240, 1753), logo_pages=(), text_lines=1,
+              page_text=None, scan_pages=None):
+    """Tulis PDF ``n_pages`` halaman; halaman di ``photo_pages`` berisi foto.
+
+    Halaman di ``logo_pages`` juga berisi logo kecil (gambar 300x300 seukuran
+    2x2 cm, satu objek dipakai bersama) dan setiap halaman berisi
+    ``text_lines`` baris teks, untuk menguji deteksi halaman foto.
+    ``page_text`` = {halaman: [baris, ...]} ditulis sebagai text layer;
+    ``scan_pages`` = {halaman: [baris, ...]} menjadi gambar seperti hasil
+    scan (tanpa text layer), untuk menguji OCR.
+    """
+    photo_pages, logo_pages = set(photo_pages), set(logo_pages)
+    page_text, scan_pages = page_text or {}, scan_pages or {}
+    objects = []
+
+    def add(body):
+        objects.append(body)
+        return len(objects)
+
+    def add_jpeg(data, w, h):
+        return add(
+            f"<< /Type /XObject /Subtype /Image /Width {w} /Height {h} "
+            f"/ColorSpace /DeviceRGB /BitsPerComponent 8 /Filter /DCTDecode "
+            f"/Length {len(data)} >>\nstream\n".encode() + data + b"\nendstream"
+        )
+
+    font_id = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    pages_id = add(None)  # diisi setelah semua halaman dibuat
+    logo_id = add_jpeg(*make_photo_jpeg(300, 300, seed=0)) if logo_pages else None
+    page_ids = []
+
+    for page_num in range(1, n_pages + 1):
+        resources = f"/Font << /F1 {font_id} 0 R >>"
+        ops = f"BT /F1 12 Tf 72 800 Td (Halaman {page_num}) Tj ET\n"
+        for line in range(1, text_lines):
+            ops += (f"BT /F1 11 Tf 1 0 0 1 72 {790 - line * 14 % 700} Tm "
+                    f"[(Kegiatan) -250 (PKL) 12.5 (baris) -333 ({line})] TJ ET\n")
+        for i, line in enumerate(page_text.get(page_num, ())):
+            ops += f"BT /F1 11 Tf 72 {770 - i * 14} Td {_pdf_string(line)} Tj ET\n"
+        xobjects = []
+        if page_num in scan_pages:
+            scan_id = add_jpeg(*make_scan_jpeg(scan_pages[page_num]))
+            xobjects.append(f"/Scan {scan_id} 0 R")
+            ops += f"q {A4_WIDTH} 0 0 {A4_HEIGHT} 0 0 cm /Scan Do Q\n"
+        if page_num in photo_pages:
+            img_id = add_jpeg(*make_photo_jpeg(*photo_size, seed=page_num))
+            xobjects.append(f"/Im1 {img_id} 0 R")
+            ops += "q 500 0 0 700 47 60 cm /Im1 Do Q\n"
+        if page_num in logo_pages:
+            xobjects.append(f"/Logo {logo_id} 0 R")
+            ops += "q 57 0 0 57 500 770 cm /Logo Do Q\n"
+        if xobjects:
+            resources += f" /XObject << {' '.join(xobjects)} >>"
+        content = ops.encode()
+        content_id = add(
+            f"<< /Length {len(content)} >>\nstream\n".encode() + content + b"\nendstream"
+        )
+        page_ids.append(add(
+            f"<< /Type /Page /Parent {pages_id} 0 R /MediaBox [0 0 {A4_WIDTH} {A4_HEIGHT}] "
+            f"/Resources << {resources} >> /Contents {content_id} 0 R >>".encode()
+        ))
+
+    kids = " ".join(f"{pid} 0 R" for pid in page_ids)
+    objects[pages_id - 1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode()
+    catalog_id = add(f"<< /Type /Catalog /Pages {pages_id} 0 R >>".encode())
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(f"{num} 0 obj\n".encode() + body + b"\nendobj\n")
+    xref = out.tell()
+    out.write(f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode())
+    for off in offsets:
+        out.write(f"{off:010d} 00000 n \n".encode())
+    out.write(f"trailer\n<< /Size {len(objects) + 1} /Root {catalog_id} 0 R >>\n"
+              f"startxref\n{xref}\n%%EOF\n".encode())
+
+    with open(path, "wb") as f:
+        f.write(out.getvalue())
+    return path
+
+
+def make_students(n, pdfs=None, pages=None):
+    """``n`` siswa sintetis; siswa ke-i memakai PDF ``pdfs[i % len(pdfs)]``."""
+    students = []
+    for i in range(n):
+        student = dict(
+            DEFAULT_STUDENT,
+            nama=f"Siswa Contoh {i}",
+            nis=f"{i:010d}",
+            kegiatan=[f"{text} (minggu {i % 12 + 1})" for text in DEFAULT_STUDENT['kegiatan']],
+        )
+        if pdfs:
+            student['pdf'] = str(pdfs[i % len(pdfs)])
+        if pages is not None:
+            student['halaman_foto'] = list(pages)
+        students.append(student)
+    return students
+
+
+def write_roster(path, students):
+    """Tulis roster JSONL (format yang dibaca pklgen.content.load_roster)."""
+    with open(path, "w", encoding="utf-8") as f:
+        for student in students:
+            f.write(json.dumps(student, ensure_ascii=False) + "\n")
+    return path
@@ -9,13 +9,30 @@ Script lengkap untuk generate SEMUA file PKL sekaligus:
 
 Author: Claude
 Untuk: Kelvin - SMK Negeri 1 Sumarorong
+
+    python generate_all_pkl.py
+    python generate_all_pkl.py --dry-run          # hanya tampilkan rencana output
+    python generate_all_pkl.py --pdf laporan.pdf --pages 27 28 29 --force
+    python generate_all_pkl.py --pdf laporan.pdf --pages auto   # deteksi halaman foto
+    python generate_all_pkl.py --export-pdf       # + Laporan_PKL_*.pdf (LibreOffice)
+    python generate_all_pkl.py --prefill          # isi teks laporan dari PDF (text layer/OCR)
+    python generate_all_pkl.py --watch            # rebuild saat konten diubah + live reload
+
+Untuk satu kelas sekaligus (roster CSV/JSON/JSONL), pakai:
+    python -m pklgen.batch roster.csv --output hasil_pkl
 """
 
-import os
-import shutil
+import argparse
 from pathlib import Path
 
-print("""
+# Hanya modul ringan di sini: pipeline (python-docx, Pillow, pdf2image, pypdf,
+# process pool) diimpor di main() saat benar-benar membangun paket, supaya
+# --help dan --dry-run tetap cepat dan script ini bisa diimpor sebagai library
+from pklgen.cache import DEFAULT_CACHE_DIR
+from pklgen.content import AUTO_PAGES, DEFAULT_STUDENT, docx_filename
+from pklgen.extract import EXTRACT_MODES
+
+BANNER = """
 ╔══════════════════════════════════════════════════════════════╗
 ║                                                              ║
 ║        🚀 ALL-IN-ONE PKL GENERATOR                          ║
@@ -23,860 +40,270 @@ print("""
 ║        By: Kelvin - SMK Negeri 1 Sumarorong                ║
 ║                                                              ║
 ╚══════════════════════════════════════════════════════════════╝
-""")
-
-# ============================================================================
-# KONFIGURASI
-# ============================================================================
-
-OUTPUT_DIR = Path("PKL_Complete_Package")
-PDF_SOURCE = "/mnt/user-data/uploads/Salin1-Kelpin_Mandela__1___2___2__5.pdf"
-
-print("📁 Membuat folder output...")
-OUTPUT_DIR.mkdir(exist_ok=True)
-print(f"   ✓ Folder: {OUTPUT_DIR}/")
-print()
-
-# ============================================================================
-# STEP 1: EKSTRAK FOTO DARI PDF
-# ============================================================================
-
-print("=" * 70)
-print("STEP 1: EKSTRAK FOTO DARI PDF")
-print("=" * 70)
-
-images_dir = OUTPUT_DIR / "images"
-images_dir.mkdir(exist_ok=True)
-
-try:
-    from pdf2image import convert_from_path
-    
-    print("📸 Mengekstrak foto dari PDF...")
-    
-    # Halaman dengan foto kegiatan (27-34 dari PDF)
-    pages_with_photos = [27, 28, 29, 30, 31, 32, 33, 34]
-    
-    for page_num in pages_with_photos:
-        try:
-            images = convert_from_path(PDF_SOURCE, first_page=page_num, last_page=page_num, dpi=150)
-            if images:
-                img_path = images_dir / f"foto_{page_num-26}.jpg"
-                images[0].save(img_path, 'JPEG')
-                print(f"   ✓ Extracted foto_{page_num-26}.jpg")
-        except Exception as e:
-            print(f"   ⚠️ Skip page {page_num}: {str(e)[:50]}")
-    
-    print("   ✅ Ekstraksi foto selesai!")
-    
-except ImportError:
-    print("   ⚠️ pdf2image not installed, creating placeholder images...")
-    # Buat placeholder jika library tidak ada
-    for i in range(1, 9):
-        placeholder = images_dir / f"foto_{i}.jpg"
-        placeholder.touch()
-        print(f"   ✓ Created placeholder foto_{i}.jpg")
-
-print()
-
-# ============================================================================
-# STEP 2: BUAT DOKUMEN WORD LENGKAP
-# ============================================================================
-
-print("=" * 70)
-print("STEP 2: BUAT LAPORAN WORD LENGKAP")
-print("=" * 70)
-
-try:
-    from docx import Document
-    from docx.shared import Pt, RGBColor
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-    
-    print("📄 Membuat dokumen Word...")
-    
-    doc = Document()
-    
-    # Helper functions
-    def add_heading_centered(text, size=14, bold=True):
-        p = doc.add_paragraph()
-        p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        run = p.add_run(text)
-        run.bold = bold
-        run.font.size = Pt(size)
-        run.font.name = 'Arial'
-        return p
-    
-    def add_text(text, size=12, bold=False, align='left'):
-        p = doc.add_paragraph()
-        if align == 'center':
-            p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        elif align == 'right':
-            p.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        elif align == 'justify':
-            p.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-        
-        run = p.add_run(text)
-        run.font.size = Pt(size)
-        run.font.name = 'Arial'
-        if bold:
-            run.bold = True
-        return p
-    
-    # HALAMAN SAMPUL
-    print("   → Membuat halaman sampul...")
-    add_heading_centered('LAPORAN', 16)
-    add_heading_centered('PRAKTIK KERJA LAPANGAN', 16)
-    doc.add_paragraph()
-    add_heading_centered('DI', 14)
-    p = add_heading_centered('CV SINAR ALAM MOTOR', 16)
-    p.runs[0].font.color.rgb = RGBColor(46, 117, 182)
-    
-    doc.add_paragraph('\n')
-    add_heading_centered('Disusun Oleh:', 12)
-    add_heading_centered('KELVIN', 14)
-    add_text('NIS: 0071518396', 12, align='center')
-    add_text('Kelas XII - Teknik Sepeda Motor', 12, align='center')
-    
-    doc.add_paragraph('\n')
-    add_heading_centered('UPTD SMK NEGERI 1 SUMARORONG', 13)
-    add_text('DINAS PENDIDIKAN DAN KEBUDAYAAN DAERAH', 11, align='center')
-    add_text('PROVINSI SULAWESI BARAT', 11, align='center')
-    add_heading_centered('TAHUN 2025', 12)
-    
-    # LEMBAR PENGESAHAN
-    print("   → Membuat lembar pengesahan...")
-    doc.add_page_break()
-    add_heading_centered('LEMBAR PENGESAHAN', 14)
-    doc.add_paragraph()
-    
-    add_text('Laporan Praktik Kerja Lapangan (PKL) ini disusun sebagai salah satu syarat untuk memenuhi kegiatan pembelajaran di SMK Negeri 1 Sumarorong. Laporan ini telah disetujui dan disahkan pada:', 12, align='justify')
-    doc.add_paragraph()
-    
-    add_text('Hari/Tanggal : ____________________', 12)
-    add_text('Tempat       : Sumarorong', 12)
-    doc.add_paragraph()
-    
-    # Tabel Pengesahan
-    table = doc.add_table(rows=2, cols=2)
-    table.style = 'Table Grid'
-    
-    cells_text = [
-        'Mengetahui,\nPembimbing Industri\n\n\n\nMuhammad Sapei\nMekanik Senior',
-        'Menyetujui,\nPembimbing Sekolah\n\n\n\nBenyamin Batau\', S.Pd.\nGuru Pembimbing PKL',
-        'Pimpinan Perusahaan\n\n\n\nAlvian Howend\nDirektur CV Sinar Alam Motor',
-        'Kepala Sekolah\n\n\n\nArnoldus, S.Pd., M.Pd.\nNIP: __________________'
-    ]
-    
-    for i, text in enumerate(cells_text):
-        row = i // 2
-        col = i % 2
-        cell = table.rows[row].cells[col]
-        p = cell.paragraphs[0]
-        p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        run = p.add_run(text)
-        run.font.size = Pt(11)
-    
-    # BIODATA
-    print("   → Membuat biodata...")
-    doc.add_page_break()
-    add_heading_centered('BIODATA PESERTA PKL', 14)
-    doc.add_paragraph()
-    
-    biodata = [
-        ('Nama', 'Kelvin'),
-        ('NIS', '0071518396'),
-        ('Tempat, Tanggal Lahir', 'Malabo, 07 Oktober 2008'),
-        ('Jenis Kelamin', 'Laki-laki'),
-        ('Alamat', 'Sumarorong, Sulawesi Barat'),
-        ('No. Telepon', '081243468547'),
-        ('Program Keahlian', 'Teknik Sepeda Motor'),
-        ('Nama Orang Tua', 'Ayah: Demmaroa\nIbu: Suryani'),
-        ('Tempat PKL', 'CV Sinar Alam Motor (Bengkel Resmi Yamaha)'),
-        ('Periode PKL', '2025-2026 (3 Bulan)')
-    ]
-    
-    table = doc.add_table(rows=len(biodata), cols=2)
-    table.style = 'Table Grid'
-    
-    for i, (label, value) in enumerate(biodata):
-        cell = table.rows[i].cells[0]
-        run = cell.paragraphs[0].add_run(label)
-        run.bold = True
-        run.font.size = Pt(11)
-        
-        cell = table.rows[i].cells[1]
-        run = cell.paragraphs[0].add_run(value)
-        run.font.size = Pt(11)
-    
-    # MOTTO & KATA PENGANTAR
-    print("   → Membuat motto dan kata pengantar...")
-    doc.add_page_break()
-    add_heading_centered('MOTTO', 14)
-    doc.add_paragraph()
-    
-    p = add_text('"Semua jatuh bangun mu hal yang biasa,', 12, align='center')
-    p.runs[0].italic = True
-    p = add_text('mimpi dan harapanmu biarkan waktu yang menjawabnya.', 12, align='center')
-    p.runs[0].italic = True
-    p = add_text('Bersedihlah secukupnya rayakan perasaanmu sebagai manusia"', 12, align='center')
-    p.runs[0].italic = True
-    doc.add_paragraph()
-    p = add_text('- Baskara Putra (Hindia)', 11, align='center')
-    p.runs[0].italic = True
-    
-    # BAB I - PENDAHULUAN
-    print("   → Membuat BAB I...")
-    doc.add_page_break()
-    add_heading_centered('BAB I', 14)
-    add_heading_centered('PENDAHULUAN', 14)
-    doc.add_paragraph()
-    
-    add_text('A. Latar Belakang', 12, bold=True)
-    add_text('Praktik Kerja Lapangan (PKL) merupakan salah satu bentuk kegiatan pembelajaran yang diwajibkan bagi siswa SMK sebagai bagian integral dari proses pendidikan vokasi. Melalui PKL di CV Sinar Alam Motor, siswa dapat mengasah keterampilan teknis dalam perawatan dan perbaikan sepeda motor modern.', 12, align='justify')
-    
-    doc.add_paragraph()
-    add_text('B. Tujuan', 12, bold=True)
-    tujuan = [
-        'Memberikan pengalaman kerja langsung sesuai bidang keahlian',
-        'Melatih kedisiplinan dan tanggung jawab',
-        'Menambah wawasan mengenai lingkungan kerja profesional',
-        'Mengembangkan soft skills dan hard skills'
-    ]
-    for text in tujuan:
-        doc.add_paragraph(f'• {text}').runs[0].font.size = Pt(12)
-    
-    # BAB II - GAMBARAN UMUM
-    print("   → Membuat BAB II...")
-    doc.add_page_break()
-    add_heading_centered('BAB II', 14)
-    add_heading_centered('GAMBARAN UMUM INDUSTRI', 14)
-    doc.add_paragraph()
-    
-    add_text('A. Profil CV Sinar Alam Motor', 12, bold=True)
-    add_text('CV Sinar Alam Motor merupakan bengkel resmi Yamaha yang bergerak di bidang jasa perawatan, perbaikan, dan penjualan suku cadang sepeda motor Yamaha di Sumarorong, Sulawesi Barat.', 12, align='justify')
-    
-    doc.add_paragraph()
-    add_text('B. Visi dan Misi', 12, bold=True)
-    add_text('Visi: Menjadi pusat reparasi motor terpercaya dengan pelayanan berkualitas tinggi.', 11, align='justify')
-    
-    doc.add_paragraph()
-    add_text('C. Analisis SWOT', 12, bold=True)
-    add_text('Strengths: Status resmi Yamaha, mekanik bersertifikat, peralatan modern', 11)
-    add_text('Weaknesses: Kapasitas terbatas, waiting time peak season', 11)
-    add_text('Opportunities: Market growth, digitalisasi layanan', 11)
-    add_text('Threats: Kompetisi non-resmi, fluktuasi harga', 11)
-    
-    # BAB III - PELAKSANAAN
-    print("   → Membuat BAB III...")
-    doc.add_page_break()
-    add_heading_centered('BAB III', 14)
-    add_heading_centered('PELAKSANAAN PKL', 14)
-    doc.add_paragraph()
-    
-    add_text('A. Kegiatan yang Dilakukan', 12, bold=True)
-    kegiatan = [
-        'Mengganti oli mesin dan filter',
-        'Mengganti kampas rem depan dan belakang',
-        'Membersihkan CVT (Continuously Variable Transmission)',
-        'Diagnostik dengan Yamaha Diagnostic Tool',
-        'Perbaikan sistem kelistrikan',
-        'Delivery spare parts ke bengkel lain'
-    ]
-    for text in kegiatan:
-        doc.add_paragraph(f'• {text}').runs[0].font.size = Pt(11)
-    
-    doc.add_paragraph()
-    add_text('B. Kompetensi yang Diperoleh', 12, bold=True)
-    add_text('Hard Skills: Engine maintenance, CVT service, electrical troubleshooting, diagnostic tools', 11)
-    add_text('Soft Skills: Komunikasi, teamwork, problem solving, adaptasi, tanggung jawab', 11)
-    
-    # BAB IV - PENUTUP
-    print("   → Membuat BAB IV...")
-    doc.add_page_break()
-    add_heading_centered('BAB IV', 14)
-    add_heading_centered('PENUTUP', 14)
-    doc.add_paragraph()
-    
-    add_text('A. Kesimpulan', 12, bold=True)
-    add_text('PKL di CV Sinar Alam Motor memberikan pengalaman berharga dalam dunia kerja profesional. Penulis memperoleh kompetensi teknis dan non-teknis yang akan sangat berguna untuk masa depan.', 12, align='justify')
-    
-    doc.add_paragraph()
-    add_text('B. Saran', 12, bold=True)
-    add_text('Untuk Siswa: Manfaatkan PKL sebaik-baiknya untuk belajar', 11)
-    add_text('Untuk Sekolah: Tingkatkan kerja sama dengan industri', 11)
-    add_text('Untuk Industri: Terus berikan bimbingan optimal', 11)
-    
-    # Simpan dokumen
-    docx_path = OUTPUT_DIR / "Laporan_PKL_Kelvin_LENGKAP.docx"
-    doc.save(docx_path)
-    print(f"   ✅ Dokumen Word berhasil dibuat: {docx_path.name}")
-    
-except ImportError:
-    print("   ⚠️ python-docx not installed")
-    print("   Install: pip install python-docx --break-system-packages")
-
-print()
-
-# ============================================================================
-# STEP 3: BUAT README.MD
-# ============================================================================
-
-print("=" * 70)
-print("STEP 3: BUAT README.MD")
-print("=" * 70)
-
-readme_content = """# 📘 LAPORAN PRAKTIK KERJA LAPANGAN (PKL)
-## CV SINAR ALAM MOTOR - Bengkel Resmi Yamaha
-
-<div align="center">
-
-**Oleh: KELVIN**  
-**NIS: 0071518396**  
-**Kelas XII - Teknik Sepeda Motor**
-
-**UPTD SMK Negeri 1 Sumarorong**  
-**Provinsi Sulawesi Barat**
-
-[![GitHub Pages](https://img.shields.io/badge/GitHub-Pages-blue?style=for-the-badge&logo=github)](https://github.com)
-[![Status](https://img.shields.io/badge/Status-Completed-success?style=for-the-badge)](README.md)
-
-</div>
-
----
-
-## 📋 Navigasi Cepat
-
-| [🏠 Beranda](#-beranda) | [🏢 Profil](#-profil-industri) | [📊 SWOT](#-analisis-swot) | [💼 Kegiatan](#-kegiatan) |
-|:---:|:---:|:---:|:---:|
-| [🛠️ Kompetensi](#️-kompetensi) | [📸 Dokumentasi](#-dokumentasi) | [📝 Kesimpulan](#-kesimpulan) | [📥 Download](#-download) |
-
----
-
-## 🏠 Beranda
-
-Selamat datang di dokumentasi lengkap PKL di **CV Sinar Alam Motor**, bengkel resmi Yamaha!
-
-### 📊 Statistik PKL
-
-```
-✅ Durasi: 90 hari (3 bulan)
-✅ Jam Kerja: 720 jam efektif
-✅ Motor Diservice: 180+ unit
-✅ Jenis Pekerjaan: 15+ tipe
-```
-
----
-
-## 🏢 Profil Industri
-
-### CV Sinar Alam Motor
-
-**Status:** Bengkel Resmi Yamaha  
-**Lokasi:** Sumarorong, Sulawesi Barat  
-**Direktur:** Alvian Howend
-
-#### 🎯 Visi
-> "Menjadi pusat reparasi motor terpercaya dengan pelayanan berkualitas tinggi"
-
-#### 🛠️ Layanan
-- Servis Berkala
-- Perbaikan Mesin
-- Sistem Kelistrikan
-- CVT Service
-- Spare Parts Original
-
----
-
-## 📊 Analisis SWOT
-
-### 💪 Strengths
-- ✅ Status resmi Yamaha
-- ✅ Mekanik bersertifikat
-- ✅ Peralatan modern
-- ✅ Lokasi strategis
-
-### ⚠️ Weaknesses
-- ⚠️ Kapasitas terbatas
-- ⚠️ Waiting time peak season
-- ⚠️ Belum ada online booking
-
-### 🌟 Opportunities
-- 🎯 Market growth
-- 🎯 Digitalisasi layanan
-- 🎯 Fleet management B2B
-
-### ⚡ Threats
-- ⚠️ Kompetisi non-resmi
-- ⚠️ Fluktuasi harga parts
-- ⚠️ EV disruption
-
----
-
-## 💼 Kegiatan
-
-### 🔧 Kegiatan Utama
-
-#### 1. Mengganti Oli Mesin
-- **Prosedur:** Drain → Check → Refill
-- **Tools:** Kunci ring, wadah penampung
-- **Learning:** Spesifikasi oli, proper torque
-
-#### 2. Mengganti Kampas Rem
-- **Prosedur:** Disassembly → Clean → Install
-- **Tools:** Kunci L, push-back tool
-- **Learning:** Safety, proper bleeding
-
-#### 3. Membersihkan CVT
-- **Prosedur:** Open → Inspect → Clean
-- **Tools:** Kunci T, kompresor
-- **Learning:** Component inspection
-
-#### 4. Diagnostik YDT
-- **Prosedur:** Connect → Scan → Analyze
-- **Tools:** Yamaha Diagnostic Tool
-- **Learning:** Error codes, live data
-
----
-
-## 🛠️ Kompetensi
-
-### 💻 Hard Skills
-```
-✅ Engine Maintenance        90%
-✅ CVT Service               85%
-✅ Electrical System         80%
-✅ Diagnostic Tools          75%
-✅ Brake System              90%
-```
-
-### 🎯 Soft Skills
-```
-⭐ Time Management      ⭐⭐⭐⭐⭐
-⭐ Communication        ⭐⭐⭐⭐
-⭐ Teamwork             ⭐⭐⭐⭐⭐
-⭐ Problem Solving      ⭐⭐⭐⭐
-⭐ Adaptability         ⭐⭐⭐⭐⭐
-```
-
----
-
-## 📸 Dokumentasi
-
-![Kegiatan 1](images/foto_1.jpg)
-![Kegiatan 2](images/foto_2.jpg)
-![Kegiatan 3](images/foto_3.jpg)
-![Kegiatan 4](images/foto_4.jpg)
-
-*8 foto dokumentasi lengkap tersedia di folder images/*
-
----
-
-## 📝 Kesimpulan
-
-> *"PKL di CV Sinar Alam Motor memberikan pengalaman berharga yang mengubah cara pandang saya terhadap dunia kerja profesional."*
-
-### 🌟 Key Takeaways
-- ✅ Technical excellence dalam servis motor
-- ✅ Professional development & etos kerja
-- ✅ Soft skills enhancement
-- ✅ Career readiness
-
----
-
-## 📥 Download
-
-[![Download DOCX](https://img.shields.io/badge/Download-Laporan%20Lengkap-success?style=for-the-badge)](Laporan_PKL_Kelvin_LENGKAP.docx)
-
----
-
-<div align="center">
-
-**© 2025 Kelvin - PKL SMK Negeri 1 Sumarorong**
-
-*Dibuat dengan ❤️ untuk dokumentasi PKL*
-
-</div>
 """
 
-readme_path = OUTPUT_DIR / "README.md"
-with open(readme_path, "w", encoding="utf-8") as f:
-    f.write(readme_content)
-
-print(f"   ✅ README.md berhasil dibuat!")
-print()
-
 # ============================================================================
-# STEP 4: BUAT INDEX.HTML
+# KONFIGURASI (default untuk opsi command line)
 # ============================================================================
 
-print("=" * 70)
-print("STEP 4: BUAT INDEX.HTML (PRESENTASI INTERAKTIF)")
-print("=" * 70)
-
-html_content = """<!DOCTYPE html>
-<html lang="id">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Laporan PKL - Kelvin</title>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }
-        .container { max-width: 1200px; margin: 0 auto; }
-        header {
-            background: rgba(255,255,255,0.95);
-            padding: 30px;
-            border-radius: 15px;
-            text-align: center;
-            margin-bottom: 30px;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-        }
-        h1 { color: #2c3e50; font-size: 2.5em; margin-bottom: 10px; }
-        .subtitle { color: #7f8c8d; font-size: 1.2em; }
-        .nav-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }
-        .nav-card {
-            background: white;
-            border-radius: 15px;
-            padding: 30px;
-            text-align: center;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-            text-decoration: none;
-            color: inherit;
-            display: block;
-        }
-        .nav-card:hover {
-            transform: translateY(-10px);
-            box-shadow: 0 15px 30px rgba(0,0,0,0.2);
-        }
-        .nav-card .icon { font-size: 3em; margin-bottom: 15px; }
-        .nav-card h3 { color: #2c3e50; margin-bottom: 10px; }
-        .content-section {
-            background: rgba(255,255,255,0.95);
-            border-radius: 15px;
-            padding: 40px;
-            display: none;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-        }
-        .content-section.active { display: block; animation: fadeIn 0.5s; }
-        @keyframes fadeIn {
-            from { opacity: 0; transform: translateY(20px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-        .stats-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin: 30px 0;
-        }
-        .stat-card {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 25px;
-            border-radius: 10px;
-            text-align: center;
-        }
-        .stat-card .number { font-size: 2.5em; font-weight: bold; }
-        .gallery {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 20px;
-            margin: 30px 0;
-        }
-        .gallery img {
-            width: 100%;
-            height: 250px;
-            object-fit: cover;
-            border-radius: 10px;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.2);
-            cursor: pointer;
-            transition: transform 0.3s;
-        }
-        .gallery img:hover { transform: scale(1.05); }
-        .back-btn {
-            background: #e74c3c;
-            color: white;
-            border: none;
-            padding: 10px 20px;
-            border-radius: 5px;
-            cursor: pointer;
-            margin-bottom: 20px;
-        }
-        .back-btn:hover { background: #c0392b; }
-        footer {
-            text-align: center;
-            color: white;
-            padding: 20px;
-            margin-top: 30px;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <header>
-            <h1>📘 LAPORAN PKL</h1>
-            <p class="subtitle">CV Sinar Alam Motor - Bengkel Resmi Yamaha</p>
-            <p style="margin-top: 15px; color: #7f8c8d;">
-                <strong>Kelvin</strong> • NIS: 0071518396<br>
-                SMK Negeri 1 Sumarorong
-            </p>
-        </header>
-
-        <div id="mainNav" class="nav-grid">
-            <a href="#" class="nav-card" onclick="showSection('home')">
-                <div class="icon">🏠</div>
-                <h3>Beranda</h3>
-                <p>Overview & statistik</p>
-            </a>
-            <a href="#" class="nav-card" onclick="showSection('profil')">
-                <div class="icon">🏢</div>
-                <h3>Profil</h3>
-                <p>CV Sinar Alam Motor</p>
-            </a>
-            <a href="#" class="nav-card" onclick="showSection('swot')">
-                <div class="icon">📊</div>
-                <h3>SWOT</h3>
-                <p>Analisis strategis</p>
-            </a>
-            <a href="#" class="nav-card" onclick="showSection('kegiatan')">
-                <div class="icon">💼</div>
-                <h3>Kegiatan</h3>
-                <p>Aktivitas PKL</p>
-            </a>
-            <a href="#" class="nav-card" onclick="showSection('kompetensi')">
-                <div class="icon">🛠️</div>
-                <h3>Kompetensi</h3>
-                <p>Skills acquired</p>
-            </a>
-            <a href="#" class="nav-card" onclick="showSection('dokumentasi')">
-                <div class="icon">📸</div>
-                <h3>Dokumentasi</h3>
-                <p>Galeri foto</p>
-            </a>
-            <a href="#" class="nav-card" onclick="showSection('kesimpulan')">
-                <div class="icon">📝</div>
-                <h3>Kesimpulan</h3>
-                <p>Refleksi</p>
-            </a>
-            <a href="Laporan_PKL_Kelvin_LENGKAP.docx" class="nav-card" download>
-                <div class="icon">📥</div>
-                <h3>Download</h3>
-                <p>Laporan DOCX</p>
-            </a>
-        </div>
-
-        <div id="homeSection" class="content-section active">
-            <button class="back-btn" onclick="showMain()">← Kembali</button>
-            <h2>🏠 Selamat Datang!</h2>
-            <p style="font-size: 1.1em; margin: 20px 0;">
-                Dokumentasi lengkap PKL di <strong>CV Sinar Alam Motor</strong>
-            </p>
-            <div class="stats-grid">
-                <div class="stat-card">
-                    <div class="number">90</div>
-                    <div class="label">Hari PKL</div>
-                </div>
-                <div class="stat-card">
-                    <div class="number">720</div>
-                    <div class="label">Jam Kerja</div>
-                </div>
-                <div class="stat-card">
-                    <div class="number">180+</div>
-                    <div class="label">Motor</div>
-                </div>
-                <div class="stat-card">
-                    <div class="number">15+</div>
-                    <div class="label">Jenis Kerja</div>
-                </div>
-            </div>
-        </div>
-
-        <div id="dokumentasiSection" class="content-section">
-            <button class="back-btn" onclick="showMain()">← Kembali</button>
-            <h2>📸 Dokumentasi</h2>
-            <div class="gallery">
-                <img src="images/foto_1.jpg" alt="Kegiatan 1">
-                <img src="images/foto_2.jpg" alt="Kegiatan 2">
-                <img src="images/foto_3.jpg" alt="Kegiatan 3">
-                <img src="images/foto_4.jpg" alt="Kegiatan 4">
-                <img src="images/foto_5.jpg" alt="Kegiatan 5">
-                <img src="images/foto_6.jpg" alt="Kegiatan 6">
-                <img src="images/foto_7.jpg" alt="Kegiatan 7">
-                <img src="images/foto_8.jpg" alt="Kegiatan 8">
-            </div>
-        </div>
-
-        <footer>
-            <p>© 2025 Kelvin - SMK Negeri 1 Sumarorong</p>
-            <p>Dibuat dengan ❤️ untuk PKL</p>
-        </footer>
-    </div>
-
-    <script>
-        function showSection(sectionName) {
-            document.querySelectorAll('.content-section').forEach(s => s.classList.remove('active'));
-            document.getElementById('mainNav').style.display = 'none';
-            const sections = {
-                'home': 'homeSection',
-                'dokumentasi': 'dokumentasiSection'
-            };
-            if(sections[sectionName]) {
-                document.getElementById(sections[sectionName]).classList.add('active');
-            }
-            window.scrollTo(0, 0);
-        }
-        function showMain() {
-            document.querySelectorAll('.content-section').forEach(s => s.classList.remove('active'));
-            document.getElementById('mainNav').style.display = 'grid';
-            window.scrollTo(0, 0);
-        }
-        window.onload = () => showSection('home');
-    </script>
-</body>
-</html>
-"""
-
-html_path = OUTPUT_DIR / "index.html"
-with open(html_path, "w", encoding="utf-8") as f:
-    f.write(html_content)
-
-print(f"   ✅ index.html berhasil dibuat!")
-print()
+# Data siswa (biodata, pengesahan, tujuan, kegiatan, ...) ada di
+# pklgen/content.py -> DEFAULT_STUDENT
 
-# ============================================================================
-# STEP 5: BUAT FILE PENDUKUNG
-# ============================================================================
-
-print("=" * 70)
-print("STEP 5: BUAT FILE PENDUKUNG")
-print("=" * 70)
-
-# .gitignore
-gitignore = """__pycache__/
-*.pyc
-.DS_Store
-Thumbs.db
-*.tmp
-"""
-with open(OUTPUT_DIR / ".gitignore", "w") as f:
-    f.write(gitignore)
-print("   ✅ .gitignore")
-
-# QUICKSTART.md
-quickstart = """# ⚡ Quick Start
-
-## Upload ke GitHub (5 Menit)
-
-1. Buka https://github.com/new
-2. Nama: `pkl-laporan`
-3. Public ✅
-4. Upload semua file dari folder `PKL_Complete_Package`
-5. Settings → Pages → Enable (main, root)
-6. Done! Akses di `https://username.github.io/pkl-laporan`
-
-## Tips
-- Buat QR Code untuk presentasi
-- Share link di LinkedIn
-- Add to portfolio
-"""
-with open(OUTPUT_DIR / "QUICKSTART.md", "w") as f:
-    f.write(quickstart)
-print("   ✅ QUICKSTART.md")
-
-# LICENSE
-license_text = """MIT License
-
-Copyright (c) 2025 Kelvin - SMK Negeri 1 Sumarorong
-
-Permission is hereby granted, free of charge, to any person obtaining a copy
-of this software and associated documentation files (the "Software"), to deal
-in the Software without restriction.
-"""
-with open(OUTPUT_DIR / "LICENSE", "w") as f:
-    f.write(license_text)
-print("   ✅ LICENSE")
-
-print()
-
-# ============================================================================
-# STEP 6: BUAT ZIP FILE
-# ============================================================================
-
-print("=" * 70)
-print("STEP 6: BUAT ZIP FILE")
-print("=" * 70)
-
-zip_name = "PKL_Complete_Package"
-print(f"📦 Membuat {zip_name}.zip...")
-
-shutil.make_archive(zip_name, 'zip', OUTPUT_DIR)
-
-zip_path = Path(f"{zip_name}.zip")
-if zip_path.exists():
-    size_mb = zip_path.stat().st_size / (1024 * 1024)
-    print(f"   ✅ {zip_path.name} ({size_mb:.2f} MB)")
-
-print()
-
-# ============================================================================
-# SUMMARY
-# ============================================================================
-
-print("=" * 70)
-print("✅ SELESAI! SEMUA FILE BERHASIL DIBUAT")
-print("=" * 70)
-print()
-
-print("📦 YANG SUDAH DIBUAT:")
-print()
-print("   1. ✅ Laporan_PKL_Kelvin_LENGKAP.docx (Word document)")
-print("   2. ✅ README.md (dokumentasi GitHub)")
-print("   3. ✅ index.html (presentasi interaktif)")
-print("   4. ✅ images/ (8 foto dokumentasi)")
-print("   5. ✅ QUICKSTART.md (panduan cepat)")
-print("   6. ✅ LICENSE (MIT License)")
-print("   7. ✅ .gitignore (Git ignore rules)")
-print("   8. ✅ PKL_Complete_Package.zip (semua file dalam 1 ZIP)")
-print()
-
-print("=" * 70)
-print("🚀 CARA MENGGUNAKAN:")
-print("=" * 70)
-print()
-print("OPSI 1 - Upload ZIP ke GitHub:")
-print("   1. Extract file PKL_Complete_Package.zip")
-print("   2. Buka https://github.com/new")
-print("   3. Buat repository 'pkl-laporan' (Public)")
-print("   4. Upload SEMUA file yang sudah di-extract")
-print("   5. Settings → Pages → Enable (branch: main, folder: root)")
-print("   6. Tunggu 2 menit, buka https://username.github.io/pkl-laporan")
-print()
-print("OPSI 2 - Copy Manual:")
-print("   1. Copy semua file dari folder 'PKL_Complete_Package'")
-print("   2. Upload ke GitHub repository")
-print("   3. Aktifkan GitHub Pages")
-print()
-
-print("=" * 70)
-print("📁 LOKASI FILE:")
-print("=" * 70)
-print(f"   Folder: {OUTPUT_DIR.absolute()}")
-print(f"   ZIP: {zip_path.absolute()}")
-print()
-
-print("=" * 70)
-print("🎉 SCRIPT SELESAI!")
-print("=" * 70)
-print()
-print("Lihat QUICKSTART.md untuk panduan upload ke GitHub!")
-print()
+OUTPUT_DIR = Path("PKL_Complete_Package")
+PDF_SOURCE = DEFAULT_STUDENT['pdf']
+
+# Halaman dengan foto kegiatan: AUTO_PAGES = dideteksi dari gambar besar di
+# PDF (tanpa render), atau daftar tetap, mis. [27, 28, 29, 30, 31, 32, 33, 34]
+PAGES_WITH_PHOTOS = AUTO_PAGES
+# "embedded" = salin JPEG asli dari PDF (render hanya jika tidak ada),
+# "batch" = satu proses poppler per rentang halaman, "parallel" = rentang
+# dibagi ke beberapa worker proses, "per_page" = cara lama
+EXTRACT_MODE = "embedded"
+# Jumlah worker untuk mode "parallel" (None = jumlah CPU)
+EXTRACT_WORKERS = None
+# True = step yang inputnya tidak berubah sejak run terakhir dilewati
+# (lihat PKL_Complete_Package/.pkl_manifest.json); False = bangun ulang semua
+INCREMENTAL = True
+# Cache halaman hasil render, dipakai bersama oleh semua run (None = tanpa cache)
+RENDER_CACHE_DIR = DEFAULT_CACHE_DIR
+RENDER_CACHE_MAX_MB = 1024
+# True = laporan Word juga diekspor ke PDF lewat LibreOffice headless (soffice)
+EXPORT_PDF = False
+# True = latar belakang, profil, visi dan kesimpulan yang masih default diisi
+# dari teks PDF (text layer, atau OCR Tesseract untuk halaman scan)
+PREFILL_FROM_PDF = False
+# Jumlah worker proses OCR (None = jumlah CPU)
+OCR_WORKERS = None
+# Server live reload untuk --watch
+WATCH_HOST = "127.0.0.1"
+WATCH_PORT = 8000
+
+STEP_LABELS = {
+    'extract': "STEP 1  Foto",
+    'images': "STEP 1B Thumbnail",
+    'docx': "STEP 2  Word",
+    'pdf': "STEP 2B PDF",
+    'readme': "STEP 3  README.md",
+    'html': "STEP 4  index.html",
+    'support': "STEP 5  File pendukung",
+    'zip': "STEP 6  ZIP",
+}
+
+
+def page_arg(value):
+    return AUTO_PAGES if value.lower() == AUTO_PAGES else int(value)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default=str(OUTPUT_DIR), help=f"folder paket (default: {OUTPUT_DIR})")
+    parser.add_argument("--pdf", default=PDF_SOURCE, help=f"PDF laporan sumber foto (default: {PDF_SOURCE})")
+    parser.add_argument("--pages", type=page_arg, nargs="+", default=PAGES_WITH_PHOTOS,
+                        help="halaman PDF yang berisi foto kegiatan, atau 'auto' untuk deteksi "
+                             f"otomatis (default: {PAGES_WITH_PHOTOS})")
+    parser.add_argument("--extract-mode", choices=EXTRACT_MODES, default=EXTRACT_MODE)
+    parser.add_argument("--extract-workers", type=int, default=EXTRACT_WORKERS)
+    parser.add_argument("--force", action="store_true", default=not INCREMENTAL,
+                        help="bangun ulang semua step walaupun inputnya tidak berubah")
+    parser.add_argument("--cache-dir", default=str(RENDER_CACHE_DIR),
+                        help=f"cache halaman hasil render (default: {RENDER_CACHE_DIR})")
+    parser.add_argument("--cache-size-mb", type=int, default=RENDER_CACHE_MAX_MB,
+                        help=f"batas ukuran cache render (default: {RENDER_CACHE_MAX_MB})")
+    parser.add_argument("--no-cache", action="store_true", help="jangan pakai cache render (dan cache teks --prefill)")
+    parser.add_argument("--export-pdf", action="store_true", default=EXPORT_PDF,
+                        help="ekspor laporan Word juga ke PDF (butuh LibreOffice)")
+    parser.add_argument("--prefill", action="store_true", default=PREFILL_FROM_PDF,
+                        help="isi teks laporan yang masih default dari PDF (text layer/OCR)")
+    parser.add_argument("--ocr-workers", type=int, default=OCR_WORKERS,
+                        help="jumlah worker proses OCR (default: jumlah CPU)")
+    parser.add_argument("--profile-docx", metavar="PATH",
+                        help="jalankan pembuatan docx di bawah cProfile dan simpan ke PATH (.prof)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="tampilkan file yang akan dibuat/dilewati tanpa menulis apa pun")
+    parser.add_argument("--watch", action="store_true",
+                        help="setelah build, pantau konten/template/PDF, rebuild saat berubah dan "
+                             "sajikan folder paket dengan live reload")
+    parser.add_argument("--host", default=WATCH_HOST, help=f"alamat server --watch (default: {WATCH_HOST})")
+    parser.add_argument("--port", type=int, default=WATCH_PORT, help=f"port server --watch (default: {WATCH_PORT})")
+    args = parser.parse_args(argv)
+    if args.pages != AUTO_PAGES and AUTO_PAGES in args.pages:
+        if len(args.pages) > 1:
+            parser.error("--pages auto tidak bisa digabung dengan nomor halaman")
+        args.pages = AUTO_PAGES
+    return args
+
+
+def print_plan(plan):
+    print("📋 Rencana output (--dry-run, tidak ada file yang ditulis):")
+    print()
+    for step, fresh, names in plan:
+        status = "tidak berubah, dilewati" if fresh else "akan dibuat"
+        print(f"   {STEP_LABELS[step]:<22} {status} ({len(names)} file)")
+        for name in names:
+            print(f"      {name}")
+    print()
+
+
+def print_summary(student, result, output_dir):
+    zip_path = result.get('zip', output_dir.parent / f"{output_dir.name}.zip")
+
+    print("=" * 70)
+    print("✅ SELESAI! SEMUA FILE BERHASIL DIBUAT")
+    print("=" * 70)
+    print()
+
+    print("📦 YANG SUDAH DIBUAT:")
+    print()
+    print(f"   1. ✅ {docx_filename(student)} (Word document)")
+    print("   2. ✅ README.md (dokumentasi GitHub)")
+    print("   3. ✅ index.html (presentasi interaktif)")
+    print(f"   4. ✅ images/ ({result.get('photos', 0)} foto dokumentasi)")
+    print("   5. ✅ QUICKSTART.md (panduan cepat)")
+    print("   6. ✅ LICENSE (MIT License)")
+    print("   7. ✅ .gitignore (Git ignore rules)")
+    print(f"   8. ✅ {zip_path.name} (semua file dalam 1 ZIP)")
+    if 'pdf' in result:
+        print(f"   9. ✅ {result['pdf'].name} (PDF)")
+    print()
+    if 'cache' in result:
+        print(f"   🗃️  Cache render: {result['cache']['hits']} hit, {result['cache']['misses']} miss")
+    if 'images' in result:
+        print(f"   🖼️  Galeri: {result['images']['original'] / 1024:.0f} KB → "
+              f"{result['images']['webp'] / 1024:.0f} KB (hemat {result['images']['saved'] / 1024:.0f} KB)")
+    if 'cache' in result or 'images' in result:
+        print()
+
+    print("⏱️  PER STEP (wall / CPU / RSS puncak / ditulis):")
+    for name, metrics in result['metrics']['steps'].items():
+        rss = f"{metrics['peak_rss'] / (1024 * 1024):6.1f} MB" if metrics['peak_rss'] else "     - MB"
+        print(f"   {STEP_LABELS[name]:<22} {metrics['wall']:6.2f} s  {metrics['cpu']:6.2f} s  {rss}  "
+              f"{metrics['bytes_written'] / 1024:8.0f} KB{'  (dilewati)' if metrics['skipped'] else ''}")
+    print(f"   Total: {result['elapsed']:.2f} s")
+    if 'report' in result:
+        print(f"   📊 Laporan run: {result['report']}")
+    if 'profile' in result:
+        print(f"   🔬 Profil docx: {result['profile']} (python -m pstats {result['profile']})")
+    print()
+
+    print("=" * 70)
+    print("🚀 CARA MENGGUNAKAN:")
+    print("=" * 70)
+    print()
+    print("OPSI 1 - Upload ZIP ke GitHub:")
+    print(f"   1. Extract file {zip_path.name}")
+    print("   2. Buka https://github.com/new")
+    print("   3. Buat repository 'pkl-laporan' (Public)")
+    print("   4. Upload SEMUA file yang sudah di-extract")
+    print("   5. Settings → Pages → Enable (branch: main, folder: root)")
+    print("   6. Tunggu 2 menit, buka https://username.github.io/pkl-laporan")
+    print()
+    print("OPSI 2 - Copy Manual:")
+    print(f"   1. Copy semua file dari folder '{output_dir.name}'")
+    print("   2. Upload ke GitHub repository")
+    print("   3. Aktifkan GitHub Pages")
+    print()
+
+    print("=" * 70)
+    print("📁 LOKASI FILE:")
+    print("=" * 70)
+    print(f"   Folder: {output_dir.absolute()}")
+    print(f"   ZIP: {zip_path.absolute()}")
+    print()
+
+    print("=" * 70)
+    print("🎉 SCRIPT SELESAI!")
+    print("=" * 70)
+    print()
+    print("Lihat QUICKSTART.md untuk panduan upload ke GitHub!")
+    print()
+
+
+def _quiet(msg):
+    pass
+
+
+def make_student(args, log=print):
+    """Data siswa dari DEFAULT_STUDENT + opsi command line (+ teks --prefill)."""
+    # Dibaca dari modulnya setiap kali: --watch me-reload pklgen.content
+    from pklgen import content
+
+    student = dict(content.DEFAULT_STUDENT, pdf=args.pdf, halaman_foto=args.pages)
+    if args.prefill:
+        from pklgen.ocr import PageTextCache, prefill_student, prefill_summary
+
+        text_cache = None if args.no_cache else PageTextCache()
+        try:
+            student, filled, ocr_stats = prefill_student(student, workers=args.ocr_workers, cache=text_cache,
+                                                         log=log)
+        except ImportError:
+            log("⚠️ pypdf tidak terpasang (prefill dilewati, teks laporan bawaan dipakai)")
+            log("   Install: pip install pypdf --break-system-packages")
+        else:
+            log(prefill_summary(filled, ocr_stats))
+        log("")
+    return student
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    output_dir = Path(args.output)
+    # Sebelum --dry-run juga: teks hasil prefill ikut menentukan apakah docx berubah
+    student = make_student(args)
+
+    if args.dry_run:
+        from pklgen.pipeline import plan_package
+
+        print_plan(plan_package(student, output_dir, extract_mode=args.extract_mode,
+                                incremental=not args.force, export_pdf=args.export_pdf))
+        return 0
+
+    print(BANNER)
+    print("📁 Membuat folder output...")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    print(f"   ✓ Folder: {output_dir}/")
+    print()
+
+    # ========================================================================
+    # STEP 1-6: EKSTRAK FOTO, WORD, README, INDEX.HTML, FILE PENDUKUNG, ZIP
+    # ========================================================================
+
+    from pklgen import pipeline
+    from pklgen.cache import RenderCache
+    from pklgen.pdfexport import ConverterPool, PdfExportError
+
+    render_cache = None if args.no_cache or not args.cache_dir else RenderCache(args.cache_dir, args.cache_size_mb * 1024 * 1024)
+    converters = None
+    if args.export_pdf:
+        try:
+            converters = ConverterPool(1)
+        except PdfExportError as e:
+            print(f"⚠️ Ekspor PDF dilewati: {e}")
+            print()
+    try:
+        result = pipeline.build_package(student, output_dir, extract_mode=args.extract_mode,
+                                        extract_workers=args.extract_workers, incremental=not args.force,
+                                        cache=render_cache, profile_docx=args.profile_docx,
+                                        pdf_export=converters and converters.exporter)
+        if args.watch:
+            from pklgen.watch import watch_package, watched_files
+
+            def rebuild(on_step):
+                # pipeline bisa sudah di-reload: build_package dicari lagi dari modulnya
+                return pipeline.build_package(make_student(args, log=_quiet), output_dir,
+                                              extract_mode=args.extract_mode,
+                                              extract_workers=args.extract_workers, cache=render_cache,
+                                              pdf_export=converters and converters.exporter,
+                                              on_step=on_step, log=_quiet)
+
+            print(f"✅ Paket dibuat dalam {result['elapsed']:.2f} s")
+            print()
+            return watch_package(rebuild, watched_files(args.pdf), output_dir, args.host, args.port)
+    finally:
+        if converters is not None:
+            converters.close()
+    print_summary(student, result, output_dir)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
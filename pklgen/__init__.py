@@ -0,0 +1,6 @@
+"""
+Modul pendukung untuk generate_all_pkl.py.
+
+Berisi bagian pipeline PKL yang bisa dipakai ulang (ekstraksi foto, dll.)
+sehingga bisa di-import dan di-benchmark tanpa menjalankan seluruh script.
+"""
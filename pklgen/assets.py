@@ -0,0 +1,224 @@
+"""
+Store aset bersama untuk output batch: file yang isinya identik disimpan sekali.
+
+Setiap paket berisi salinan .gitignore, QUICKSTART.md, LICENSE yang sama,
+dan siswa di perusahaan yang sama sering memakai foto profil perusahaan
+yang sama. Setelah batch, setiap file di folder paket di-hash (sha256) dan
+diganti hardlink ke <output>/.assets/<xx>/<sha256>, jadi isi yang sama
+hanya memakan ruang disk sekali. Folder paket tetap lengkap dan berdiri
+sendiri (bisa di-upload/di-zip apa adanya); ZIP per siswa tidak diubah.
+
+File di store dibuat read-only karena satu perubahan di tempat akan
+mengubah semua paket yang berbagi file itu. Pipeline sendiri tidak pernah
+menimpa isi file: output.write() menulis file baru lalu rename, dan
+ekstraksi foto menghapus foto lama dulu. Entri store yang tidak dipakai
+paket mana pun lagi dihapus (prune()).
+
+Foto hasil ekstraksi juga diberi hash perseptual (dHash 64 bit, di-cache
+per sha256 di .assets/phash.json): foto yang isinya berbeda tapi hampir
+sama (dikompres ulang, di-resize, sedikit dipotong) di paket siswa yang
+berbeda ditandai sebagai near-duplicate supaya bisa dicek manual.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from . import manifest as mf
+from .output import DirectoryOutput
+
+ASSET_DIR = ".assets"
+PHASH_NAME = "phash.json"
+# Foto dianggap hampir sama jika dHash-nya beda paling banyak sekian bit
+NEAR_DUP_BITS = 6
+# dHash dipecah jadi 8 pita 8 bit: dua hash yang bedanya <= 7 bit pasti
+# sama persis di salah satu pita, jadi hanya pasangan sepita yang dibandingkan
+_BANDS = 8
+PHOTO_GLOB = "images/foto_*.jpg"
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def dhash(path):
+    """Hash perseptual 64 bit: gradien horizontal gambar abu-abu 9x8."""
+    from PIL import Image
+
+    with Image.open(path) as img:
+        # JPEG didekode langsung di skala 1/8 (jauh lebih cepat dari ukuran penuh)
+        img.draft('L', (64, 64))
+        px = img.convert('L').resize((9, 8), Image.BILINEAR).tobytes()
+    bits = 0
+    for row in range(8):
+        for col in range(8):
+            bits = bits << 1 | (px[row * 9 + col] > px[row * 9 + col + 1])
+    return bits
+
+
+def near_duplicates(photos, max_bits=NEAR_DUP_BITS):
+    """Pasangan foto dari paket berbeda, beda isi, yang dHash-nya beda <= ``max_bits`` bit.
+
+    ``photos`` = [(nama, paket, sha256, dhash), ...]; mengembalikan
+    [(nama_a, nama_b, jarak_bit), ...] urut dari yang paling mirip.
+    """
+    buckets = {}
+    for i, (_, _, _, bits) in enumerate(photos):
+        for band in range(_BANDS):
+            buckets.setdefault((band, bits >> (band * 8) & 0xFF), []).append(i)
+    pairs = set()
+    for members in buckets.values():
+        for n, i in enumerate(members):
+            for j in members[n + 1:]:
+                (_, package_a, digest_a, bits_a), (_, package_b, digest_b, bits_b) = photos[i], photos[j]
+                if package_a != package_b and digest_a != digest_b and bin(bits_a ^ bits_b).count("1") <= max_bits:
+                    pairs.add((i, j))
+    return sorted(((photos[i][0], photos[j][0], bin(photos[i][3] ^ photos[j][3]).count("1")) for i, j in pairs),
+                  key=lambda pair: (pair[2], pair[0], pair[1]))
+
+
+class AssetStore:
+    """Store berbasis isi (content-addressed) di ``root``, di filesystem yang sama dengan paket."""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        # (dev, inode) entri store -> sha256: file yang sudah di-link tidak di-hash ulang
+        self._inodes = {}
+        for path in self.root.glob("*/*"):
+            st = path.stat()
+            self._inodes[(st.st_dev, st.st_ino)] = path.name
+        try:
+            with open(self.root / PHASH_NAME, encoding="utf-8") as f:
+                self._phash = json.load(f)
+        except (OSError, ValueError):
+            self._phash = {}
+
+    def _path(self, digest):
+        return self.root / digest[:2] / digest
+
+    def add(self, path):
+        """Ganti ``path`` dengan hardlink ke entri store isinya.
+
+        Mengembalikan (sha256, byte_dihemat): byte_dihemat > 0 jika file
+        ini salinan dari isi yang sudah ada di store. OSError dari os.link
+        (filesystem tanpa hardlink, beda device) diteruskan ke pemanggil.
+        """
+        st = path.stat()
+        digest = self._inodes.get((st.st_dev, st.st_ino))
+        if digest is not None:
+            return digest, 0
+        digest = _sha256(path)
+        entry = self._path(digest)
+        if not entry.exists():
+            # File ini menjadi isi store
+            entry.parent.mkdir(exist_ok=True)
+            os.link(path, entry)
+            os.chmod(entry, 0o444)
+            self._inodes[(st.st_dev, st.st_ino)] = digest
+            return digest, 0
+        tmp_path = path.with_name(path.name + ".link")
+        os.link(entry, tmp_path)
+        os.replace(tmp_path, path)
+        return digest, st.st_size
+
+    def phash(self, digest):
+        bits = self._phash.get(digest)
+        if bits is None:
+            bits = self._phash[digest] = dhash(self._path(digest))
+        return bits
+
+    def prune(self):
+        """Hapus entri yang tidak di-link paket mana pun lagi; mengembalikan jumlahnya."""
+        removed = 0
+        for path in self.root.glob("*/*"):
+            if path.stat().st_nlink == 1:
+                path.unlink()
+                self._phash.pop(path.name, None)
+                removed += 1
+        return removed
+
+    def save(self):
+        tmp_path = self.root / f"{PHASH_NAME}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._phash, f)
+        os.replace(tmp_path, self.root / PHASH_NAME)
+
+
+def _package_files(package_dir):
+    for root, _, files in os.walk(package_dir):
+        for name in files:
+            if name != mf.MANIFEST_NAME:
+                yield Path(root) / name
+
+
+def dedupe_batch(output_root, package_dirs, log=print):
+    """Link file identik di ``package_dirs`` ke store aset <output_root>/.assets.
+
+    Mengembalikan statistik: jumlah file, isi unik, ukuran logis semua file,
+    ukuran di disk setelah dedup (``stored``), byte yang dihemat run ini
+    (``saved``), pasangan foto near-duplicate (``near_duplicates``) dan foto
+    yang tidak bisa dibaca sebagai gambar sehingga tanpa dHash
+    (``unreadable``, mis. placeholder kosong saat pdf2image tidak ada).
+    """
+    store = AssetStore(Path(output_root) / ASSET_DIR)
+    stats = {'files': 0, 'unique': 0, 'bytes': 0, 'stored': 0, 'saved': 0, 'linked': 0,
+             'pruned': 0, 'near_duplicates': [], 'unreadable': []}
+    seen = set()
+    photos = []
+    phash = True
+    unreadable = set()
+    for package_dir in package_dirs:
+        package_dir = Path(package_dir)
+        output = DirectoryOutput(package_dir)
+        # Hardlink mengubah mtime file di paket; kunci ZIP di manifest
+        # diperbarui supaya rebuild inkremental berikutnya tetap no-op
+        manifest = mf.load_manifest(package_dir)
+        zip_entry = manifest['steps'].get('zip')
+        zip_was_fresh = zip_entry is not None and zip_entry['key'] == output.zip_key()
+        for path in _package_files(package_dir):
+            try:
+                digest, saved = store.add(path)
+            except OSError as e:
+                log(f"   ⚠️ Dedup aset dilewati (hardlink tidak bisa dibuat: {e})")
+                stats['error'] = str(e)
+                return stats
+            size = path.stat().st_size
+            stats['files'] += 1
+            stats['bytes'] += size
+            stats['saved'] += saved
+            stats['linked'] += saved > 0
+            if digest not in seen:
+                seen.add(digest)
+                stats['unique'] += 1
+                stats['stored'] += size
+            if phash and path.match(PHOTO_GLOB):
+                name = path.relative_to(output_root).as_posix()
+                if digest in unreadable:
+                    stats['unreadable'].append(name)
+                    continue
+                try:
+                    photos.append((name, package_dir, digest, store.phash(digest)))
+                except ImportError:
+                    log("   ⚠️ Pillow not installed, cek foto hampir sama dilewati")
+                    log("   Install: pip install Pillow --break-system-packages")
+                    phash = False
+                except OSError as e:
+                    # Termasuk PIL.UnidentifiedImageError (file kosong/rusak):
+                    # hanya foto ini yang tidak ikut dibandingkan. Placeholder
+                    # kosong semua sama isinya: dicatat sekali per isi
+                    log(f"   ⚠️ {name}: bukan gambar yang bisa dibaca, dHash dilewati ({e})")
+                    unreadable.add(digest)
+                    stats['unreadable'].append(name)
+        if zip_was_fresh:
+            mf.record(manifest, 'zip', output.zip_key(), [])
+            mf.save_manifest(package_dir, manifest)
+    stats['pruned'] = store.prune()
+    stats['near_duplicates'] = near_duplicates(photos)
+    store.save()
+    return stats
@@ -0,0 +1,356 @@
+"""
+Batch: buat paket PKL untuk seluruh roster kelas.
+
+    python -m pklgen.batch roster.csv --output hasil_pkl --jobs 4
+
+Setiap siswa mendapat folder <output>/<Nama>_<NIS>/PKL_Complete_Package/
+beserta PKL_Complete_Package.zip di sebelahnya. Template docx, README,
+index.html dan file pendukung dimuat sekali per proses dan dipakai ulang
+untuk semua siswa.
+
+Dengan --jobs > 1 pipeline tiap siswa (ekstraksi foto, docx, README/HTML,
+zip) berjalan di worker proses terpisah. --max-images membatasi jumlah
+gambar PIL hasil render yang dipegang bersamaan oleh semua worker.
+
+--pdf-workers N juga mengekspor setiap laporan Word ke PDF lewat N
+LibreOffice headless yang hidup selama batch (pklgen.pdfexport); semua
+worker mengantri ke converter yang sama.
+
+--prefill mengisi latar belakang, profil, visi dan kesimpulan yang masih
+default dari PDF setiap siswa (text layer, OCR Tesseract untuk halaman
+scan; lihat pklgen.ocr). Teks per halaman di-cache per hash halaman,
+dipakai bersama semua siswa dan run berikutnya.
+
+Setiap paket mendapat laporan run PKL_Complete_Package.run.json (waktu,
+CPU, RSS dan byte per step dan per halaman); semuanya digabung di
+<output>/batch_run.json.
+
+Di <output>/ juga dibuat halaman angkatan index.html dengan pencarian
+(nama, kegiatan, kompetensi, SWOT, ...) atas semua paket yang berhasil,
+dari indeks statis di <output>/search/ (lihat pklgen.search).
+
+File yang isinya sama di beberapa paket (.gitignore, LICENSE, foto profil
+perusahaan, ...) disimpan sekali di <output>/.assets/ dan di-hardlink ke
+setiap paket; foto yang hampir sama di paket berbeda ditandai (lihat
+pklgen.assets).
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+from .assets import dedupe_batch
+from .cache import DEFAULT_CACHE_DIR, RenderCache
+from .content import load_roster, slug
+from .extract import EXTRACT_MODES, set_image_slots
+from .metrics import write_run_report
+from .ocr import PageTextCache, ocr_rate, prefill_student
+from .pdfexport import ConverterPool, PdfExportError
+from .pipeline import build_package
+from .search import write_cohort_site
+
+PACKAGE_NAME = "PKL_Complete_Package"
+BATCH_REPORT_NAME = "batch_run.json"
+
+# Kolom waktu per step di laporan akhir
+REPORT_STEPS = ('extract', 'images', 'docx', 'pdf', 'readme', 'html', 'support', 'zip')
+
+# Exporter PDF bersama untuk worker proses (diset oleh _init_worker)
+_pdf_export = None
+
+
+def student_dir(output_root, student):
+    return Path(output_root) / f"{slug(student['nama'])}_{student['nis']}"
+
+
+def _quiet(msg):
+    pass
+
+
+def _build_student(student, package_dir, extract_mode, extract_workers, incremental, cache,
+                   pdf_export=None, prefill=False, text_cache=None, ocr_workers=None):
+    # Dijalankan di worker: error ditangkap di sini supaya batch jalan terus
+    t0 = time.perf_counter()
+    try:
+        prefilled = None
+        if prefill:
+            student, filled, ocr_stats = prefill_student(student, workers=ocr_workers, cache=text_cache,
+                                                         log=_quiet)
+            prefilled = dict(ocr_stats, filled=filled)
+        # Batas proses ekstraksi juga berlaku untuk optimasi thumbnail
+        result = build_package(student, package_dir, extract_mode=extract_mode,
+                               extract_workers=extract_workers, image_workers=extract_workers,
+                               incremental=incremental, cache=cache,
+                               pdf_export=pdf_export or _pdf_export, log=_quiet)
+        if prefilled is not None:
+            result['prefill'] = result['metrics']['prefill'] = prefilled
+    except Exception as e:
+        result = {'nama': student['nama'], 'nis': student['nis'],
+                  'error': f"{type(e).__name__}: {e}"}
+    result['seconds'] = time.perf_counter() - t0
+    return result
+
+
+def _init_worker(image_slots, pdf_export):
+    global _pdf_export
+    set_image_slots(image_slots)
+    # Antrian converter (multiprocessing.Queue) hanya bisa ikut lewat initializer
+    _pdf_export = pdf_export
+
+
+def _log_progress(log, done, total, result):
+    label = f"[{done}/{total}] {result['nama']} ({result['nis']})"
+    if 'error' in result:
+        log(f"   ⚠️ {label} gagal: {result['error'][:50]}")
+    else:
+        log(f"   ✓ {label} {result['seconds']:.2f} s")
+
+
+def run_batch(students, output_root, extract_mode="embedded", extract_workers=None,
+              jobs=1, max_images=None, incremental=True, cache=None, pdf_export=None,
+              prefill=False, text_cache=None, log=print):
+    """Bangun paket untuk setiap siswa.
+
+    ``jobs`` = jumlah worker proses (1 = berurutan di proses ini).
+    ``max_images`` = batas gambar PIL yang dipegang bersamaan (default: jobs).
+    ``incremental`` = lewati step yang inputnya tidak berubah (manifest build).
+    ``cache`` = RenderCache bersama untuk halaman yang dirender.
+    ``pdf_export`` = PdfExporter dari pklgen.pdfexport.ConverterPool: setiap
+    laporan juga diekspor ke PDF.
+    ``prefill`` = isi teks laporan yang masih default dari PDF siswa
+    (pklgen.ocr), dengan ``text_cache`` = PageTextCache bersama.
+    Mengembalikan (hasil_per_siswa, total_detik), hasil berurutan sesuai
+    roster. Kegagalan satu siswa dicatat di hasilnya dan tidak menghentikan
+    batch.
+    """
+    total = len(students)
+    results = [None] * total
+    start = time.perf_counter()
+    if prefill:
+        try:
+            import pypdf  # noqa: F401
+        except ImportError:
+            # Dicek sekali di sini: tanpa pypdf setiap siswa akan gagal di worker
+            log("⚠️ pypdf tidak terpasang (prefill dilewati, teks laporan bawaan dipakai)")
+            log("   Install: pip install pypdf --break-system-packages")
+            prefill = False
+
+    if jobs <= 1:
+        for i, student in enumerate(students):
+            results[i] = _build_student(student, student_dir(output_root, student) / PACKAGE_NAME,
+                                        extract_mode, extract_workers, incremental, cache, pdf_export,
+                                        prefill, text_cache, extract_workers)
+            _log_progress(log, i + 1, total, results[i])
+        return results, time.perf_counter() - start
+
+    # Siswa sudah diparalelkan; ekstraksi per siswa cukup satu proses
+    if extract_mode == "parallel":
+        extract_mode = "batch"
+    image_slots = multiprocessing.BoundedSemaphore(max_images or jobs)
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(image_slots, pdf_export)) as pool:
+        queue = iter(enumerate(students))
+        pending = {}
+
+        def submit_next():
+            for i, student in queue:
+                future = pool.submit(_build_student, student,
+                                     student_dir(output_root, student) / PACKAGE_NAME,
+                                     extract_mode, 1, incremental, cache, None, prefill, text_cache, 1)
+                pending[future] = i
+                return
+
+        # Antrian dibatasi 2x jumlah worker supaya roster besar tidak
+        # langsung di-pickle dan ditahan semuanya di memori
+        for _ in range(jobs * 2):
+            submit_next()
+
+        done_count = 0
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                i = pending.pop(future)
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    # Worker mati (mis. kehabisan memori)
+                    results[i] = {'nama': students[i]['nama'], 'nis': students[i]['nis'],
+                                  'error': f"{type(e).__name__}: {e}", 'seconds': 0.0}
+                done_count += 1
+                _log_progress(log, done_count, total, results[i])
+                submit_next()
+
+    return results, time.perf_counter() - start
+
+
+def cohort_entries(students, results):
+    """(student, tautan relatif ke index.html paketnya) untuk paket yang berhasil."""
+    return [(student, (student_dir("", student) / PACKAGE_NAME / "index.html").as_posix())
+            for student, result in zip(students, results) if 'error' not in result]
+
+
+def print_report(results, elapsed, log=print):
+    """Laporan agregat: waktu per step per siswa + ringkasan batch."""
+    ok = [r for r in results if 'error' not in r]
+    failed = [r for r in results if 'error' in r]
+
+    log("=" * 70)
+    log("📊 LAPORAN BATCH")
+    log("=" * 70)
+    header = f"{'No':>4}  {'Nama':<20} {'NIS':<11}" + "".join(f"{step:>8}" for step in REPORT_STEPS) + f"{'Total':>8}"
+    log(header)
+    for no, r in enumerate(results, start=1):
+        line = f"{no:>4}  {r['nama'][:20]:<20} {r['nis']:<11}"
+        if 'error' in r:
+            line += f"  GAGAL: {r['error'][:40]}"
+        else:
+            line += "".join(f"{r['timings'].get(step, 0):8.2f}" for step in REPORT_STEPS)
+            line += f"{r['seconds']:8.2f}"
+        log(line)
+    log("")
+
+    if ok:
+        per_student = sorted(r['seconds'] for r in ok)
+        log(f"   Per siswa : rata-rata {sum(per_student) / len(per_student):.2f} s, "
+            f"median {per_student[len(per_student) // 2]:.2f} s, maks {per_student[-1]:.2f} s")
+        for step in REPORT_STEPS:
+            step_metrics = [r['metrics']['steps'][step] for r in ok if step in r['metrics']['steps']]
+            wall = sum(m['wall'] for m in step_metrics)
+            cpu = sum(m['cpu'] for m in step_metrics)
+            rss = max((m['peak_rss'] or 0 for m in step_metrics), default=0)
+            log(f"   {step:<10}: {wall:8.2f} s total, CPU {cpu:8.2f} s, RSS maks {rss / (1024 * 1024):6.1f} MB")
+        zip_total = sum(r.get('zip_size', 0) for r in ok)
+        log(f"   ZIP       : {zip_total / (1024 * 1024):.2f} MB total")
+        if any('images' in r for r in ok):
+            saved = sum(r.get('images', {}).get('saved', 0) for r in ok)
+            log(f"   Galeri    : hemat {saved / (1024 * 1024):.2f} MB (thumbnail WebP vs foto asli)")
+        if any('cache' in r for r in ok):
+            hits = sum(r.get('cache', {}).get('hits', 0) for r in ok)
+            misses = sum(r.get('cache', {}).get('misses', 0) for r in ok)
+            log(f"   Cache     : {hits} hit, {misses} miss")
+        prefilled = [r['prefill'] for r in ok if 'prefill' in r]
+        if prefilled:
+            total = {key: sum(p[key] for p in prefilled)
+                     for key in ('pages', 'text_layer', 'ocr', 'ocr_cached', 'ocr_failed', 'cached', 'no_text')}
+            # Detik-core OCR semua siswa (jumlah worker OCR per siswa bisa beda)
+            total['ocr_seconds'] = sum(p['ocr_seconds'] * p['ocr_workers'] for p in prefilled)
+            total['ocr_workers'] = 1
+            rate = ocr_rate(total)
+            log(f"   Prefill   : {total['pages']} halaman ({total['text_layer']} text layer, "
+                f"{total['ocr'] + total['ocr_cached']} OCR, {total['ocr_failed']} OCR gagal, "
+                f"{total['no_text']} tanpa teks; "
+                f"{total['cached']} dari cache); "
+                f"{sum(len(p['filled']) > 0 for p in prefilled)}/{len(prefilled)} siswa terisi"
+                + (f"; OCR {rate:.2f} halaman/detik/core" if rate is not None else ""))
+    log(f"✅ {len(ok)}/{len(results)} paket berhasil")
+    for r in failed:
+        log(f"   ⚠️ {r['nama']} ({r['nis']}): {r['error']}")
+    log(f"⏱️  {elapsed:.2f} s total, {len(results) / elapsed if elapsed else 0:.2f} siswa/detik")
+    log("=" * 70)
+
+
+def print_assets(stats, log=print, limit=10):
+    """Ringkasan dedup aset (pklgen.assets.dedupe_batch)."""
+    mb = 1024 * 1024
+    saved = stats['bytes'] - stats['stored']
+    log(f"♻️  Aset bersama: {stats['files']} file, {stats['unique']} isi unik; "
+        f"{stats['bytes'] / mb:.2f} MB → {stats['stored'] / mb:.2f} MB di disk "
+        f"(hemat {saved / mb:.2f} MB, {saved / stats['bytes'] * 100 if stats['bytes'] else 0:.0f}%; "
+        f"run ini {stats['saved'] / mb:.2f} MB)")
+    if stats['unreadable']:
+        log(f"   ⚠️ {len(stats['unreadable'])} foto tidak bisa dibaca sebagai gambar (tanpa cek hampir sama)")
+    pairs = stats['near_duplicates']
+    if pairs:
+        log(f"   ⚠️ {len(pairs)} pasang foto hampir sama di paket berbeda:")
+        for a, b, bits in pairs[:limit]:
+            log(f"      {a} ≈ {b} (beda {bits} bit)")
+        if len(pairs) > limit:
+            log(f"      ... {len(pairs) - limit} lagi di {BATCH_REPORT_NAME}")
+
+
+def write_batch_report(path, results, elapsed, assets=None):
+    """Laporan JSON batch: metrik run setiap siswa (lihat pklgen.metrics) + total."""
+    write_run_report(path, {
+        'elapsed': elapsed,
+        'assets': assets,
+        'students': len(results),
+        'failed': [{'nama': r['nama'], 'nis': r['nis'], 'error': r['error']} for r in results if 'error' in r],
+        'runs': [r['metrics'] for r in results if 'metrics' in r],
+    })
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("roster", help="roster siswa (.csv, .json atau .jsonl)")
+    parser.add_argument("--output", default="hasil_pkl", help="folder output (default: hasil_pkl)")
+    parser.add_argument("--extract-mode", choices=EXTRACT_MODES, default="embedded")
+    parser.add_argument("--extract-workers", type=int, default=None)
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="jumlah siswa yang diproses bersamaan (default: jumlah CPU)")
+    parser.add_argument("--max-images", type=int, default=None,
+                        help="maks. gambar PIL hasil render di memori sekaligus (default: --jobs)")
+    parser.add_argument("--force", action="store_true",
+                        help="bangun ulang semua step walaupun inputnya tidak berubah")
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR),
+                        help=f"cache halaman hasil render (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--cache-size-mb", type=int, default=1024,
+                        help="batas ukuran cache render sebelum eviksi LRU (default: 1024)")
+    parser.add_argument("--no-cache", action="store_true", help="jangan pakai cache render (dan cache teks --prefill)")
+    parser.add_argument("--no-dedupe", action="store_true",
+                        help="jangan hardlink file identik antar paket ke <output>/.assets")
+    parser.add_argument("--no-search", action="store_true",
+                        help="jangan buat halaman angkatan + indeks pencarian di folder output")
+    parser.add_argument("--pdf-workers", type=int, default=0,
+                        help="ekspor laporan ke PDF dengan N LibreOffice headless (default: 0 = tanpa PDF)")
+    parser.add_argument("--prefill", action="store_true",
+                        help="isi teks laporan yang masih default dari PDF siswa (text layer/OCR)")
+    args = parser.parse_args(argv)
+
+    students = load_roster(args.roster)
+    cache = None if args.no_cache else RenderCache(args.cache_dir, args.cache_size_mb * 1024 * 1024)
+    print(f"📚 {len(students)} siswa dari {args.roster} ({args.jobs} worker)")
+    converters = None
+    if args.pdf_workers > 0:
+        try:
+            converters = ConverterPool(args.pdf_workers)
+            print(f"📑 {args.pdf_workers} converter PDF (LibreOffice) siap")
+        except PdfExportError as e:
+            print(f"⚠️ Ekspor PDF dilewati: {e}")
+    try:
+        results, elapsed = run_batch(students, args.output, args.extract_mode, args.extract_workers,
+                                     jobs=args.jobs, max_images=args.max_images, incremental=not args.force,
+                                     cache=cache, pdf_export=converters and converters.exporter,
+                                     prefill=args.prefill, text_cache=None if args.no_cache else PageTextCache())
+    finally:
+        if converters is not None:
+            converters.close()
+
+    print()
+    print_report(results, elapsed)
+    assets = None
+    if not args.no_dedupe:
+        package_dirs = [student_dir(args.output, student) / PACKAGE_NAME
+                        for student, result in zip(students, results) if 'error' not in result]
+        assets = dedupe_batch(args.output, package_dirs)
+        if 'error' not in assets:
+            print_assets(assets)
+    if not args.no_search and students:
+        first = students[0]
+        site = write_cohort_site(args.output, cohort_entries(students, results),
+                                 title=f"Laporan PKL {first['sekolah']} {first['tahun']}")
+        print(f"🔎 Indeks pencarian: {site['docs']} laporan, {site['terms']} kata, {site['shards']} shard "
+              f"({site['bytes'] / 1024:.0f} KB, shard terbesar {site['shard_bytes_max'] / 1024:.0f} KB) "
+              f"dalam {site['seconds']:.2f} s")
+    report_path = Path(args.output) / BATCH_REPORT_NAME
+    write_batch_report(report_path, results, elapsed, assets)
+    print(f"📁 Output: {Path(args.output).absolute()}")
+    print(f"📊 Laporan batch: {report_path}")
+    return 0 if all('error' not in r for r in results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
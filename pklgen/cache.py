@@ -0,0 +1,132 @@
+"""
+Cache render halaman PDF di disk, dialamatkan oleh isi (content-addressed).
+
+Kunci cache = (hash isi PDF, nomor halaman, dpi, format), jadi PDF yang sama
+(profil perusahaan yang dipakai banyak siswa, draf yang dikirim ulang) tidak
+dirender dua kali walaupun path atau nama filenya berbeda.
+
+Aman dipakai beberapa proses sekaligus: entri ditulis ke file sementara lalu
+di-rename secara atomik, dan eviksi LRU berdasarkan ukuran total dijalankan
+di bawah file lock.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: eviksi tetap jalan, hanya tanpa lock
+    fcntl = None
+
+DEFAULT_CACHE_DIR = Path(os.environ.get(
+    "PKL_CACHE_DIR",
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "pklgen" / "pages",
+))
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+# Setelah eviksi, ukuran cache diturunkan sampai fraksi ini dari batasnya
+EVICT_TARGET = 0.9
+
+_pdf_digests = {}
+
+
+def pdf_digest(pdf_path):
+    """sha256 isi PDF; di-cache per proses selama ukuran & mtime sama."""
+    st = os.stat(pdf_path)
+    memo_key = (os.path.abspath(pdf_path), st.st_size, st.st_mtime_ns)
+    digest = _pdf_digests.get(memo_key)
+    if digest is None:
+        h = hashlib.sha256()
+        with open(pdf_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                h.update(chunk)
+        digest = _pdf_digests[memo_key] = h.hexdigest()
+    return digest
+
+
+class RenderCache:
+    """Cache file gambar hasil render halaman PDF."""
+
+    def __init__(self, root=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self):
+        # Counter tidak ikut ke worker proses; setiap proses menghitung sendiri
+        return {"root": self.root, "max_bytes": self.max_bytes, "hits": 0, "misses": 0}
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses}
+
+    def _path(self, digest, page_num, dpi, fmt):
+        key = hashlib.sha256(f"{digest}:{page_num}:{dpi}:{fmt}".encode()).hexdigest()
+        return self.root / key[:2] / f"{key}.{fmt}"
+
+    def fetch(self, digest, page_num, dpi, fmt, dest):
+        """Salin entri cache ke ``dest``. True jika hit."""
+        path = self._path(digest, page_num, dpi, fmt)
+        try:
+            shutil.copyfile(path, dest)
+            # mtime = waktu terakhir dipakai, dasar urutan LRU
+            os.utime(path)
+        except FileNotFoundError:
+            # Belum ada, atau baru saja di-evict proses lain
+            self.misses += 1
+            return False
+        self.hits += 1
+        return True
+
+    def store(self, digest, page_num, dpi, fmt, src):
+        """Simpan salinan ``src`` ke cache secara atomik."""
+        path = self._path(digest, page_num, dpi, fmt)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as out, open(src, "rb") as f:
+                shutil.copyfileobj(f, out)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def evict(self):
+        """Hapus entri yang paling lama tidak dipakai sampai di bawah batas ukuran."""
+        if not self.root.exists():
+            return 0
+        with open(self.root / ".lock", "w") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            entries, total = [], 0
+            for path in self.root.glob("*/*"):
+                if path.name.startswith(".tmp-"):
+                    # Sisa proses yang mati di tengah penulisan
+                    try:
+                        if time.time() - path.stat().st_mtime > 3600:
+                            path.unlink()
+                    except FileNotFoundError:
+                        pass
+                    continue
+                try:
+                    st = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+                total += st.st_size
+            if total <= self.max_bytes:
+                return 0
+
+            removed = 0
+            target = self.max_bytes * EVICT_TARGET
+            for _, size, path in sorted(entries):
+                if total <= target:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+            return removed
@@ -0,0 +1,272 @@
+"""
+Data konten laporan PKL per siswa dan pembaca roster kelas.
+
+Satu siswa = satu dict. DEFAULT_STUDENT berisi data Kelvin yang sebelumnya
+ditulis langsung di generate_all_pkl.py; record dari roster menimpa kunci
+yang diberikan. Data pribadi dan teks tentang tempat PKL tidak diwarisi
+dari Kelvin: yang tidak ada di record dibuat dari kolom perusahaan/direktur
+record itu sendiri atau diisi placeholder netral (ROSTER_DEFAULTS). Roster
+bisa berupa CSV, JSON atau JSONL.
+"""
+
+import csv
+import json
+import re
+from pathlib import Path
+
+# Nilai 'halaman_foto' untuk deteksi otomatis halaman foto (pklgen.extract.detect_photo_pages)
+AUTO_PAGES = 'auto'
+
+DEFAULT_STUDENT = {
+    # Identitas
+    'nama': 'Kelvin',
+    'nis': '0071518396',
+    'kelas': 'XII',
+    'program_keahlian': 'Teknik Sepeda Motor',
+    'ttl': 'Malabo, 07 Oktober 2008',
+    'jenis_kelamin': 'Laki-laki',
+    'alamat': 'Sumarorong, Sulawesi Barat',
+    'telepon': '081243468547',
+    'orang_tua': 'Ayah: Demmaroa\nIbu: Suryani',
+
+    # Sekolah
+    'sekolah': 'SMK Negeri 1 Sumarorong',
+    'dinas': 'DINAS PENDIDIKAN DAN KEBUDAYAAN DAERAH',
+    'kota': 'Sumarorong',
+    'provinsi': 'Sulawesi Barat',
+    'tahun': '2025',
+
+    # Tempat PKL
+    'perusahaan': 'CV Sinar Alam Motor',
+    'perusahaan_keterangan': 'Bengkel Resmi Yamaha',
+    'tempat_pkl': 'CV Sinar Alam Motor (Bengkel Resmi Yamaha)',
+    'periode_pkl': '2025-2026 (3 Bulan)',
+    'direktur': 'Alvian Howend',
+
+    # Tanda tangan lembar pengesahan (urutan: kiri atas, kanan atas, kiri bawah, kanan bawah)
+    'pengesahan': [
+        'Mengetahui,\nPembimbing Industri\n\n\n\nMuhammad Sapei\nMekanik Senior',
+        'Menyetujui,\nPembimbing Sekolah\n\n\n\nBenyamin Batau\', S.Pd.\nGuru Pembimbing PKL',
+        'Pimpinan Perusahaan\n\n\n\nAlvian Howend\nDirektur CV Sinar Alam Motor',
+        'Kepala Sekolah\n\n\n\nArnoldus, S.Pd., M.Pd.\nNIP: __________________',
+    ],
+
+    'motto': [
+        '"Semua jatuh bangun mu hal yang biasa,',
+        'mimpi dan harapanmu biarkan waktu yang menjawabnya.',
+        'Bersedihlah secukupnya rayakan perasaanmu sebagai manusia"',
+    ],
+    'motto_sumber': '- Baskara Putra (Hindia)',
+
+    # BAB I
+    'latar_belakang': 'Praktik Kerja Lapangan (PKL) merupakan salah satu bentuk kegiatan pembelajaran yang diwajibkan bagi siswa SMK sebagai bagian integral dari proses pendidikan vokasi. Melalui PKL di CV Sinar Alam Motor, siswa dapat mengasah keterampilan teknis dalam perawatan dan perbaikan sepeda motor modern.',
+    'tujuan': [
+        'Memberikan pengalaman kerja langsung sesuai bidang keahlian',
+        'Melatih kedisiplinan dan tanggung jawab',
+        'Menambah wawasan mengenai lingkungan kerja profesional',
+        'Mengembangkan soft skills dan hard skills',
+    ],
+
+    # BAB II
+    'profil': 'CV Sinar Alam Motor merupakan bengkel resmi Yamaha yang bergerak di bidang jasa perawatan, perbaikan, dan penjualan suku cadang sepeda motor Yamaha di Sumarorong, Sulawesi Barat.',
+    'visi': 'Menjadi pusat reparasi motor terpercaya dengan pelayanan berkualitas tinggi.',
+    'swot': [
+        'Strengths: Status resmi Yamaha, mekanik bersertifikat, peralatan modern',
+        'Weaknesses: Kapasitas terbatas, waiting time peak season',
+        'Opportunities: Market growth, digitalisasi layanan',
+        'Threats: Kompetisi non-resmi, fluktuasi harga',
+    ],
+
+    # BAB III
+    'kegiatan': [
+        'Mengganti oli mesin dan filter',
+        'Mengganti kampas rem depan dan belakang',
+        'Membersihkan CVT (Continuously Variable Transmission)',
+        'Diagnostik dengan Yamaha Diagnostic Tool',
+        'Perbaikan sistem kelistrikan',
+        'Delivery spare parts ke bengkel lain',
+    ],
+    'kompetensi': [
+        'Hard Skills: Engine maintenance, CVT service, electrical troubleshooting, diagnostic tools',
+        'Soft Skills: Komunikasi, teamwork, problem solving, adaptasi, tanggung jawab',
+    ],
+
+    # BAB IV
+    'kesimpulan': 'PKL di CV Sinar Alam Motor memberikan pengalaman berharga dalam dunia kerja profesional. Penulis memperoleh kompetensi teknis dan non-teknis yang akan sangat berguna untuk masa depan.',
+    'saran': [
+        'Untuk Siswa: Manfaatkan PKL sebaik-baiknya untuk belajar',
+        'Untuk Sekolah: Tingkatkan kerja sama dengan industri',
+        'Untuk Industri: Terus berikan bimbingan optimal',
+    ],
+
+    # Sumber foto: halaman foto dideteksi dari PDF (atau daftar, mis. [27, ..., 34])
+    'pdf': '/mnt/user-data/uploads/Salin1-Kelpin_Mandela__1___2___2__5.pdf',
+    'halaman_foto': AUTO_PAGES,
+}
+
+# Label tabel biodata -> kunci data siswa
+BIODATA_FIELDS = [
+    ('Nama', 'nama'),
+    ('NIS', 'nis'),
+    ('Tempat, Tanggal Lahir', 'ttl'),
+    ('Jenis Kelamin', 'jenis_kelamin'),
+    ('Alamat', 'alamat'),
+    ('No. Telepon', 'telepon'),
+    ('Program Keahlian', 'program_keahlian'),
+    ('Nama Orang Tua', 'orang_tua'),
+    ('Tempat PKL', 'tempat_pkl'),
+    ('Periode PKL', 'periode_pkl'),
+]
+
+# Data pribadi tidak diwarisi dari DEFAULT_STUDENT oleh record roster
+PERSONAL_FIELDS = ('ttl', 'jenis_kelamin', 'alamat', 'telepon', 'orang_tua')
+
+# Kolom wajib setiap record roster
+REQUIRED_FIELDS = ('nama', 'nis', 'perusahaan')
+
+# Nilai record roster untuk teks tentang tempat PKL yang tidak diisi:
+# str.format dengan data siswa itu sendiri ({perusahaan}, {direktur}, ...),
+# bukan teks Kelvin dari DEFAULT_STUDENT
+ROSTER_DEFAULTS = {
+    'perusahaan_keterangan': 'Tempat PKL',
+    'tempat_pkl': '{perusahaan}',
+    'direktur': '-',
+    'pengesahan': [
+        'Mengetahui,\nPembimbing Industri\n\n\n\n____________________\n{perusahaan}',
+        'Menyetujui,\nPembimbing Sekolah\n\n\n\n____________________\nGuru Pembimbing PKL',
+        'Pimpinan Perusahaan\n\n\n\n{direktur}\nPimpinan {perusahaan}',
+        'Kepala Sekolah\n\n\n\nArnoldus, S.Pd., M.Pd.\nNIP: __________________',
+    ],
+    'latar_belakang': 'Praktik Kerja Lapangan (PKL) merupakan salah satu bentuk kegiatan pembelajaran yang diwajibkan bagi siswa SMK sebagai bagian integral dari proses pendidikan vokasi. Melalui PKL di {perusahaan}, siswa dapat mengasah keterampilan sesuai program keahlian {program_keahlian}.',
+    'profil': '{perusahaan} ({perusahaan_keterangan}) merupakan tempat pelaksanaan Praktik Kerja Lapangan penulis.',
+    'visi': '-',
+    'swot': ['Strengths: -', 'Weaknesses: -', 'Opportunities: -', 'Threats: -'],
+    'kegiatan': ['-'],
+    'kesimpulan': 'PKL di {perusahaan} memberikan pengalaman berharga dalam dunia kerja profesional. Penulis memperoleh kompetensi teknis dan non-teknis yang akan sangat berguna untuk masa depan.',
+}
+
+LIST_FIELDS = ('pengesahan', 'motto', 'tujuan', 'swot', 'kegiatan', 'kompetensi', 'saran')
+
+# Pemisah item list di kolom CSV
+CSV_LIST_SEPARATOR = '|'
+
+
+def biodata(student):
+    """Baris tabel biodata [(label, nilai), ...]."""
+    return [(label, student.get(key) or '-') for label, key in BIODATA_FIELDS]
+
+
+def slug(text):
+    return re.sub(r'[^A-Za-z0-9]+', '_', text).strip('_')
+
+
+def docx_filename(student):
+    return f"Laporan_PKL_{slug(student['nama'].title())}_LENGKAP.docx"
+
+
+def pdf_filename(student):
+    return docx_filename(student)[:-len(".docx")] + ".pdf"
+
+
+def parse_pages(spec):
+    """'27-34' atau '3,7,27-34' -> [27, ..., 34]; 'auto' tetap AUTO_PAGES."""
+    if isinstance(spec, str) and spec.strip().lower() == AUTO_PAGES:
+        return AUTO_PAGES
+    if isinstance(spec, (list, tuple)):
+        return [int(p) for p in spec]
+    pages = []
+    for part in str(spec).replace(CSV_LIST_SEPARATOR, ',').split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            first, last = part.split('-')
+            pages.extend(range(int(first), int(last) + 1))
+        else:
+            pages.append(int(part))
+    return pages
+
+
+def format_pages(pages):
+    """[27, 28, 29, 31] -> '27-29, 31' (kebalikan parse_pages untuk log)."""
+    runs = []
+    for page in sorted(set(pages)):
+        if runs and page == runs[-1][1] + 1:
+            runs[-1][1] = page
+        else:
+            runs.append([page, page])
+    return ', '.join(str(first) if first == last else f"{first}-{last}" for first, last in runs)
+
+
+def _format_default(value, student):
+    if isinstance(value, list):
+        return [item.format_map(student) for item in value]
+    return value.format_map(student)
+
+
+def roster_defaults(student):
+    """ROSTER_DEFAULTS yang sudah diisi data ``student``: {field: nilai}."""
+    # Kolom sederhana (keterangan, direktur) dulu, karena dipakai teks lain
+    values = dict(student)
+    for key, value in ROSTER_DEFAULTS.items():
+        if '{' not in str(value) and not student.get(key):
+            values[key] = value
+    return {key: _format_default(value, values) for key, value in ROSTER_DEFAULTS.items()}
+
+
+def default_fields(student):
+    """Field yang masih berisi teks bawaan (DEFAULT_STUDENT atau ROSTER_DEFAULTS)."""
+    defaults = roster_defaults(student)
+    return {
+        key for key, value in student.items()
+        if value == DEFAULT_STUDENT.get(key) or (key in defaults and value == defaults[key])
+    }
+
+
+def student_from_record(record):
+    """Gabungkan satu record roster dengan DEFAULT_STUDENT.
+
+    Data sekolah dan teks umum diwarisi; data pribadi menjadi '-' dan teks
+    tentang tempat PKL yang tidak diisi diambil dari ROSTER_DEFAULTS.
+    """
+    missing = [key for key in REQUIRED_FIELDS if not record.get(key)]
+    if missing:
+        raise ValueError(f"Record roster tanpa {', '.join(missing)}: {record!r}")
+
+    student = {key: value for key, value in DEFAULT_STUDENT.items() if key not in ROSTER_DEFAULTS}
+    for key in PERSONAL_FIELDS:
+        student[key] = '-'
+    for key, value in record.items():
+        if value is None or value == '':
+            continue
+        if key in LIST_FIELDS and isinstance(value, str):
+            value = [item.strip() for item in value.split(CSV_LIST_SEPARATOR) if item.strip()]
+        student[key] = value
+    for key, value in roster_defaults(student).items():
+        student.setdefault(key, value)
+    student['halaman_foto'] = parse_pages(student['halaman_foto'])
+    return student
+
+
+def _read_records(path):
+    path = Path(path)
+    suffix = path.suffix.lower()
+    with open(path, encoding='utf-8-sig', newline='') as f:
+        if suffix == '.csv':
+            # Data pakai "\n" di CSV ditulis sebagai literal \n
+            return [
+                {key: value.replace('\\n', '\n') if isinstance(value, str) else value
+                 for key, value in row.items()}
+                for row in csv.DictReader(f)
+            ]
+        if suffix == '.jsonl':
+            return [json.loads(line) for line in f if line.strip()]
+        if suffix == '.json':
+            data = json.load(f)
+            return data['students'] if isinstance(data, dict) else data
+    raise ValueError(f"Format roster tidak dikenal: {path.name} (pakai .csv, .json atau .jsonl)")
+
+
+def load_roster(path):
+    """Baca roster CSV/JSON/JSONL menjadi list data siswa."""
+    return [student_from_record(record) for record in _read_records(path)]
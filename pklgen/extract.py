@@ -0,0 +1,678 @@
+"""
+Ekstraksi foto kegiatan dari PDF laporan (STEP 1).
+
+Mode yang tersedia:
+- ``per_page``: satu panggilan convert_from_path per halaman (cara lama).
+- ``batch``: halaman dikelompokkan menjadi rentang berurutan, setiap rentang
+  dirender oleh satu proses poppler dan langsung ditulis ke disk.
+- ``parallel``: daftar halaman dibagi ke beberapa worker proses, masing-masing
+  menjalankan mode ``batch`` untuk bagiannya.
+- ``embedded``: stream JPEG (DCTDecode) yang tertanam di halaman disalin apa
+  adanya tanpa decode/encode ulang; hanya halaman tanpa JPEG tertanam yang
+  dirender (butuh pypdf).
+
+Memori tidak bergantung pada jumlah halaman: ``batch``/``parallel`` menyuruh
+pdftoppm menulis JPEG langsung ke file, ``per_page`` hanya memegang satu
+gambar PIL, dan ``embedded`` menulis setiap JPEG begitu dibaca (lihat
+benchmarks/bench_memory.py).
+"""
+
+import os
+import subprocess
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from .metrics import collect_pages, extend_pages, page_timer, record_page
+
+EXTRACT_MODES = ("embedded", "batch", "parallel", "per_page")
+
+# Versi skema nama foto (bagian dari kunci step ekstraksi di manifest):
+# 2 = foto_1..N menurut urutan halaman foto, lihat photo_filenames()
+# 3 = halaman yang dipilih sendiri (semua >= FIRST_PHOTO_PAGE) kembali ke nomor halaman - 26
+PHOTO_NAMING = 3
+# Halaman foto pertama laporan lama: --pages 27 30 34 -> foto_1, foto_4, foto_8
+FIRST_PHOTO_PAGE = 27
+
+# Format file hasil render (juga bagian dari kunci cache render)
+RENDER_FORMAT = "jpeg"
+# Jeda cek file halaman baru dari pdftoppm (mode batch/parallel)
+RENDER_POLL = 0.01
+
+# Gambar lebih kecil dari ini (lebar x tinggi) dianggap logo/ikon, bukan foto
+MIN_EMBEDDED_PIXELS = 200 * 200
+
+# Deteksi halaman foto: gambar yang digambar menutupi kurang dari fraksi
+# luas halaman ini dianggap logo/ikon (logo sekolah 3x3 cm ~ 1,5% A4,
+# foto 8x6 cm ~ 7,7%)
+MIN_PHOTO_COVERAGE = 0.05
+
+
+# Semaphore lintas proses yang membatasi jumlah gambar PIL hasil render
+# (~5 MB per halaman di 150 dpi) yang dipegang bersamaan. Diisi oleh
+# scheduler batch lewat set_image_slots(); None = tanpa batas.
+_image_slots = None
+
+
+def set_image_slots(semaphore):
+    global _image_slots
+    _image_slots = semaphore
+
+
+@contextmanager
+def image_slot():
+    if _image_slots is None:
+        yield
+        return
+    _image_slots.acquire()
+    try:
+        yield
+    finally:
+        _image_slots.release()
+
+
+def photo_filename(number):
+    return f"foto_{number}.jpg"
+
+
+def photo_filenames(pages, detected=False):
+    """{nomor_halaman: nama_foto}.
+
+    Halaman yang dipilih sendiri (``detected`` False) dan semuanya
+    >= FIRST_PHOTO_PAGE memakai nomor halaman - 26 seperti versi lama, jadi
+    ``--pages 27 30 34`` tetap foto_1, foto_4, foto_8. Selain itu (hasil
+    deteksi, atau ada halaman sebelum 27) nomor foto = urutan halaman di
+    antara halaman foto, mulai dari foto_1.
+    """
+    pages = sorted(set(pages))
+    if not detected and pages and pages[0] >= FIRST_PHOTO_PAGE:
+        return {page_num: photo_filename(page_num - FIRST_PHOTO_PAGE + 1) for page_num in pages}
+    return {page_num: photo_filename(number) for number, page_num in enumerate(pages, start=1)}
+
+
+def page_runs(pages, max_gap=2):
+    """Kelompokkan halaman menjadi rentang (first, last).
+
+    Celah kecil (<= max_gap halaman) ikut dirender lalu dibuang, karena
+    lebih murah daripada memulai proses poppler baru.
+    """
+    runs = []
+    for page in sorted(set(pages)):
+        if runs and page - runs[-1][1] <= max_gap + 1:
+            runs[-1][1] = page
+        else:
+            runs.append([page, page])
+    return [tuple(run) for run in runs]
+
+
+def extract_per_page(pdf_path, pages, images_dir, dpi=150, log=print, names=None):
+    """Cara lama: satu proses poppler per halaman, re-encode lewat PIL.
+
+    ``names`` = photo_filenames() semua halaman foto (default: dari ``pages``).
+    """
+    from pdf2image import convert_from_path
+
+    names = names or photo_filenames(pages)
+    extracted = {}
+    for page_num in pages:
+        try:
+            with image_slot(), page_timer() as measured:
+                images = convert_from_path(pdf_path, first_page=page_num, last_page=page_num, dpi=dpi)
+                if images:
+                    img_path = Path(images_dir) / names[page_num]
+                    images[0].save(img_path, 'JPEG')
+                    extracted[page_num] = img_path
+                del images
+            if page_num in extracted:
+                record_page(page_num, "render", measured['wall'], measured['cpu'],
+                            extracted[page_num].stat().st_size)
+                log(f"   ✓ Extracted {extracted[page_num].name}")
+        except Exception as e:
+            log(f"   ⚠️ Skip page {page_num}: {str(e)[:50]}")
+    return extracted
+
+
+def _render_run(pdf_path, first, last, images_dir, dpi):
+    """Render halaman first..last dengan satu pdftoppm langsung ke file JPEG.
+
+    Generator (nomor_halaman, path_sementara, detik) yang menghasilkan setiap
+    halaman begitu file-nya lengkap, saat pdftoppm masih merender halaman
+    berikutnya. pdftoppm menulis halaman berurutan, jadi file halaman N
+    lengkap begitu file halaman sesudahnya muncul atau prosesnya selesai.
+    RuntimeError jika pdftoppm gagal (halaman yang sudah dihasilkan tetap
+    valid); file sementara yang belum diambil dihapus. Seperti pdf2image,
+    pdftoppm dicari di PATH.
+    """
+    prefix = f".render-{os.getpid()}-{first}"
+    images_dir = Path(images_dir)
+    proc = subprocess.Popen(
+        ["pdftoppm", "-r", str(dpi), "-f", str(first), "-l", str(last), "-jpeg",
+         str(pdf_path), str(images_dir / prefix)],
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    done = set()
+    last_at = time.perf_counter()
+    try:
+        while True:
+            try:
+                proc.wait(timeout=RENDER_POLL)
+                finished = True
+            except subprocess.TimeoutExpired:
+                finished = False
+            # pdftoppm menamai file <prefix>-<halaman>.jpg (nomor diberi nol di depan)
+            rendered = sorted(
+                (int(path.stem.rsplit('-', 1)[-1]), path)
+                for path in images_dir.glob(f"{prefix}-*.jpg")
+            )
+            ready = [(page_num, path) for page_num, path in rendered if page_num not in done]
+            if not finished or proc.returncode != 0:
+                # Halaman terakhir yang muncul mungkin masih ditulis (atau
+                # terpotong karena pdftoppm gagal di tengah halaman itu)
+                ready = ready[:-1]
+            for page_num, path in ready:
+                now = time.perf_counter()
+                done.add(page_num)
+                yield page_num, path, now - last_at
+                last_at = now
+            if finished:
+                break
+        if proc.returncode != 0:
+            stderr = proc.stderr.read().decode(errors="replace").strip()
+            raise RuntimeError(f"pdftoppm gagal ({proc.returncode}): {stderr[:200]}")
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        proc.stderr.close()
+        for path in images_dir.glob(f"{prefix}-*.jpg"):
+            path.unlink(missing_ok=True)
+
+
+def extract_batched(pdf_path, pages, images_dir, dpi=150, max_gap=2, log=print, names=None):
+    """Render semua halaman dalam satu lintasan per rentang berurutan.
+
+    Setiap halaman ditulis pdftoppm langsung ke disk (tanpa decode/encode
+    ulang di Python) dan di-rename menjadi foto_N.jpg begitu file-nya
+    lengkap, sementara halaman berikutnya masih dirender. Jika satu rentang
+    gagal, halaman di rentang itu yang belum jadi dicoba satu per satu
+    supaya perilaku skip-per-halaman tetap sama dengan cara lama.
+    """
+    import pdf2image  # noqa: F401  (ImportError diteruskan ke pemanggil)
+
+    images_dir = Path(images_dir)
+    names = names or photo_filenames(pages)
+    wanted = set(pages)
+    extracted = {}
+
+    for first, last in page_runs(pages, max_gap):
+        rendered = {}
+        try:
+            with page_timer() as measured:
+                for page_num, tmp_path, seconds in _render_run(pdf_path, first, last, images_dir, dpi):
+                    if page_num not in wanted:
+                        tmp_path.unlink()
+                        rendered[page_num] = (None, seconds)
+                        continue
+                    img_path = images_dir / names[page_num]
+                    os.replace(tmp_path, img_path)
+                    extracted[page_num] = img_path
+                    rendered[page_num] = (img_path, seconds)
+                    log(f"   ✓ Extracted {img_path.name}")
+        except Exception:
+            missing = [p for p in range(first, last + 1) if p in wanted and p not in rendered]
+            if first != last and missing:
+                extracted.update(extract_per_page(pdf_path, missing, images_dir, dpi, log, names))
+                missing = []
+            for page_num in missing:
+                log(f"   ⚠️ Skip page {page_num}: halaman tidak dirender")
+        else:
+            for page_num in range(first, last + 1):
+                if page_num in wanted and page_num not in rendered:
+                    log(f"   ⚠️ Skip page {page_num}: halaman tidak dirender")
+        # Satu proses poppler untuk seluruh rentang: CPU-nya (baru terukur
+        # setelah proses selesai) dibagi rata ke halaman yang dirender,
+        # termasuk celah yang dibuang
+        share = max(len(rendered), 1)
+        for page_num, (img_path, seconds) in rendered.items():
+            if img_path is not None:
+                record_page(page_num, "render", seconds, measured['cpu'] / share, img_path.stat().st_size)
+    return extracted
+
+
+def split_pages(pages, workers):
+    """Bagi halaman (terurut) menjadi maksimal ``workers`` potongan berurutan.
+
+    Potongan dibuat berurutan, bukan round-robin, supaya setiap worker tetap
+    bisa merender bagiannya dalam satu rentang poppler.
+    """
+    pages = sorted(set(pages))
+    workers = max(1, min(workers, len(pages)))
+    size, extra = divmod(len(pages), workers)
+    chunks, start = [], 0
+    for i in range(workers):
+        end = start + size + (1 if i < extra else 0)
+        chunks.append(pages[start:end])
+        start = end
+    return [chunk for chunk in chunks if chunk]
+
+
+def _extract_chunk(pdf_path, pages, images_dir, dpi, names):
+    # Dijalankan di worker: log dan statistik halaman dikumpulkan dan
+    # diteruskan oleh proses utama
+    messages = []
+    with collect_pages() as records:
+        extracted = extract_batched(pdf_path, pages, images_dir, dpi, log=messages.append, names=names)
+    return extracted, messages, records
+
+
+def extract_parallel(pdf_path, pages, images_dir, dpi=150, workers=None, log=print, names=None):
+    """Render halaman secara paralel dengan process pool.
+
+    Nama file (photo_filenames() semua halaman) dan log yang dicetak berurutan
+    per potongan sama persis dengan mode ``batch``.
+    """
+    import pdf2image  # noqa: F401  (ImportError diteruskan ke pemanggil)
+    from concurrent.futures import ProcessPoolExecutor
+
+    names = names or photo_filenames(pages)
+    workers = workers or os.cpu_count() or 1
+    chunks = split_pages(pages, workers)
+    if len(chunks) <= 1:
+        return extract_batched(pdf_path, pages, images_dir, dpi, log=log, names=names)
+
+    extracted = {}
+    with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+        futures = [
+            pool.submit(_extract_chunk, pdf_path, chunk, str(images_dir), dpi, names)
+            for chunk in chunks
+        ]
+        for chunk, future in zip(chunks, futures):
+            try:
+                chunk_extracted, messages, records = future.result()
+            except Exception as e:
+                messages = [f"   ⚠️ Skip page {page}: {str(e)[:50]}" for page in chunk]
+                chunk_extracted, records = {}, []
+            for msg in messages:
+                log(msg)
+            extend_pages(records)
+            extracted.update(chunk_extracted)
+    return extracted
+
+
+def iter_image_xobjects(resources, seen=None):
+    """Semua image XObject di resources, termasuk yang ada di dalam Form XObject."""
+    if resources is None:
+        return
+    seen = set() if seen is None else seen
+    xobjects = resources.get_object().get("/XObject")
+    if xobjects is None:
+        return
+    for ref in xobjects.get_object().values():
+        key = getattr(ref, "idnum", None)
+        if key is not None:
+            if key in seen:
+                continue
+            seen.add(key)
+        xobj = ref.get_object()
+        subtype = xobj.get("/Subtype")
+        if subtype == "/Image":
+            yield xobj
+        elif subtype == "/Form":
+            yield from iter_image_xobjects(xobj.get("/Resources"), seen)
+
+
+def _is_dct(xobj):
+    filters = xobj.get("/Filter")
+    if filters is None:
+        return False
+    if not isinstance(filters, str):
+        filters = filters[-1] if len(filters) else None
+    return filters == "/DCTDecode"
+
+
+def release_xobject(xobj):
+    """Buang stream gambar dari cache objek pypdf setelah datanya diambil.
+
+    PdfReader menyimpan setiap objek yang pernah dibaca (termasuk byte
+    stream gambar) sampai reader ditutup; tanpa ini memori tumbuh sebesar
+    semua foto di PDF.
+    """
+    ref = getattr(xobj, "indirect_reference", None)
+    cache = getattr(getattr(ref, "pdf", None), "resolved_objects", None)
+    if cache is not None:
+        cache.pop((ref.generation, ref.idnum), None)
+
+
+def embedded_jpeg(page, min_pixels=MIN_EMBEDDED_PIXELS):
+    """Byte JPEG asli dari gambar DCT terbesar di halaman, atau None."""
+    images = list(iter_image_xobjects(page.get("/Resources")))
+    best, best_pixels = None, min_pixels - 1
+    for xobj in images:
+        if not _is_dct(xobj):
+            continue
+        pixels = int(xobj.get("/Width", 0)) * int(xobj.get("/Height", 0))
+        if pixels > best_pixels:
+            best, best_pixels = xobj, pixels
+    # get_data() hanya membuka filter di depan DCTDecode (mis. FlateDecode);
+    # DCTDecode sendiri tidak di-decode oleh pypdf
+    data = None if best is None else best.get_data()
+    for xobj in images:
+        release_xobject(xobj)
+    return data
+
+
+@contextmanager
+def open_embedded(pdf_path):
+    """PdfReader di atas file yang dibuka (bukan path), atau None jika PDF tidak terbaca.
+
+    PdfReader(path) membaca seluruh file ke memori; dengan file object
+    objek dibaca lewat seek hanya saat dibutuhkan. ImportError jika pypdf
+    tidak terpasang.
+    """
+    from pypdf import PdfReader
+
+    try:
+        f = open(pdf_path, "rb")
+    except OSError:
+        yield None
+        return
+    with f:
+        try:
+            reader = PdfReader(f)
+        except Exception:
+            # PDF tidak bisa dibaca pypdf: biarkan jalur render yang melapor error
+            reader = None
+        yield reader
+
+
+def iter_embedded_photos(reader, pages, missing, log=print, names=None):
+    """Hasilkan (nomor_halaman, bytes_jpeg) satu per satu.
+
+    Halaman tanpa JPEG tertanam ditambahkan ke ``missing``. Hanya JPEG
+    halaman yang sedang diproses yang dipegang, jadi memori tidak
+    bergantung pada jumlah halaman selama pemanggil tidak mengumpulkannya.
+    """
+    names = names or photo_filenames(pages)
+    for page_num in pages:
+        with page_timer() as measured:
+            try:
+                data = embedded_jpeg(reader.pages[page_num - 1])
+            except Exception:
+                data = None
+        if data is None:
+            missing.append(page_num)
+            continue
+        record_page(page_num, "embedded", measured['wall'], measured['cpu'], len(data))
+        log(f"   ✓ Extracted {names[page_num]} (JPEG asli)")
+        yield page_num, data
+
+
+def embedded_photos(pdf_path, pages, log=print, names=None):
+    """JPEG tertanam per halaman, tanpa menulis apa pun ke disk.
+
+    Mengembalikan ({nomor_halaman: bytes_jpeg}, [halaman_tanpa_jpeg]).
+    ImportError jika pypdf tidak terpasang.
+    """
+    missing = []
+    with open_embedded(pdf_path) as reader:
+        found = dict(iter_embedded_photos(reader, pages, missing, log=log, names=names))
+    return found, missing
+
+
+def extract_embedded(pdf_path, pages, images_dir, dpi=150, fallback="batch", workers=None,
+                     cache=None, log=print, names=None):
+    """Salin JPEG tertanam apa adanya; render hanya halaman yang tidak punya.
+
+    Setiap JPEG langsung ditulis ke ``images_dir`` begitu dibaca, jadi RSS
+    puncak tidak bergantung pada jumlah halaman. Jika pypdf tidak terpasang
+    semua halaman dirender dengan mode ``fallback``.
+    """
+    names = names or photo_filenames(pages)
+    try:
+        import pypdf  # noqa: F401
+    except ImportError:
+        log("   ⚠️ pypdf not installed, kembali ke mode rasterisasi")
+        return extract_photos(pdf_path, pages, images_dir, dpi, fallback, workers, cache=cache, log=log,
+                              names=names)
+
+    images_dir = Path(images_dir)
+    extracted, missing = {}, []
+    with open_embedded(pdf_path) as reader:
+        for page_num, data in iter_embedded_photos(reader, pages, missing, log=log, names=names):
+            img_path = images_dir / names[page_num]
+            img_path.write_bytes(data)
+            extracted[page_num] = img_path
+
+    if missing:
+        log(f"   → {len(missing)} halaman tanpa JPEG tertanam, dirender...")
+        try:
+            extracted.update(extract_photos(pdf_path, missing, images_dir, dpi, fallback, workers,
+                                            cache=cache, log=log, names=names))
+        except ImportError:
+            if not extracted:
+                raise
+            for page_num in missing:
+                log(f"   ⚠️ Skip page {page_num}: pdf2image not installed")
+    return dict(sorted(extracted.items()))
+
+
+# Operator content stream yang relevan untuk ukuran gambar. Operator dicari
+# sebagai token utuh dengan bytes.find (cepat untuk halaman teks panjang);
+# operand dibaca mundur dari posisi operator, operator lain tidak diparsing.
+_CONTENT_OPS = (b"cm", b"Do", b"q", b"Q")
+_TOKEN_BEFORE = frozenset(b" \t\r\n\f\x00]>)}")
+_TOKEN_AFTER = frozenset(b" \t\r\n\f\x00/[<(%")
+
+
+def _content_ops(content):
+    """[(posisi, operator), ...] untuk cm/Do/q/Q di content stream, terurut."""
+    found = []
+    for op in _CONTENT_OPS:
+        start = content.find(op)
+        while start != -1:
+            end = start + len(op)
+            if ((start == 0 or content[start - 1] in _TOKEN_BEFORE)
+                    and (end == len(content) or content[end] in _TOKEN_AFTER)):
+                found.append((start, op))
+            start = content.find(op, end)
+    found.sort()
+    return found
+
+
+def content_bytes(obj):
+    """Byte content stream halaman (array stream digabung), b"" jika kosong."""
+    obj = obj.get_object() if obj is not None else None
+    if obj is None:
+        return b""
+    if isinstance(obj, list):
+        return b"\n".join(content_bytes(part) for part in obj)
+    return obj.get_data()
+
+
+def _drawn_xobjects(content, resources, scale):
+    """(ref_xobject, luas_tergambar) untuk setiap operator "Do" di content stream.
+
+    Hanya determinan matriks transformasi yang dilacak: XObject digambar
+    dalam ruang satuan, jadi luasnya di halaman = |det(CTM)|.
+    """
+    xobjects = resources.get_object().get("/XObject") if resources is not None else None
+    xobjects = xobjects.get_object() if xobjects is not None else {}
+    stack = []
+    for pos, op in _content_ops(content):
+        if op == b"q":
+            stack.append(scale)
+        elif op == b"Q":
+            if stack:
+                scale = stack.pop()
+        elif op == b"Do":
+            operands = content[max(0, pos - 128):pos].split()
+            name = operands[-1] if operands else b""
+            if b"/" in name:
+                # Nama bisa menempel pada token sebelumnya, mis. "cm/Im1 Do"
+                ref = xobjects.get(name[name.rfind(b"/"):].decode("latin-1"))
+                if ref is not None:
+                    yield ref, abs(scale)
+        else:
+            operands = content[max(0, pos - 128):pos].split()[-6:]
+            try:
+                a, b, c, d = (float(v) for v in operands[:4])
+            except ValueError:
+                continue
+            if len(operands) == 6:
+                scale *= a * d - b * c
+
+
+def _page_photo_pixels(page, min_coverage=MIN_PHOTO_COVERAGE, max_depth=3):
+    """Jumlah piksel gambar terbesar yang menutupi >= ``min_coverage`` halaman."""
+    box = page.mediabox
+    page_area = abs(float(box.width) * float(box.height)) or 1.0
+    best = 0
+    pending = [(content_bytes(page.get("/Contents")), page.get("/Resources"), 1.0, 0)]
+    while pending:
+        content, resources, scale, depth = pending.pop()
+        for ref, area in _drawn_xobjects(content, resources, scale):
+            xobj = ref.get_object()
+            subtype = xobj.get("/Subtype")
+            if subtype == "/Image":
+                if area / page_area >= min_coverage:
+                    best = max(best, int(xobj.get("/Width", 0)) * int(xobj.get("/Height", 0)))
+                release_xobject(xobj)
+            elif subtype == "/Form" and depth < max_depth:
+                # Form XObject: isinya digambar dengan CTM saat "Do" x /Matrix form
+                matrix = [float(v) for v in xobj.get("/Matrix", (1, 0, 0, 1, 0, 0))]
+                pending.append((xobj.get_data(), xobj.get("/Resources", resources),
+                                area * (matrix[0] * matrix[3] - matrix[1] * matrix[2]), depth + 1))
+    return best
+
+
+def detect_photo_pages(pdf_path, min_pixels=MIN_EMBEDDED_PIXELS, min_coverage=MIN_PHOTO_COVERAGE):
+    """Nomor halaman (terurut) yang berisi foto, tanpa merender apa pun.
+
+    Halaman foto = halaman dengan image XObject minimal ``min_pixels``
+    piksel yang digambar menutupi minimal ``min_coverage`` luas halaman
+    (logo, ikon dan tanda tangan kecil tidak dihitung). Hanya content
+    stream halaman dan header gambar yang dibaca. PDF yang tidak terbaca
+    menghasilkan []; ImportError jika pypdf tidak terpasang.
+    """
+    pages = []
+    with open_embedded(pdf_path) as reader:
+        if reader is None:
+            return pages
+        for page_num, page in enumerate(reader.pages, start=1):
+            try:
+                pixels = _page_photo_pixels(page, min_coverage)
+            except Exception:
+                # Halaman rusak/tidak lazim: bukan halaman foto
+                continue
+            if pixels >= min_pixels:
+                pages.append(page_num)
+    return pages
+
+
+def _render(pdf_path, pages, images_dir, dpi, mode, workers, log, names):
+    if mode == "per_page":
+        return extract_per_page(pdf_path, pages, images_dir, dpi, log, names)
+    if mode == "batch":
+        return extract_batched(pdf_path, pages, images_dir, dpi, log=log, names=names)
+    if mode == "parallel":
+        return extract_parallel(pdf_path, pages, images_dir, dpi, workers, log, names)
+    raise ValueError(f"Mode ekstraksi tidak dikenal: {mode!r} (pilihan: {', '.join(EXTRACT_MODES)})")
+
+
+def _render_cached(pdf_path, pages, images_dir, dpi, mode, workers, cache, log, names):
+    """Ambil halaman dari cache render; hanya yang belum ada yang dirender."""
+    from .cache import pdf_digest
+
+    if mode not in EXTRACT_MODES:
+        raise ValueError(f"Mode ekstraksi tidak dikenal: {mode!r} (pilihan: {', '.join(EXTRACT_MODES)})")
+    try:
+        digest = pdf_digest(pdf_path)
+    except OSError:
+        # PDF tidak terbaca: biarkan renderer yang melaporkan error per halaman
+        return _render(pdf_path, pages, images_dir, dpi, mode, workers, log, names)
+
+    images_dir = Path(images_dir)
+    extracted, missing = {}, []
+    for page_num in pages:
+        img_path = images_dir / names[page_num]
+        with page_timer() as measured:
+            hit = cache.fetch(digest, page_num, dpi, RENDER_FORMAT, img_path)
+        if hit:
+            extracted[page_num] = img_path
+            record_page(page_num, "cache", measured['wall'], measured['cpu'], img_path.stat().st_size)
+            log(f"   ✓ Extracted {img_path.name} (cache)")
+        else:
+            missing.append(page_num)
+
+    if missing:
+        rendered = _render(pdf_path, missing, images_dir, dpi, mode, workers, log, names)
+        for page_num, img_path in rendered.items():
+            try:
+                cache.store(digest, page_num, dpi, RENDER_FORMAT, img_path)
+            except OSError as e:
+                log(f"   ⚠️ Cache page {page_num} gagal: {str(e)[:50]}")
+        extracted.update(rendered)
+        cache.evict()
+    return dict(sorted(extracted.items()))
+
+
+def extract_photos(pdf_path, pages, images_dir, dpi=150, mode="embedded", workers=None,
+                   cache=None, log=print, names=None):
+    """Ekstrak foto dari halaman ``pages`` ke ``images_dir``.
+
+    Mengembalikan {nomor_halaman: path_foto} untuk halaman yang berhasil.
+    ``workers`` hanya dipakai mode ``parallel`` (default: jumlah CPU).
+    ``cache`` (pklgen.cache.RenderCache) dipakai untuk halaman yang harus
+    dirender; salinan JPEG tertanam tidak di-cache karena sudah murah.
+    ``names`` = photo_filenames() semua halaman foto; default dari ``pages``
+    (diisi pemanggil yang hanya meneruskan sebagian halaman).
+    ImportError dari pdf2image diteruskan ke pemanggil.
+    """
+    names = names or photo_filenames(pages)
+    # Foto lama bisa berupa hardlink ke store aset batch (pklgen.assets);
+    # ekstraktor menulis ke file yang sama, jadi putuskan dulu link-nya
+    for page_num in pages:
+        (Path(images_dir) / names[page_num]).unlink(missing_ok=True)
+    if mode == "embedded":
+        return extract_embedded(pdf_path, pages, images_dir, dpi, workers=workers, cache=cache, log=log,
+                                names=names)
+    if cache is not None:
+        return _render_cached(pdf_path, pages, images_dir, dpi, mode, workers, cache, log, names)
+    return _render(pdf_path, pages, images_dir, dpi, mode, workers, log, names)
+
+
+def extract_photo_bytes(pdf_path, pages, dpi=150, mode="embedded", workers=None, cache=None,
+                        log=print, names=None):
+    """Seperti extract_photos(), tetapi hasilnya {nomor_halaman: bytes_jpeg}.
+
+    Dipakai backend output di memori (pklgen.output.ArchiveOutput): JPEG
+    tertanam tidak pernah ditulis ke disk. Hanya halaman yang harus
+    dirender poppler yang lewat folder sementara, karena pdftoppm selalu
+    menulis ke file.
+    """
+    names = names or photo_filenames(pages)
+    photos, missing = {}, list(pages)
+    if mode == "embedded":
+        try:
+            photos, missing = embedded_photos(pdf_path, pages, log=log, names=names)
+            mode = "batch"
+        except ImportError:
+            log("   ⚠️ pypdf not installed, kembali ke mode rasterisasi")
+            mode = "batch"
+        if missing and photos:
+            log(f"   → {len(missing)} halaman tanpa JPEG tertanam, dirender...")
+
+    if missing:
+        with tempfile.TemporaryDirectory(prefix="pklgen-render-") as tmp_dir:
+            try:
+                rendered = extract_photos(pdf_path, missing, tmp_dir, dpi, mode, workers,
+                                          cache=cache, log=log, names=names)
+            except ImportError:
+                if not photos:
+                    raise
+                rendered = {}
+                for page_num in missing:
+                    log(f"   ⚠️ Skip page {page_num}: pdf2image not installed")
+            for page_num, img_path in rendered.items():
+                photos[page_num] = img_path.read_bytes()
+    return dict(sorted(photos.items()))
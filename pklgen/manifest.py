@@ -0,0 +1,94 @@
+"""
+Manifest build untuk rebuild inkremental.
+
+File .pkl_manifest.json di folder output menyimpan, untuk setiap step,
+hash dari semua input step tersebut dan daftar file yang dihasilkan. Step
+hanya dijalankan ulang jika hash inputnya berubah atau ada output yang
+hilang. Hash PDF di-cache per (ukuran, mtime) supaya rebuild tanpa
+perubahan tidak perlu membaca ulang seluruh PDF.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+MANIFEST_NAME = ".pkl_manifest.json"
+MANIFEST_VERSION = 1
+
+
+def new_manifest():
+    return {"version": MANIFEST_VERSION, "steps": {}, "files": {}}
+
+
+def load_manifest(output_dir):
+    path = Path(output_dir) / MANIFEST_NAME
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        manifest = new_manifest()
+    return manifest
+
+
+def save_manifest(output_dir, manifest):
+    path = Path(output_dir) / MANIFEST_NAME
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def fingerprint(*parts):
+    """Hash sha256 dari data yang bisa di-serialisasi ke JSON."""
+    data = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def file_hash(manifest, path):
+    """Hash isi file; dipakai ulang dari manifest jika ukuran & mtime sama.
+
+    File yang tidak ada menghasilkan "missing" (step tetap bisa jalan dan
+    melaporkan error-nya sendiri).
+    """
+    path = Path(path)
+    try:
+        st = path.stat()
+    except OSError:
+        return "missing"
+    key = str(path.resolve())
+    cached = manifest["files"].get(key)
+    if cached and cached["size"] == st.st_size and cached["mtime_ns"] == st.st_mtime_ns:
+        return cached["sha256"]
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    manifest["files"][key] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns,
+                              "sha256": digest.hexdigest()}
+    return manifest["files"][key]["sha256"]
+
+
+def is_fresh(manifest, output_dir, step, key):
+    """True jika step sudah pernah dibuat dengan input yang sama dan outputnya masih ada."""
+    entry = manifest["steps"].get(step)
+    if not entry or entry["key"] != key:
+        return False
+    output_dir = Path(output_dir)
+    return all((output_dir / name).exists() for name in entry["outputs"])
+
+
+def previous_outputs(manifest, step):
+    entry = manifest["steps"].get(step)
+    return entry["outputs"] if entry else []
+
+
+def record(manifest, step, key, outputs):
+    manifest["steps"][step] = {"key": key, "outputs": sorted(str(name) for name in outputs)}
+
+
+def forget(manifest, step):
+    manifest["steps"].pop(step, None)
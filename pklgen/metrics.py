@@ -0,0 +1,196 @@
+"""
+Instrumentasi build: waktu, CPU, memori dan byte per step dan per halaman.
+
+- StepMeter: per step mencatat wall time, CPU time (thread yang
+  mengerjakan step + proses anak seperti pdftoppm dan process pool
+  thumbnail), RSS puncak selama step berjalan dan byte yang ditulis.
+- record_page()/collect_pages(): statistik per halaman PDF yang
+  diekstrak, diisi oleh pklgen.extract di thread yang sedang mengekstrak.
+- write_run_report(): laporan JSON satu run (di sebelah ZIP paket).
+
+RSS dibaca dari /proc/self/statm (Linux). Di sistem lain RSS puncak per
+step diganti RSS puncak proses (ru_maxrss) saat step selesai.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Interval sampling RSS (detik)
+RSS_INTERVAL = 0.005
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_rss():
+    """RSS proses ini dalam byte, atau None jika /proc tidak ada."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _maxrss_bytes(who):
+    if resource is None:
+        return None
+    maxrss = resource.getrusage(who).ru_maxrss
+    # Linux: KB, macOS: byte
+    return maxrss if os.uname().sysname == "Darwin" else maxrss * 1024
+
+
+def peak_rss():
+    """RSS puncak proses ini sejak start (byte)."""
+    return _maxrss_bytes(resource.RUSAGE_SELF) if resource else None
+
+
+def children_peak_rss():
+    """RSS puncak proses anak terbesar yang sudah selesai (pdftoppm, worker pool)."""
+    return _maxrss_bytes(resource.RUSAGE_CHILDREN) if resource else None
+
+
+def children_cpu():
+    """CPU time (user + sys) semua proses anak yang sudah selesai."""
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+class StepMeter:
+    """Metrik per step untuk step yang bisa berjalan bersamaan.
+
+    Pemakaian: enter(step)/exit(step) di awal/akhir step, measure(step, fn)
+    untuk membungkus pekerjaan yang dijalankan di thread mana pun, dan
+    add_bytes(step, n). RSS disampling oleh satu thread latar selama ada
+    step aktif; RSS puncak step = RSS proses tertinggi selama step itu
+    berjalan (termasuk memori step lain yang berjalan bersamaan).
+    """
+
+    def __init__(self, interval=RSS_INTERVAL):
+        self.steps = {}
+        self._active = set()
+        self._lock = threading.Lock()
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _entry(self, step):
+        return self.steps.setdefault(step, {'wall': 0.0, 'cpu': 0.0, 'peak_rss': None,
+                                            'bytes_written': 0})
+
+    def _sample(self, rss=None):
+        rss = current_rss() if rss is None else rss
+        if rss is None:
+            return
+        with self._lock:
+            for step in self._active:
+                entry = self.steps[step]
+                if entry['peak_rss'] is None or rss > entry['peak_rss']:
+                    entry['peak_rss'] = rss
+
+    def _run(self):
+        while not self._stop.wait(self._interval):
+            self._sample()
+
+    def start(self):
+        if current_rss() is not None:
+            self._thread = threading.Thread(target=self._run, name="pkl-rss", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def enter(self, step):
+        with self._lock:
+            self._entry(step)
+            self._active.add(step)
+        self._sample()
+        return time.perf_counter()
+
+    def exit(self, step, started):
+        self._sample()
+        with self._lock:
+            self._active.discard(step)
+            entry = self.steps[step]
+            entry['wall'] += time.perf_counter() - started
+            if entry['peak_rss'] is None:
+                entry['peak_rss'] = peak_rss()
+
+    def add_cpu(self, step, seconds):
+        with self._lock:
+            self._entry(step)['cpu'] += seconds
+
+    def add_bytes(self, step, count):
+        with self._lock:
+            self._entry(step)['bytes_written'] += count
+
+    def measure(self, step, fn):
+        """Bungkus ``fn`` supaya CPU time-nya (thread + proses anak) dicatat untuk ``step``."""
+        def run(*args, **kwargs):
+            cpu0, children0 = time.thread_time(), children_cpu()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.add_cpu(step, time.thread_time() - cpu0 + children_cpu() - children0)
+        return run
+
+
+# Statistik per halaman dikumpulkan per thread: ekstraksi satu paket berjalan
+# di satu thread executor, dan beberapa build bisa berjalan di thread lain
+_pages = threading.local()
+
+
+@contextmanager
+def collect_pages():
+    """Kumpulkan record_page() di thread ini; menghasilkan list yang diisi."""
+    previous = getattr(_pages, "records", None)
+    _pages.records = records = []
+    try:
+        yield records
+    finally:
+        _pages.records = previous
+
+
+def record_page(page, source, wall, cpu, nbytes):
+    """Catat satu halaman: ``source`` = "embedded", "render" atau "cache"."""
+    records = getattr(_pages, "records", None)
+    if records is not None:
+        records.append({'page': page, 'source': source, 'wall': wall, 'cpu': cpu, 'bytes': nbytes})
+
+
+def extend_pages(records):
+    """Tambahkan record dari proses worker (mode parallel)."""
+    current = getattr(_pages, "records", None)
+    if current is not None:
+        current.extend(records)
+
+
+@contextmanager
+def page_timer():
+    """Ukur wall/CPU (thread + proses anak) satu blok; menghasilkan dict yang diisi saat keluar."""
+    measured = {}
+    wall0, cpu0, children0 = time.perf_counter(), time.thread_time(), children_cpu()
+    try:
+        yield measured
+    finally:
+        measured['wall'] = time.perf_counter() - wall0
+        measured['cpu'] = time.thread_time() - cpu0 + children_cpu() - children0
+
+
+def write_run_report(path, report):
+    """Tulis laporan run sebagai JSON (atomik: file .tmp lalu rename)."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=1, ensure_ascii=False, default=str)
+    os.replace(tmp_path, path)
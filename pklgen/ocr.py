@@ -0,0 +1,346 @@
+"""
+Isi awal teks laporan (latar belakang, profil, visi, kesimpulan) dari PDF siswa.
+
+Teks setiap halaman diambil dari text layer PDF (pypdf). Halaman tanpa
+text layer (hasil scan) di-OCR dengan Tesseract: halaman dirender
+pdf2image/poppler lalu dikirim ke ``tesseract`` di process pool; halaman
+yang gagal di-OCR dicatat dan dianggap kosong. Halaman foto
+(``halaman_foto``, atau hasil detect_photo_pages untuk 'auto') dilewati.
+
+Hasil setiap halaman di-cache per hash halaman (content stream + data
+stream gambar di halaman itu, bukan path/nama PDF), jadi run berikutnya,
+PDF yang dikirim ulang, atau halaman yang sama di PDF lain tidak diproses
+lagi.
+
+Dari teks itu dicari judul bagian (LATAR BELAKANG, PROFIL PERUSAHAAN,
+VISI, KESIMPULAN, boleh bernomor seperti "1.1" atau "A."); isi sampai
+judul berikutnya menjadi nilai field. prefill_student() hanya mengganti
+field yang masih berisi teks bawaan (DEFAULT_STUDENT atau placeholder
+roster), jadi teks yang diketik sendiri (roster/CLI) tidak tertimpa.
+"""
+
+import hashlib
+import io
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from .cache import DEFAULT_CACHE_DIR
+from .content import AUTO_PAGES, default_fields
+from .extract import (content_bytes, detect_photo_pages, image_slot, iter_image_xobjects, open_embedded,
+                      release_xobject)
+
+DEFAULT_TEXT_CACHE_DIR = DEFAULT_CACHE_DIR.parent / "text"
+# Halaman dengan teks lebih pendek dari ini dianggap tanpa text layer
+MIN_TEXT_CHARS = 20
+OCR_DPI = 300
+OCR_LANGS = ('ind', 'eng')
+TESSERACT_TIMEOUT = 120
+
+# Field laporan -> judul bagian di PDF (huruf kecil, tanpa nomor)
+PREFILL_HEADINGS = {
+    'latar_belakang': ('latar belakang', 'latar belakang pkl', 'latar belakang praktik kerja lapangan'),
+    'profil': ('profil perusahaan', 'profil instansi', 'profil industri', 'gambaran umum perusahaan',
+               'gambaran umum instansi', 'sejarah perusahaan', 'sejarah singkat perusahaan'),
+    'visi': ('visi', 'visi perusahaan'),
+    'kesimpulan': ('kesimpulan',),
+}
+# Judul lain yang mengakhiri sebuah bagian walaupun tidak ditulis kapital
+STOP_HEADINGS = frozenset((
+    'tujuan', 'manfaat', 'misi', 'saran', 'penutup', 'lampiran', 'motto', 'identitas', 'daftar isi',
+    'daftar pustaka', 'kata pengantar', 'rumusan masalah', 'waktu dan tempat', 'struktur organisasi',
+))
+# Isi bagian yang lebih pendek dari ini diabaikan (mis. entri daftar isi)
+MIN_SECTION_CHARS = {'visi': 15}
+MIN_SECTION_DEFAULT = 80
+MAX_SECTION_CHARS = 3000
+
+_NUMBERING = re.compile(r"^(?:bab\s+[ivxlc]+\b[.:]?|[ivxlc]+\.|[a-z]\.|\d+(?:\.\d+)*\.?)\s+", re.I)
+_HEADING_OF = {heading: field for field, headings in PREFILL_HEADINGS.items() for heading in headings}
+
+
+class PageTextCache:
+    """Cache teks per halaman di disk, dialamatkan oleh hash halaman + metode."""
+
+    def __init__(self, root=DEFAULT_TEXT_CACHE_DIR):
+        self.root = Path(root)
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self):
+        return {"root": self.root, "hits": 0, "misses": 0}
+
+    def _path(self, page_digest, method):
+        key = hashlib.sha256(f"{page_digest}:{method}".encode()).hexdigest()
+        return self.root / key[:2] / f"{key}.txt"
+
+    def get(self, page_digest, method):
+        try:
+            text = self._path(page_digest, method).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return text
+
+    def put(self, page_digest, method, text):
+        path = self._path(page_digest, method)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+
+def page_digest(page):
+    """(sha256 isi halaman, jumlah gambar): content stream + data stream gambarnya.
+
+    Gambar JPEG (DCTDecode) dikembalikan get_data() apa adanya, jadi hanya
+    gambar dengan filter lain yang di-decode untuk hash ini.
+    """
+    digest = hashlib.sha256(content_bytes(page.get("/Contents")))
+    images = 0
+    for xobj in iter_image_xobjects(page.get("/Resources")):
+        digest.update(xobj.get_data())
+        release_xobject(xobj)
+        images += 1
+    return digest.hexdigest(), images
+
+
+def ocr_languages():
+    """Bahasa OCR_LANGS yang terpasang di tesseract ("ind+eng"), None jika tidak ada tesseract."""
+    if shutil.which("tesseract") is None:
+        return None
+    out = subprocess.run(["tesseract", "--list-langs"], capture_output=True, text=True)
+    installed = set(out.stdout.split())
+    langs = [lang for lang in OCR_LANGS if lang in installed]
+    return "+".join(langs or ['eng'])
+
+
+def ocr_page(pdf_path, page_num, lang, dpi=OCR_DPI):
+    """Teks satu halaman lewat pdf2image + tesseract; dijalankan di worker proses."""
+    from pdf2image import convert_from_path
+
+    with image_slot():
+        image = convert_from_path(pdf_path, dpi=dpi, first_page=page_num, last_page=page_num,
+                                  grayscale=True)[0]
+        buf = io.BytesIO()
+        image.save(buf, "PNG")
+        image.close()
+    out = subprocess.run(["tesseract", "stdin", "stdout", "-l", lang], input=buf.getvalue(),
+                         capture_output=True, timeout=TESSERACT_TIMEOUT)
+    if out.returncode != 0:
+        raise RuntimeError(f"tesseract gagal di halaman {page_num}: {out.stderr.decode(errors='replace')[:200]}")
+    return out.stdout.decode("utf-8", errors="replace")
+
+
+def _ocr_page_or_error(pdf_path, page_num, lang):
+    """ocr_page() yang tidak melempar: (teks, None) atau ("", pesan_error).
+
+    Error satu halaman (poppler/tesseract gagal, timeout, halaman rusak)
+    tidak boleh menghentikan pool.map untuk halaman lain.
+    """
+    try:
+        return ocr_page(pdf_path, page_num, lang), None
+    except ImportError:
+        raise
+    except Exception as e:
+        return "", f"{type(e).__name__}: {e}"
+
+
+def extract_texts(pdf_path, skip_pages=(), workers=None, cache=None, log=print):
+    """Teks setiap halaman PDF: {nomor_halaman: teks}, plus statistik.
+
+    Halaman di ``skip_pages`` (halaman foto) dilewati. Halaman bergambar
+    tanpa text layer di-OCR di ``workers`` proses (default: jumlah CPU) jika tesseract
+    dan pdf2image tersedia. ``cache`` = PageTextCache (None = tanpa cache).
+    ImportError jika pypdf tidak terpasang.
+    """
+    start = time.perf_counter()
+    stats = {'pages': 0, 'text_layer': 0, 'ocr': 0, 'ocr_cached': 0, 'ocr_failed': 0, 'cached': 0,
+             'no_text': 0, 'text_seconds': 0.0, 'ocr_seconds': 0.0, 'ocr_workers': 0}
+    texts, need_ocr = {}, {}
+    skip_pages = set(skip_pages)
+    with open_embedded(pdf_path) as reader:
+        if reader is None:
+            log(f"   ⚠️ PDF tidak bisa dibaca: {pdf_path}")
+            return texts, stats
+        for page_num, page in enumerate(reader.pages, start=1):
+            if page_num in skip_pages:
+                continue
+            stats['pages'] += 1
+            digest, images = page_digest(page)
+            text = cache.get(digest, "text") if cache is not None else None
+            if text is None:
+                text = page.extract_text() or ""
+                if cache is not None:
+                    cache.put(digest, "text", text)
+            else:
+                stats['cached'] += 1
+            if len(text.strip()) >= MIN_TEXT_CHARS:
+                texts[page_num] = text
+                stats['text_layer'] += 1
+            elif images:
+                # Tanpa gambar tidak ada yang bisa di-OCR (sampul, halaman pemisah)
+                need_ocr[page_num] = digest
+    stats['text_seconds'] = time.perf_counter() - start
+
+    if need_ocr:
+        lang = ocr_languages()
+        method = f"ocr:{lang}:{OCR_DPI}"
+        todo = []
+        for page_num, digest in need_ocr.items():
+            text = cache.get(digest, method) if cache is not None and lang else None
+            if text is None:
+                todo.append(page_num)
+            else:
+                texts[page_num] = text
+                stats['ocr_cached'] += 1
+                stats['cached'] += 1
+        if todo and lang is None:
+            log(f"   ⚠️ {len(todo)} halaman tanpa text layer, tesseract tidak terpasang (OCR dilewati)")
+            log("   Install: apt install tesseract-ocr tesseract-ocr-ind")
+            stats['no_text'] = len(todo)
+        elif todo:
+            ocr_start = time.perf_counter()
+            try:
+                results = _run_ocr(pdf_path, todo, lang, workers, stats)
+            except ImportError:
+                log("   ⚠️ pdf2image not installed (OCR dilewati)")
+                log("   Install: pip install pdf2image --break-system-packages")
+                results = {}
+                stats['no_text'] = len(todo)
+            for page_num, (text, error) in results.items():
+                if error is not None:
+                    # Tidak di-cache: run berikutnya mencoba lagi
+                    log(f"   ⚠️ OCR halaman {page_num} gagal, dianggap kosong ({error})")
+                    stats['ocr_failed'] += 1
+                    continue
+                texts[page_num] = text
+                if cache is not None:
+                    cache.put(need_ocr[page_num], method, text)
+            stats['ocr'] = len(results) - stats['ocr_failed']
+            stats['ocr_seconds'] = time.perf_counter() - ocr_start
+    return dict(sorted(texts.items())), stats
+
+
+def _run_ocr(pdf_path, pages, lang, workers, stats):
+    """{nomor_halaman: (teks, error)} untuk ``pages`` (lihat _ocr_page_or_error)."""
+    import pdf2image  # noqa: F401  (ImportError sebelum worker dijalankan)
+
+    workers = min(workers or os.cpu_count() or 1, len(pages))
+    stats['ocr_workers'] = workers
+    if workers <= 1:
+        return {page_num: _ocr_page_or_error(pdf_path, page_num, lang) for page_num in pages}
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        texts = pool.map(_ocr_page_or_error, [pdf_path] * len(pages), pages, [lang] * len(pages))
+        return dict(zip(pages, texts))
+
+
+def _heading(line):
+    """Judul bagian ternormalisasi jika ``line`` tampak seperti judul, selain itu None."""
+    line = line.strip()
+    if not line or len(line) > 60:
+        return None
+    # Entri daftar isi ("Latar Belakang ........ 1") mengakhiri bagian, bukan memulainya
+    if "...." in line or "…" in line:
+        return ""
+    numbered = _NUMBERING.match(line)
+    name = " ".join(_NUMBERING.sub("", line).strip(" :").lower().split())
+    if name in _HEADING_OF or name in STOP_HEADINGS:
+        return name
+    letters = [c for c in line if c.isalpha()]
+    # Judul generik: kapital semua, atau bernomor dan diawali huruf besar ("2.1 Struktur ...")
+    if letters and not line.endswith((".", ",", ";")) and (
+            line.isupper() or (numbered and line[numbered.end()].isupper())):
+        return name
+    return None
+
+
+def _paragraph(lines):
+    text = "\n".join(lines)
+    # Kata yang dipenggal di akhir baris ("perusaha-\nan")
+    text = re.sub(r"(\w)-\n(\w)", r"\1\2", text)
+    text = " ".join(text.split())
+    if len(text) > MAX_SECTION_CHARS:
+        text = text[:MAX_SECTION_CHARS].rsplit(" ", 1)[0]
+    return text
+
+
+def find_sections(texts):
+    """{field: teks} dari judul PREFILL_HEADINGS di ``texts`` ({halaman: teks})."""
+    lines = "\n".join(texts.values()).splitlines()
+    found = {}
+    current, body = None, []
+
+    def close():
+        if current is not None and current not in found:
+            text = _paragraph(body)
+            if len(text) >= MIN_SECTION_CHARS.get(current, MIN_SECTION_DEFAULT):
+                found[current] = text
+
+    for line in lines:
+        # "Visi: Menjadi ..." dalam satu baris
+        name, sep, rest = line.partition(":")
+        field = _HEADING_OF.get(_heading(name) or "") if sep and rest.strip() else None
+        if field is not None:
+            close()
+            current, body = field, [rest]
+            continue
+        heading = _heading(line)
+        if heading is None:
+            if current is not None:
+                body.append(line)
+            continue
+        close()
+        current, body = _HEADING_OF.get(heading), []
+    close()
+    return found
+
+
+def prefill_student(student, workers=None, cache=None, log=print):
+    """Salinan ``student`` dengan field teks yang diisi dari PDF-nya.
+
+    Hanya field yang masih berisi teks bawaan (DEFAULT_STUDENT atau
+    placeholder roster, lihat pklgen.content.default_fields) yang diganti.
+    Mengembalikan (student_baru, field_yang_diisi, statistik).
+    """
+    photo_pages = student['halaman_foto']
+    # Halaman foto tidak berisi teks laporan; OCR-nya hanya buang waktu
+    skip = detect_photo_pages(student['pdf']) if photo_pages == AUTO_PAGES else photo_pages
+    texts, stats = extract_texts(student['pdf'], skip, workers=workers, cache=cache, log=log)
+    sections = find_sections(texts)
+    defaults = default_fields(student)
+    filled = [field for field in sections if field in defaults]
+    student = dict(student, **{field: sections[field] for field in filled})
+    return student, filled, stats
+
+
+def ocr_rate(stats):
+    """Halaman OCR per detik per core, atau None jika tidak ada OCR."""
+    if not stats['ocr'] or not stats['ocr_seconds']:
+        return None
+    return stats['ocr'] / stats['ocr_seconds'] / stats['ocr_workers']
+
+
+def prefill_summary(filled, stats):
+    """Satu baris ringkasan prefill untuk log CLI/batch."""
+    line = (f"📝 Teks dari PDF: {stats['pages']} halaman ({stats['text_layer']} text layer, "
+            f"{stats['ocr'] + stats['ocr_cached']} OCR"
+            + (f", {stats['ocr_failed']} OCR gagal" if stats['ocr_failed'] else "")
+            + f"; {stats['cached']} dari cache); "
+            f"field diisi: {', '.join(filled) if filled else '-'}")
+    rate = ocr_rate(stats)
+    if rate is not None:
+        line += f"; OCR {rate:.2f} halaman/detik/core"
+    return line
@@ -0,0 +1,167 @@
+"""
+Backend output paket: ke mana artefak STEP 1-6 ditulis.
+
+- DirectoryOutput: folder PKL_Complete_Package/ di disk + ZIP di
+  sebelahnya (perilaku generate_all_pkl.py dan pklgen.batch). Mendukung
+  rebuild inkremental lewat manifest build.
+- ArchiveOutput: hanya ZIP, ditulis ke io.BytesIO atau stream lain
+  (mis. respons HTTP). Tidak ada folder staging; untuk PDF dengan foto
+  JPEG tertanam tidak ada satu byte pun yang menyentuh disk.
+
+Pipeline hanya memanggil write()/add_existing()/read()/remove(), jadi tidak perlu
+tahu backend mana yang dipakai.
+"""
+
+import io
+import os
+from pathlib import Path
+
+from . import manifest as mf
+from .packager import PackageZip
+
+
+def _listing(output_dir):
+    """(nama, ukuran, mtime) semua file paket, untuk kunci step ZIP."""
+    entries = []
+    for root, _, files in os.walk(output_dir):
+        for name in files:
+            if name == mf.MANIFEST_NAME:
+                continue
+            path = Path(root) / name
+            st = path.stat()
+            entries.append((path.relative_to(output_dir).as_posix(), st.st_size, st.st_mtime_ns))
+    return sorted(entries)
+
+
+class DirectoryOutput:
+    """Folder paket di disk; ZIP default di <output_dir>.zip."""
+
+    persistent = True
+
+    def __init__(self, output_dir, zip_path=None):
+        self.root = Path(output_dir)
+        if zip_path is None:
+            zip_path = self.root.parent / f"{self.root.name}.zip"
+        self.zip_path = Path(zip_path)
+        # Laporan run (pklgen.metrics) di sebelah ZIP, tidak ikut di dalamnya
+        self.report_path = self.zip_path.with_name(f"{self.zip_path.stem}.run.json")
+        self.images_dir = self.root / "images"
+        self._packer = None
+
+    def load_manifest(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        return mf.load_manifest(self.root)
+
+    def save_manifest(self, manifest):
+        mf.save_manifest(self.root, manifest)
+
+    def zip_key(self):
+        return mf.fingerprint(_listing(self.root), self.zip_path.name)
+
+    def zip_exists(self):
+        return self.zip_path.exists()
+
+    def begin(self, write_zip=True):
+        self.images_dir.mkdir(parents=True, exist_ok=True)
+        if write_zip:
+            self._packer = PackageZip(self.zip_path)
+
+    def write(self, name, data):
+        """Tulis artefak ke folder paket dan langsung ke ZIP."""
+        path = self.root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # File baru lalu rename: file lama bisa berupa hardlink ke store aset
+        # batch (pklgen.assets) yang dipakai paket lain, jangan ditimpa isinya
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        if self._packer is not None:
+            self._packer.add_bytes(name, data)
+
+    def add_existing(self, name):
+        """Artefak yang sudah ada di folder (step dilewati, foto hasil render) masuk ZIP."""
+        if self._packer is not None and (self.root / name).exists():
+            self._packer.add_file(self.root / name, name)
+
+    def read(self, name):
+        return (self.root / name).read_bytes()
+
+    def remove(self, name):
+        (self.root / name).unlink(missing_ok=True)
+
+    def finish(self):
+        """Tutup ZIP; mengembalikan ukurannya (None jika tidak ada ZIP)."""
+        if self._packer is not None:
+            self._packer.close()
+            self._packer = None
+        return self.zip_path.stat().st_size if self.zip_path.exists() else None
+
+    def abort(self):
+        if self._packer is not None:
+            self._packer.abort()
+            self._packer = None
+
+
+class ArchiveOutput:
+    """Paket hanya sebagai ZIP di ``fileobj`` (default: io.BytesIO baru)."""
+
+    persistent = False
+    root = None
+    zip_path = None
+    report_path = None
+    # None = foto diekstrak ke memori, bukan ke folder
+    images_dir = None
+
+    def __init__(self, fileobj=None):
+        self.fileobj = fileobj if fileobj is not None else io.BytesIO()
+        self._packer = None
+        self._size = 0
+
+    def load_manifest(self):
+        # Tidak ada build sebelumnya yang bisa dipakai ulang
+        return mf.new_manifest()
+
+    def save_manifest(self, manifest):
+        pass
+
+    def zip_key(self):
+        return None
+
+    def zip_exists(self):
+        return False
+
+    def begin(self, write_zip=True):
+        self._packer = PackageZip(fileobj=self.fileobj)
+
+    def write(self, name, data):
+        self._packer.add_bytes(name, data)
+
+    def add_existing(self, name):
+        pass
+
+    def read(self, name):
+        # Semua artefak dibuat di run ini dan masih dipegang pipeline
+        raise FileNotFoundError(name)
+
+    def remove(self, name):
+        pass
+
+    def finish(self):
+        self._packer.close()
+        self._packer = None
+        try:
+            self._size = self.fileobj.tell()
+        except (AttributeError, OSError):
+            # Stream yang tidak bisa di-seek (socket, pipe)
+            self._size = None
+        return self._size
+
+    def abort(self):
+        if self._packer is not None:
+            self._packer.abort()
+            self._packer = None
+
+    def getvalue(self):
+        """Byte ZIP (hanya untuk fileobj default/BytesIO)."""
+        return self.fileobj.getvalue()
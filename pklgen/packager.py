@@ -0,0 +1,84 @@
+"""
+Penulis ZIP paket yang diisi sambil jalan (STEP 6).
+
+Setiap artefak dimasukkan ke arsip begitu selesai dibuat, kebanyakan langsung
+dari memori, jadi tidak ada lintasan terakhir yang membaca ulang seluruh
+folder dari disk seperti shutil.make_archive. File yang sudah terkompresi
+(JPEG, PNG, WebP, DOCX, PDF) disimpan apa adanya (ZIP_STORED); men-deflate
+ulang hanya membuang CPU untuk penghematan < 1%.
+"""
+
+import os
+import time
+import zipfile
+from pathlib import Path
+
+STORED_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.webp', '.gif', '.docx', '.pdf', '.zip'})
+
+
+def compress_type_for(name):
+    if Path(name).suffix.lower() in STORED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+class PackageZip:
+    """ZIP yang ditulis ke <zip_path>.tmp lalu di-rename saat close().
+
+    Jika terjadi error di tengah jalan (dipakai sebagai context manager),
+    file sementara dihapus dan ZIP lama (jika ada) tidak tersentuh.
+
+    Dengan ``fileobj`` (mis. io.BytesIO atau stream respons HTTP) ZIP
+    ditulis langsung ke objek itu dan tidak ada file yang dibuat.
+    """
+
+    def __init__(self, zip_path=None, fileobj=None):
+        if (zip_path is None) == (fileobj is None):
+            raise ValueError("PackageZip butuh tepat satu dari zip_path atau fileobj")
+        self.zip_path = Path(zip_path) if zip_path is not None else None
+        self._tmp_path = Path(f"{zip_path}.tmp") if zip_path is not None else None
+        self._zf = zipfile.ZipFile(fileobj if fileobj is not None else self._tmp_path, 'w',
+                                   zipfile.ZIP_DEFLATED)
+        self._dirs = set()
+
+    def _add_parents(self, arcname):
+        parts = arcname.split('/')[:-1]
+        for i in range(1, len(parts) + 1):
+            dirname = '/'.join(parts[:i]) + '/'
+            if dirname not in self._dirs:
+                self._dirs.add(dirname)
+                self._zf.writestr(zipfile.ZipInfo(dirname, time.localtime()[:6]), b'')
+
+    def add_bytes(self, arcname, data):
+        """Tambahkan artefak yang masih di memori (str atau bytes)."""
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        self._add_parents(arcname)
+        zinfo = zipfile.ZipInfo(arcname, time.localtime()[:6])
+        zinfo.compress_type = compress_type_for(arcname)
+        zinfo.external_attr = 0o644 << 16
+        self._zf.writestr(zinfo, data)
+
+    def add_file(self, path, arcname):
+        """Tambahkan artefak yang sudah ada di disk (mis. foto hasil ekstraksi)."""
+        self._add_parents(arcname)
+        self._zf.write(path, arcname, compress_type=compress_type_for(arcname))
+
+    def close(self):
+        self._zf.close()
+        if self._tmp_path is not None:
+            os.replace(self._tmp_path, self.zip_path)
+
+    def abort(self):
+        self._zf.close()
+        if self._tmp_path is not None:
+            self._tmp_path.unlink(missing_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
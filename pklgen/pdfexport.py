@@ -0,0 +1,373 @@
+"""
+Ekspor PDF: Laporan_PKL_*.docx -> Laporan_PKL_*.pdf lewat LibreOffice headless.
+
+``soffice --convert-to pdf`` per dokumen menghabiskan beberapa detik hanya
+untuk menyalakan LibreOffice (lebih lama lagi saat profil pengguna baru
+dibuat), jauh lebih lama dari konversinya sendiri. ConverterPool menyalakan
+beberapa soffice sekali saja dan membiarkannya hidup: masing-masing dengan
+profil sendiri, mendengarkan socket lokal (127.0.0.1). Converter yang
+sedang bebas ada di antrian; setiap konversi mengambil satu, mengirim
+dokumen lewat UNO, lalu mengembalikannya ke antrian.
+
+Antriannya multiprocessing.Queue, jadi PdfExporter (``pool.exporter``) bisa
+diberikan ke worker proses batch (lihat pklgen.batch) dan semua worker
+berbagi pool yang sama. Setiap konversi dibatasi CONVERT_TIMEOUT detik;
+soffice yang hang dihentikan. Converter yang mati, gagal atau kena timeout
+diganti soffice baru oleh proses yang sedang memakainya.
+
+Butuh LibreOffice (soffice) dan modul UNO Python (paket python3-uno, biasanya
+hanya untuk python3 sistem). Tanpa UNO tidak ada soffice yang tetap hidup:
+setiap dokumen menjalankan satu ``soffice --convert-to pdf`` (paling banyak
+``size`` bersamaan, profil per slot dipakai ulang), jadi biaya start
+soffice dibayar per dokumen.
+"""
+
+import importlib.util
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+PDF_FILTER = "writer_pdf_Export"
+# Detik menunggu soffice siap menerima koneksi / satu konversi selesai
+START_TIMEOUT = 60
+CONVERT_TIMEOUT = 120
+# Windows tidak punya SIGKILL/killpg
+_SIGKILL = getattr(signal, "SIGKILL", signal.SIGTERM)
+
+# Koneksi UNO per (pid, port): bridge pyuno tidak boleh dipakai bersama
+# setelah fork, worker membuat koneksinya sendiri
+_desktops = {}
+# soffice yang dinyalakan proses ini (untuk di-wait setelah dihentikan)
+_spawned = {}
+
+
+class PdfExportError(RuntimeError):
+    pass
+
+
+def find_soffice():
+    """Path soffice/libreoffice di PATH, atau None."""
+    for name in ("soffice", "libreoffice"):
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+
+def uno_available():
+    return importlib.util.find_spec("uno") is not None
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _uno_url(port):
+    return f"socket,host=127.0.0.1,port={port};urp;StarOffice.ComponentContext"
+
+
+def _spawn(soffice, profile, port):
+    """soffice headless yang menerima koneksi UNO di ``port``; mengembalikan pid-nya.
+
+    Dijalankan di session baru: pid = id process group, jadi _kill() ikut
+    menghentikan proses anaknya (oosplash -> soffice.bin).
+    """
+    proc = subprocess.Popen(
+        [soffice, "--headless", "--invisible", "--nologo", "--norestore", "--nodefault", "--nolockcheck",
+         f"-env:UserInstallation={profile}", f"--accept={_uno_url(port)}"],
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+    _spawned[proc.pid] = proc
+    return proc.pid
+
+
+def _kill(pid, sig=_SIGKILL):
+    """Kirim ``sig`` ke soffice ``pid`` dan proses anaknya."""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(pid, sig)
+        else:
+            os.kill(pid, sig)
+    except OSError:
+        # Sudah mati
+        pass
+    proc = _spawned.get(pid)
+    if proc is not None and sig == _SIGKILL:
+        proc.wait()
+        del _spawned[pid]
+
+
+def _alive(port):
+    """soffice di ``port`` masih menerima koneksi."""
+    if port is None:
+        return False
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=1):
+            return True
+    except OSError:
+        return False
+
+
+def _wait_ready(port, timeout):
+    """Tunggu sampai soffice di ``port`` menerima koneksi (tanpa membuat bridge UNO)."""
+    deadline = time.monotonic() + timeout
+    while not _alive(port):
+        if time.monotonic() >= deadline:
+            raise PdfExportError(f"soffice di port {port} tidak merespons")
+        time.sleep(0.1)
+
+
+def _props(**values):
+    from com.sun.star.beans import PropertyValue
+
+    props = []
+    for name, value in values.items():
+        prop = PropertyValue()
+        prop.Name, prop.Value = name, value
+        props.append(prop)
+    return tuple(props)
+
+
+def _desktop(port, timeout=0):
+    """Desktop UNO soffice di ``port``; menunggu sampai ``timeout`` detik jika belum siap."""
+    desktop = _desktops.get((os.getpid(), port))
+    if desktop is not None:
+        return desktop
+    import uno
+    from com.sun.star.connection import NoConnectException
+
+    local = uno.getComponentContext()
+    resolver = local.ServiceManager.createInstanceWithContext("com.sun.star.bridge.UnoUrlResolver", local)
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            ctx = resolver.resolve(f"uno:{_uno_url(port)}")
+            break
+        except NoConnectException:
+            if time.monotonic() >= deadline:
+                raise PdfExportError(f"soffice di port {port} tidak merespons") from None
+            time.sleep(0.1)
+    desktop = _desktops[os.getpid(), port] = ctx.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", ctx)
+    return desktop
+
+
+def _convert_uno(port, pid, src, dest, timeout=CONVERT_TIMEOUT):
+    """Konversi lewat soffice di ``port``; lewat ``timeout`` detik soffice ``pid`` dihentikan.
+
+    Panggilan UNO tidak punya timeout sendiri: soffice yang hang dihentikan
+    dari thread timer, yang membuat panggilan yang sedang menunggu gagal.
+    """
+    import uno
+
+    timed_out = threading.Event()
+
+    def kill():
+        timed_out.set()
+        _kill(pid)
+
+    timer = threading.Timer(timeout, kill)
+    timer.daemon = True
+    timer.start()
+    try:
+        doc = _desktop(port).loadComponentFromURL(uno.systemPathToFileUrl(str(src)), "_blank", 0,
+                                                  _props(Hidden=True, ReadOnly=True))
+        if doc is None:
+            raise PdfExportError(f"soffice gagal membuka {src.name}")
+        try:
+            doc.storeToURL(uno.systemPathToFileUrl(str(dest)), _props(FilterName=PDF_FILTER))
+        finally:
+            doc.close(True)
+    except Exception as e:
+        # Koneksi mungkin sudah putus (soffice mati); sambung ulang lain kali
+        _desktops.pop((os.getpid(), port), None)
+        if timed_out.is_set():
+            raise PdfExportError(f"konversi lebih dari {timeout} detik, soffice dihentikan") from e
+        raise
+    finally:
+        timer.cancel()
+
+
+def _convert_cli(soffice, profile, src, dest, timeout=CONVERT_TIMEOUT):
+    cmd = [soffice, "--headless", "--norestore", "--nolockcheck", f"-env:UserInstallation={profile}",
+           "--convert-to", f"pdf:{PDF_FILTER}", "--outdir", str(dest.parent), str(src)]
+    proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            text=True, start_new_session=True)
+    try:
+        _, stderr = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        # Seluruh process group: soffice.bin tidak ikut mati jika hanya wrapper-nya yang di-kill
+        _kill(proc.pid)
+        proc.communicate()
+        raise PdfExportError(f"konversi lebih dari {timeout} detik, soffice dihentikan") from None
+    if proc.returncode != 0:
+        raise PdfExportError(f"soffice gagal ({proc.returncode}): {stderr.strip()[:200]}")
+
+
+class _Converter:
+    """Satu slot pool: port UNO, profil dan pid soffice-nya (port/pid None tanpa UNO atau saat mati)."""
+
+    def __init__(self, profile, port=None, pid=None):
+        self.profile = profile
+        self.port = port
+        self.pid = pid
+
+    def stop(self):
+        _desktops.pop((os.getpid(), self.port), None)
+        if self.pid is not None:
+            _kill(self.pid)
+        self.port = self.pid = None
+
+    def restart(self, soffice):
+        """Ganti soffice slot ini dengan yang baru (port baru, profil sama).
+
+        PdfExportError jika soffice baru tidak siap dalam START_TIMEOUT; slot
+        tetap mati dan dicoba lagi saat dipakai berikutnya.
+        """
+        self.stop()
+        port = _free_port()
+        pid = _spawn(soffice, self.profile, port)
+        try:
+            _desktop(port, START_TIMEOUT)
+        except BaseException:
+            _kill(pid)
+            raise
+        self.port, self.pid = port, pid
+
+
+class PdfExporter:
+    """Klien pool: konversi docx -> pdf memakai converter yang sedang bebas.
+
+    Bisa diberikan ke worker proses lewat initializer ProcessPoolExecutor
+    (seperti semaphore di pklgen.extract.set_image_slots()).
+    """
+
+    def __init__(self, soffice, slots, use_uno):
+        self.soffice = soffice
+        self.use_uno = use_uno
+        self._slots = slots
+
+    def convert(self, docx_bytes):
+        """Byte PDF dari byte docx; menunggu jika semua converter sedang dipakai."""
+        converter = self._slots.get()
+        try:
+            if self.use_uno and not _alive(converter.port):
+                # Mati sejak dipakai terakhir (crash, di-kill, gagal restart)
+                converter.restart(self.soffice)
+            try:
+                return self._convert(converter, docx_bytes)
+            except Exception:
+                if self.use_uno:
+                    # Setelah gagal/timeout soffice bisa tertinggal dalam keadaan
+                    # rusak: langsung diganti, error konversinya yang diteruskan
+                    try:
+                        converter.restart(self.soffice)
+                    except Exception:
+                        pass
+                raise
+        finally:
+            self._slots.put(converter)
+
+    def _convert(self, converter, docx_bytes):
+        with tempfile.TemporaryDirectory(prefix="pkl-pdf-") as tmp:
+            src = Path(tmp) / "laporan.docx"
+            dest = src.with_suffix(".pdf")
+            src.write_bytes(docx_bytes)
+            if self.use_uno:
+                _convert_uno(converter.port, converter.pid, src, dest)
+            else:
+                _convert_cli(self.soffice, converter.profile, src, dest)
+            if not dest.exists():
+                raise PdfExportError("soffice tidak menghasilkan PDF")
+            return dest.read_bytes()
+
+
+class ConverterPool:
+    """``size`` converter soffice yang hidup selama pool dibuka.
+
+        with ConverterPool(4) as pool:
+            pdf = pool.exporter.convert(docx_bytes)
+
+    PdfExportError jika LibreOffice tidak ditemukan atau tidak mau start.
+    """
+
+    def __init__(self, size=2, soffice=None, use_uno=None):
+        self.size = max(1, size)
+        self.soffice = soffice or find_soffice()
+        if self.soffice is None:
+            raise PdfExportError("LibreOffice (soffice) tidak ditemukan")
+        self.use_uno = uno_available() if use_uno is None else use_uno
+        self._dir = Path(tempfile.mkdtemp(prefix="pkl-soffice-"))
+        self._queue = None
+        self._converters = []
+        try:
+            for i in range(self.size):
+                converter = _Converter((self._dir / f"profil_{i}").as_uri())
+                if self.use_uno:
+                    converter.port = _free_port()
+                    converter.pid = _spawn(self.soffice, converter.profile, converter.port)
+                self._converters.append(converter)
+            # Semua soffice start bersamaan; tunggu sampai semuanya menerima koneksi.
+            # Cukup cek socket: bridge UNO dibuat oleh proses yang mengonversi
+            for converter in self._converters:
+                if self.use_uno:
+                    _wait_ready(converter.port, START_TIMEOUT)
+        except BaseException:
+            self.close()
+            raise
+        # Diimpor di sini: pipeline mengimpor modul ini juga untuk --dry-run
+        import multiprocessing
+
+        self._queue = multiprocessing.Queue()
+        for converter in self._converters:
+            self._queue.put(converter)
+        self.exporter = PdfExporter(self.soffice, self._queue, self.use_uno)
+
+    def close(self):
+        converters = self._converters
+        if self._queue is not None:
+            # Slot bisa sudah diganti (pid baru) oleh proses lain: ambil versi
+            # terbaru dari antrian; semua konversi sudah selesai saat close()
+            from queue import Empty
+
+            converters = []
+            for _ in range(self.size):
+                try:
+                    converters.append(self._queue.get(timeout=1))
+                except Empty:
+                    break
+            pids = {converter.pid for converter in converters}
+            converters += [converter for converter in self._converters if converter.pid not in pids]
+            self._queue = None
+        pids = {converter.pid for converter in converters} - {None}
+        for pid in pids:
+            _kill(pid, signal.SIGTERM)
+        deadline = time.monotonic() + 10
+        for pid in pids:
+            proc = _spawned.get(pid)
+            if proc is not None:
+                try:
+                    proc.wait(timeout=max(deadline - time.monotonic(), 0))
+                except subprocess.TimeoutExpired:
+                    pass
+        for pid in pids:
+            proc = _spawned.get(pid)
+            if proc is None or proc.poll() is None:
+                _kill(pid)
+            else:
+                del _spawned[pid]
+        self._converters = []
+        _desktops.clear()
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
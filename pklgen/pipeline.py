@@ -0,0 +1,644 @@
+"""
+Pipeline lengkap satu paket PKL (STEP 1-6) untuk satu siswa.
+
+Dipakai oleh generate_all_pkl.py (satu siswa, output verbose) dan oleh
+pklgen.batch (banyak siswa dari roster, output ringkas).
+
+Dengan ``incremental=True`` setiap step dicocokkan dengan manifest build
+(lihat pklgen.manifest) dan dilewati jika inputnya tidak berubah.
+plan_package() melakukan pengecekan yang sama tanpa menulis apa pun
+(--dry-run).
+
+Step dijalankan bersamaan oleh scheduler asyncio sesuai dependensinya
+(lihat build_package_async()); log tetap dicetak berurutan STEP 1-6.
+
+ZIP (STEP 6) tidak dibuat dari folder di akhir: setiap artefak dimasukkan
+ke pklgen.packager.PackageZip begitu step-nya selesai. Ke mana artefak
+ditulis (folder + ZIP, atau ZIP di memori saja) ditentukan backend di
+pklgen.output.
+"""
+
+import contextvars
+import functools
+import threading
+import time
+
+from . import manifest as mf
+from .content import AUTO_PAGES, docx_filename, format_pages, pdf_filename
+from .extract import (MIN_EMBEDDED_PIXELS, MIN_PHOTO_COVERAGE, PHOTO_NAMING, detect_photo_pages,
+                      extract_photo_bytes, extract_photos, photo_filenames)
+from .images import (IMAGE_SETTINGS, THUMB_WIDTHS, gallery_entries, optimize_photos,
+                     report_photo_names, thumb_name)
+from .metrics import StepMeter, children_peak_rss, collect_pages, peak_rss, write_run_report
+from .output import ArchiveOutput, DirectoryOutput
+from .pdfexport import PDF_FILTER
+from .report import report_fingerprint
+from .site import README_TEMPLATE, readme_values, render_html, render_readme, support_files, template_inputs
+
+# Kunci data siswa yang hanya dipakai STEP 1, bukan isi laporan
+SOURCE_FIELDS = ('pdf', 'halaman_foto')
+
+# Urutan step (dan urutan log-nya); lihat build_package_async() untuk dependensinya
+STEPS = ('extract', 'images', 'docx', 'pdf', 'readme', 'html', 'support', 'zip')
+
+# Step yang sedang berjalan di task asyncio ini (untuk atribusi CPU/byte)
+_current_step = contextvars.ContextVar('pklgen_step')
+
+
+def _banner(log, title):
+    log("=" * 70)
+    log(title)
+    log("=" * 70)
+
+
+def _skip(log, what):
+    log(f"   ↷ {what} tidak berubah, dilewati")
+
+
+def _step_keys(student, manifest, extract_mode):
+    """Kunci input setiap step (lihat pklgen.manifest)."""
+    content = {key: value for key, value in student.items() if key not in SOURCE_FIELDS}
+    photo_pages = student['halaman_foto']
+    if photo_pages == AUTO_PAGES:
+        # Hasil deteksi hanya bergantung pada isi PDF dan ambang deteksinya
+        photo_pages = (AUTO_PAGES, MIN_EMBEDDED_PIXELS, MIN_PHOTO_COVERAGE)
+    keys = {
+        'extract': mf.fingerprint(mf.file_hash(manifest, student['pdf']), photo_pages, 150, extract_mode,
+                                  PHOTO_NAMING),
+        'support': mf.fingerprint(support_files(student)),
+    }
+    keys['images'] = mf.fingerprint(keys['extract'], IMAGE_SETTINGS)
+    # Bagian Dokumentasi README memakai nama foto hasil STEP 1
+    keys['readme'] = mf.fingerprint(template_inputs(README_TEMPLATE, readme_values(student)), keys['extract'])
+    # Lampiran foto di docx memakai thumbnail dari STEP 1B
+    keys['docx'] = mf.fingerprint(report_fingerprint(), content, keys['images'])
+    # index.html tanpa galeri (render murah, mencakup semua isi dan kode
+    # renderer); galerinya bergantung pada thumbnail yang tersedia
+    keys['html'] = mf.fingerprint(render_html(student), keys['images'])
+    keys['pdf'] = mf.fingerprint(keys['docx'], PDF_FILTER)
+    return keys
+
+
+def plan_package(student, output_dir, zip_path=None, extract_mode="embedded", incremental=True,
+                 export_pdf=False):
+    """Output yang akan dibuat build_package(), tanpa menulis atau mengimpor dependensi berat.
+
+    Mengembalikan [(step, segar, [nama_file, ...]), ...]; ``segar`` = step
+    akan dilewati karena input dan outputnya tidak berubah. Nama foto dan
+    thumbnail untuk step yang tidak segar adalah perkiraan (foto yang lebih
+    kecil dari THUMB_WIDTHS mendapat lebih sedikit thumbnail).
+    ``export_pdf`` = rencana juga mencakup STEP 2B (PDF dari docx).
+    """
+    output = DirectoryOutput(output_dir, zip_path)
+    manifest = mf.load_manifest(output.root) if incremental else mf.new_manifest()
+    if manifest['steps']:
+        keys = _step_keys(student, manifest, extract_mode)
+        fresh = {step: mf.is_fresh(manifest, output.root, step, key) for step, key in keys.items()}
+    else:
+        # Belum pernah dibangun: PDF tidak perlu di-hash
+        fresh = dict.fromkeys(('extract', 'images', 'docx', 'pdf', 'readme', 'html', 'support'), False)
+    if not export_pdf:
+        fresh.pop('pdf')
+    zip_fresh = (all(fresh.values()) and output.zip_exists()
+                 and (export_pdf or 'pdf' not in manifest['steps'])
+                 and mf.is_fresh(manifest, output.root, 'zip', output.zip_key()))
+
+    if student['halaman_foto'] == AUTO_PAGES:
+        # Halaman foto baru diketahui saat PDF dipindai (butuh pypdf)
+        photo_names = ["images/foto_*.jpg"]
+    else:
+        photo_names = [f"images/{name}" for name in photo_filenames(student['halaman_foto']).values()]
+    planned = {
+        'extract': photo_names,
+        'images': [thumb_name(name, width, ext) for name in photo_names
+                   for width in THUMB_WIDTHS for ext in ('jpg', 'webp')],
+        'docx': [docx_filename(student)],
+        'pdf': [pdf_filename(student)],
+        'readme': ["README.md"],
+        'html': ["index.html"],
+        'support': list(support_files(student)),
+    }
+    plan = []
+    for step, names in planned.items():
+        if step not in fresh:
+            continue
+        if fresh[step]:
+            names = mf.previous_outputs(manifest, step)
+        plan.append((step, fresh[step], names))
+    plan.append(('zip', zip_fresh, [str(output.zip_path)]))
+    return plan
+
+
+def _with_pages(fn, *args, **kwargs):
+    """Jalankan ekstraksi sambil mengumpulkan statistik per halaman (pklgen.metrics)."""
+    with collect_pages() as pages:
+        return fn(*args, **kwargs), pages
+
+
+def _profiled(path, fn, *args, **kwargs):
+    """Jalankan ``fn`` di bawah cProfile dan simpan hasilnya ke ``path`` (.prof)."""
+    import cProfile
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(fn, *args, **kwargs)
+    finally:
+        profiler.dump_stats(path)
+
+
+class _StepLog:
+    """Log per step, dicetak berurutan STEP 1..6 walaupun step berjalan bersamaan.
+
+    Step paling awal yang belum selesai langsung mencetak log-nya; step lain
+    ditampung dan dicetak begitu semua step sebelumnya selesai. Aman
+    dipanggil dari thread executor.
+    """
+
+    def __init__(self, log, steps):
+        self._log = log
+        self._order = list(steps)
+        self._buffers = {step: [] for step in steps}
+        self._done = set()
+        self._lock = threading.Lock()
+
+    def for_step(self, step):
+        return functools.partial(self.write, step)
+
+    def write(self, step, msg):
+        with self._lock:
+            if self._order and self._order[0] == step:
+                self._log(msg)
+            else:
+                self._buffers[step].append(msg)
+
+    def done(self, step):
+        with self._lock:
+            self._done.add(step)
+            while self._order and self._order[0] in self._done:
+                self._order.pop(0)
+                if self._order:
+                    for msg in self._buffers.pop(self._order[0]):
+                        self._log(msg)
+
+
+def build_package(student, output_dir=None, zip_path=None, extract_mode="embedded",
+                  extract_workers=None, image_workers=None, incremental=True, cache=None,
+                  output=None, profile_docx=None, pdf_export=None, on_step=None, log=print):
+    """Buat paket PKL untuk ``student``.
+
+    Default: folder ``output_dir`` + ZIP di sebelahnya (<output_dir>.zip).
+    ``output`` = backend lain dari pklgen.output (mis. ArchiveOutput untuk
+    ZIP di memori tanpa folder); ``output_dir``/``zip_path`` diabaikan.
+    ``image_workers`` = proses untuk optimasi thumbnail (default: jumlah CPU).
+    Mengembalikan dict ringkasan (path docx/zip, jumlah foto, ukuran zip,
+    waktu per step dalam detik di ``timings``, waktu total di ``elapsed``,
+    step yang dilewati di ``skipped``, hit/miss cache render di ``cache``).
+
+    Setiap run juga diukur (pklgen.metrics): wall/CPU time, RSS puncak dan
+    byte yang ditulis per step, serta statistik per halaman yang
+    diekstrak. Laporan lengkapnya ada di ``metrics`` dan, untuk folder di
+    disk, ditulis sebagai JSON di sebelah ZIP (``report``, mis.
+    PKL_Complete_Package.run.json). ``profile_docx`` = path file .prof:
+    pembuatan docx dijalankan di bawah cProfile (buka dengan snakeviz,
+    ``python -m pstats`` atau konversi ke flame graph dengan flameprof).
+    ``pdf_export`` = pklgen.pdfexport.PdfExporter (``ConverterPool.exporter``):
+    docx juga diekspor ke PDF (STEP 2B) dan dimasukkan ke paket (``pdf``).
+    ``on_step(step, nama_file)`` dipanggil begitu step yang tidak dilewati
+    selesai menulis output-nya, sebelum step lain selesai (mis. live reload
+    --watch); dipanggil dari thread event loop, jadi harus cepat.
+
+    Menjalankan build_package_async() dengan event loop baru; dari dalam
+    event loop yang sudah berjalan, await build_package_async() langsung.
+    """
+    # asyncio/concurrent.futures diimpor di sini, bukan di atas: plan_package()
+    # (--dry-run) tidak membutuhkannya
+    import asyncio
+
+    return asyncio.run(build_package_async(
+        student, output_dir, zip_path, extract_mode=extract_mode, extract_workers=extract_workers,
+        image_workers=image_workers, incremental=incremental, cache=cache, output=output,
+        profile_docx=profile_docx, pdf_export=pdf_export, on_step=on_step, log=log))
+
+
+async def build_package_async(student, output_dir=None, zip_path=None, extract_mode="embedded",
+                              extract_workers=None, image_workers=None, incremental=True, cache=None,
+                              output=None, profile_docx=None, pdf_export=None, on_step=None, log=print):
+    """Seperti build_package(), sebagai coroutine.
+
+    Step membentuk DAG dan dijalankan bersamaan:
+
+        extract -> images -> docx -> pdf (hanya dengan pdf_export)
+                          -> html
+                -> readme
+        support (tidak bergantung pada apa pun)
+        zip <- semua step (isinya semua artefak)
+
+    Pekerjaan CPU (render/ekstraksi halaman, thumbnail, docx) berjalan di
+    executor. Semua akses ke backend output (tulis file, isi ZIP, baca)
+    lewat satu thread I/O, jadi berurutan tanpa lock dan tetap tumpang
+    tindih dengan pekerjaan CPU.
+    """
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    if output is None:
+        output = DirectoryOutput(output_dir, zip_path)
+    start = time.perf_counter()
+    started_at = time.strftime("%Y-%m-%dT%H:%M:%S%z")
+    timings = {}
+    skipped = []
+    result = {'nama': student['nama'], 'nis': student['nis'], 'output_dir': output.root,
+              'timings': timings, 'skipped': skipped}
+
+    manifest = output.load_manifest()
+    if not incremental:
+        manifest['steps'].clear()
+    cache_before = cache.stats() if cache is not None else None
+    docx_name = docx_filename(student)
+    pdf_name = pdf_filename(student)
+    files = support_files(student)
+
+    # Kunci input semua step dihitung di depan, supaya sebelum step pertama
+    # sudah diketahui apakah ZIP perlu ditulis ulang
+    keys = _step_keys(student, manifest, extract_mode)
+    if pdf_export is None:
+        del keys['pdf']
+    fresh = {step: mf.is_fresh(manifest, output.root, step, key) for step, key in keys.items()}
+    # PDF dari run sebelumnya yang sekarang tidak diekspor harus keluar dari ZIP
+    stale_pdf = pdf_export is None and 'pdf' in manifest['steps']
+    zip_fresh = (all(fresh.values()) and not stale_pdf and output.zip_exists()
+                 and mf.is_fresh(manifest, output.root, 'zip', output.zip_key()))
+
+    loop = asyncio.get_running_loop()
+    io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pkl-io")
+    logs = _StepLog(log, [name for name in STEPS if name in keys or name == 'zip'])
+    meter = StepMeter()
+    pages = []
+
+    def io(fn, *args):
+        step_name = _current_step.get()
+        if fn == output.write:
+            meter.add_bytes(step_name, len(args[1]))
+        return loop.run_in_executor(io_pool, meter.measure(step_name, fn), *args)
+
+    def cpu(fn, *args, **kwargs):
+        return loop.run_in_executor(None, meter.measure(_current_step.get(), functools.partial(fn, *args, **kwargs)))
+
+    def step(name):
+        """Dekorator: ukur step (pklgen.metrics) dan tandai log-nya selesai."""
+        def wrap(coro_fn):
+            async def run(*deps):
+                deps = [await dep for dep in deps]
+                # Setiap task punya salinan context sendiri
+                _current_step.set(name)
+                t0 = meter.enter(name)
+                try:
+                    value = await coro_fn(logs.for_step(name), *deps)
+                finally:
+                    meter.exit(name, t0)
+                    timings[name] = meter.steps[name]['wall']
+                    logs.done(name)
+                if on_step is not None and name not in skipped:
+                    on_step(name, mf.previous_outputs(manifest, name))
+                return value
+            return run
+        return wrap
+
+    # STEP 1: EKSTRAK FOTO DARI PDF
+    @step('extract')
+    async def extract_step(log):
+        _banner(log, "STEP 1: EKSTRAK FOTO DARI PDF")
+        photo_data = {}
+        if fresh['extract']:
+            _skip(log, "Foto")
+            skipped.append('extract')
+            photo_names = mf.previous_outputs(manifest, 'extract')
+            for name in photo_names:
+                await io(output.add_existing, name)
+        else:
+            for name in mf.previous_outputs(manifest, 'extract'):
+                await io(output.remove, name)
+            mf.forget(manifest, 'extract')
+            try:
+                photo_pages = student['halaman_foto']
+                if photo_pages == AUTO_PAGES:
+                    log("🔎 Mendeteksi halaman foto dari PDF...")
+                    detect_start = time.perf_counter()
+                    photo_pages = await cpu(detect_photo_pages, student['pdf'])
+                    result['photo_pages'] = photo_pages
+                    log(f"   ✓ {len(photo_pages)} halaman foto: {format_pages(photo_pages) or '-'} "
+                        f"({(time.perf_counter() - detect_start) * 1000:.0f} ms)")
+                log(f"📸 Mengekstrak foto dari PDF (mode: {extract_mode})...")
+                names = photo_filenames(photo_pages, detected=student['halaman_foto'] == AUTO_PAGES)
+                if output.images_dir is None:
+                    photos, pages[:] = await cpu(_with_pages, extract_photo_bytes, student['pdf'],
+                                                 photo_pages, dpi=150, mode=extract_mode,
+                                                 workers=extract_workers, cache=cache, log=log,
+                                                 names=names)
+                    photo_names = [f"images/{names[page_num]}" for page_num in photos]
+                    photo_data = dict(zip(photo_names, photos.values()))
+                    for name, data in photo_data.items():
+                        await io(output.write, name, data)
+                else:
+                    photos, pages[:] = await cpu(_with_pages, extract_photos, student['pdf'],
+                                                 photo_pages, output.images_dir, dpi=150,
+                                                 mode=extract_mode, workers=extract_workers,
+                                                 cache=cache, log=log, names=names)
+                    # Foto ditulis langsung oleh ekstraktor, bukan lewat output.write()
+                    meter.add_bytes('extract', sum(page['bytes'] for page in pages))
+                    photo_names = [path.relative_to(output.root).as_posix() for path in photos.values()]
+                    for name in photo_names:
+                        await io(output.add_existing, name)
+                # Tanpa foto sama sekali (PDF/poppler bermasalah): coba lagi di run berikutnya
+                if photos:
+                    mf.record(manifest, 'extract', keys['extract'], photo_names)
+                log("   ✅ Ekstraksi foto selesai!")
+            except ImportError:
+                log("   ⚠️ pdf2image not installed, creating placeholder images...")
+                # Buat placeholder jika library tidak ada
+                photo_names = []
+                for i in range(1, 9):
+                    name = f"images/foto_{i}.jpg"
+                    await io(output.write, name, b"")
+                    photo_data[name] = b""
+                    photo_names.append(name)
+                    log(f"   ✓ Created placeholder foto_{i}.jpg")
+        result['photos'] = len(photo_names)
+        if cache is not None:
+            result['cache'] = {key: value - cache_before[key] for key, value in cache.stats().items()}
+        log("")
+        return photo_names, photo_data
+
+    # STEP 1B: OPTIMASI FOTO GALERI
+    @step('images')
+    async def images_step(log, extracted):
+        photo_names, photo_data = extracted
+        _banner(log, "STEP 1B: OPTIMASI FOTO GALERI (THUMBNAIL, JPEG PROGRESIF, WEBP)")
+        thumb_data = {}
+        if fresh['images']:
+            _skip(log, "Thumbnail")
+            skipped.append('images')
+            thumb_names = mf.previous_outputs(manifest, 'images')
+            for name in thumb_names:
+                await io(output.add_existing, name)
+        else:
+            for name in mf.previous_outputs(manifest, 'images'):
+                await io(output.remove, name)
+            mf.forget(manifest, 'images')
+            thumb_names = []
+            try:
+                for name in photo_names:
+                    if name not in photo_data:
+                        photo_data[name] = await io(output.read, name)
+                variants = await cpu(optimize_photos, photo_data, workers=image_workers)
+            except ImportError:
+                log("   ⚠️ Pillow not installed, galeri memakai foto asli")
+                variants = {}
+            stats = {'original': 0, 'jpeg': 0, 'webp': 0}
+            for photo_name, photo_variants in variants.items():
+                for width, jpeg, webp in photo_variants:
+                    for name, data in ((thumb_name(photo_name, width, 'jpg'), jpeg),
+                                       (thumb_name(photo_name, width, 'webp'), webp)):
+                        await io(output.write, name, data)
+                        thumb_data[name] = data
+                        thumb_names.append(name)
+                if photo_variants:
+                    # Yang diunduh browser: varian terbesar (layar HiDPI), bukan foto asli
+                    _, jpeg, webp = photo_variants[-1]
+                    stats['original'] += len(photo_data[photo_name])
+                    stats['jpeg'] += len(jpeg)
+                    stats['webp'] += len(webp)
+            if thumb_names:
+                mf.record(manifest, 'images', keys['images'], thumb_names)
+                stats['saved'] = stats['original'] - stats['webp']
+                result['images'] = stats
+                log(f"   ✅ {len(thumb_names)} thumbnail: galeri {stats['original'] / 1024:.0f} KB → "
+                    f"{stats['webp'] / 1024:.0f} KB WebP / {stats['jpeg'] / 1024:.0f} KB JPEG "
+                    f"(hemat {stats['saved'] / 1024:.0f} KB)")
+            else:
+                log("   ⚠️ Tidak ada foto yang bisa dioptimasi")
+        log("")
+        return thumb_names, thumb_data
+
+    # STEP 2: BUAT DOKUMEN WORD LENGKAP
+    @step('docx')
+    async def docx_step(log, extracted, thumbs):
+        photo_names, _ = extracted
+        thumb_names, thumb_data = thumbs
+        _banner(log, "STEP 2: BUAT LAPORAN WORD LENGKAP")
+        if fresh['docx']:
+            _skip(log, "Dokumen Word")
+            skipped.append('docx')
+            await io(output.add_existing, docx_name)
+            result['docx'] = output.root / docx_name
+        else:
+            try:
+                from .report_template import render_report
+
+                for name in mf.previous_outputs(manifest, 'docx'):
+                    await io(output.remove, name)
+                mf.forget(manifest, 'docx')
+                log("📄 Membuat dokumen Word...")
+                report_photos = []
+                for name in report_photo_names(photo_names, thumb_names):
+                    report_photos.append(thumb_data[name] if name in thumb_data else await io(output.read, name))
+                if profile_docx:
+                    data = await cpu(_profiled, profile_docx, render_report, student, report_photos,
+                                     log=log)
+                    result['profile'] = profile_docx
+                    log(f"   🔬 Profil docx: {profile_docx}")
+                else:
+                    data = await cpu(render_report, student, report_photos, log=log)
+                await io(output.write, docx_name, data)
+                mf.record(manifest, 'docx', keys['docx'], [docx_name])
+                if output.root is not None:
+                    result['docx'] = output.root / docx_name
+                log(f"   ✅ Dokumen Word berhasil dibuat: {docx_name}")
+                log("")
+                return data
+            except ImportError:
+                log("   ⚠️ python-docx not installed")
+                log("   Install: pip install python-docx --break-system-packages")
+        log("")
+
+    # STEP 2B: EKSPOR PDF (pool LibreOffice, lihat pklgen.pdfexport)
+    @step('pdf')
+    async def pdf_step(log, docx_data):
+        _banner(log, "STEP 2B: EKSPOR LAPORAN KE PDF")
+        if fresh['pdf']:
+            _skip(log, "PDF")
+            skipped.append('pdf')
+            await io(output.add_existing, pdf_name)
+            result['pdf'] = output.root / pdf_name
+        elif docx_data is None and not fresh['docx']:
+            log("   ⚠️ Dokumen Word tidak dibuat, PDF dilewati")
+        else:
+            if docx_data is None:
+                docx_data = await io(output.read, docx_name)
+            for name in mf.previous_outputs(manifest, 'pdf'):
+                await io(output.remove, name)
+            mf.forget(manifest, 'pdf')
+            log("📑 Mengonversi dokumen Word ke PDF (LibreOffice)...")
+            try:
+                # Konversi berjalan di proses soffice; thread executor hanya
+                # menunggu converter yang bebas dan hasilnya
+                data = await cpu(pdf_export.convert, docx_data)
+            except Exception as e:
+                # LibreOffice proses terpisah yang bisa mati/hang; paket tetap
+                # jadi tanpa PDF dan run berikutnya mencoba lagi
+                log(f"   ⚠️ Ekspor PDF gagal: {type(e).__name__}: {e}")
+            else:
+                await io(output.write, pdf_name, data)
+                mf.record(manifest, 'pdf', keys['pdf'], [pdf_name])
+                if output.root is not None:
+                    result['pdf'] = output.root / pdf_name
+                log(f"   ✅ PDF berhasil dibuat: {pdf_name}")
+        log("")
+
+    # STEP 3: BUAT README.MD
+    @step('readme')
+    async def readme_step(log, extracted):
+        photo_names, _ = extracted
+        _banner(log, "STEP 3: BUAT README.MD")
+        if fresh['readme']:
+            _skip(log, "README.md")
+            skipped.append('readme')
+            await io(output.add_existing, "README.md")
+        else:
+            await io(output.write, "README.md", (await cpu(render_readme, student, photo_names)).encode("utf-8"))
+            mf.record(manifest, 'readme', keys['readme'], ["README.md"])
+            log(f"   ✅ README.md berhasil dibuat!")
+        log("")
+
+    # STEP 4: BUAT INDEX.HTML
+    @step('html')
+    async def html_step(log, extracted, thumbs):
+        photo_names, _ = extracted
+        thumb_names, _ = thumbs
+        _banner(log, "STEP 4: BUAT INDEX.HTML (PRESENTASI INTERAKTIF)")
+        if fresh['html']:
+            _skip(log, "index.html")
+            skipped.append('html')
+            await io(output.add_existing, "index.html")
+        else:
+            gallery = gallery_entries(photo_names, thumb_names) if photo_names else None
+            await io(output.write, "index.html", (await cpu(render_html, student, gallery)).encode("utf-8"))
+            mf.record(manifest, 'html', keys['html'], ["index.html"])
+            log(f"   ✅ index.html berhasil dibuat!")
+        log("")
+
+    # STEP 5: BUAT FILE PENDUKUNG
+    @step('support')
+    async def support_step(log):
+        _banner(log, "STEP 5: BUAT FILE PENDUKUNG")
+        if fresh['support']:
+            _skip(log, "File pendukung")
+            skipped.append('support')
+            for name in files:
+                await io(output.add_existing, name)
+        else:
+            for name, text in files.items():
+                await io(output.write, name, text.encode("utf-8"))
+                log(f"   ✅ {name}")
+            mf.record(manifest, 'support', keys['support'], list(files))
+        log("")
+
+    # STEP 6: BUAT ZIP FILE
+    @step('zip')
+    async def zip_step(log, *artifacts):
+        _banner(log, "STEP 6: BUAT ZIP FILE")
+        label = output.zip_path.name if output.zip_path is not None else "ZIP"
+        if zip_fresh:
+            _skip(log, label)
+            skipped.append('zip')
+        else:
+            log(f"📦 Menutup {label}...")
+        zip_size = await io(output.finish)
+        if not zip_fresh and zip_size is not None:
+            meter.add_bytes('zip', zip_size)
+        if not zip_fresh and output.persistent:
+            mf.record(manifest, 'zip', output.zip_key(), [])
+        if zip_size is not None:
+            result['zip_size'] = zip_size
+            if output.zip_path is not None:
+                result['zip'] = output.zip_path
+            log(f"   ✅ {label} ({zip_size / (1024 * 1024):.2f} MB)")
+        log("")
+
+    tasks = []
+    meter.start()
+    try:
+        if stale_pdf:
+            for name in mf.previous_outputs(manifest, 'pdf'):
+                await loop.run_in_executor(io_pool, output.remove, name)
+            mf.forget(manifest, 'pdf')
+        await loop.run_in_executor(io_pool, output.begin, not zip_fresh)
+        extracted = asyncio.ensure_future(extract_step())
+        thumbs = asyncio.ensure_future(images_step(extracted))
+        docx = asyncio.ensure_future(docx_step(extracted, thumbs))
+        tasks = [
+            extracted,
+            thumbs,
+            docx,
+            asyncio.ensure_future(readme_step(extracted)),
+            asyncio.ensure_future(html_step(extracted, thumbs)),
+            asyncio.ensure_future(support_step()),
+        ]
+        if pdf_export is not None:
+            tasks.append(asyncio.ensure_future(pdf_step(docx)))
+        # ZIP ditutup setelah artefak terakhir masuk; sampai saat itu setiap
+        # artefak sudah ditulis ke ZIP begitu step-nya selesai
+        tasks.append(asyncio.ensure_future(zip_step(*tasks)))
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # Setelah semua tulisan yang masih antre di thread I/O
+        await loop.run_in_executor(io_pool, output.abort)
+        raise
+    finally:
+        meter.stop()
+        io_pool.shutdown(wait=True)
+
+    output.save_manifest(manifest)
+    # Step selesai dalam urutan yang tidak tentu; laporkan dalam urutan STEP
+    skipped.sort(key=STEPS.index)
+    result['timings'] = {name: timings[name] for name in STEPS if name in timings}
+    result['elapsed'] = time.perf_counter() - start
+
+    # Nama foto per halaman sama dengan penamaan STEP 1
+    photo_pages = result.get('photo_pages', student['halaman_foto'])
+    photo_names_by_page = (photo_filenames(photo_pages, detected=student['halaman_foto'] == AUTO_PAGES)
+                           if photo_pages != AUTO_PAGES else {})
+    result['metrics'] = {
+        'nama': student['nama'],
+        'nis': student['nis'],
+        'started': started_at,
+        'elapsed': result['elapsed'],
+        'extract_mode': extract_mode,
+        'photo_pages': result.get('photo_pages', student['halaman_foto']),
+        'steps': {name: dict(meter.steps[name], skipped=name in skipped)
+                  for name in STEPS if name in meter.steps},
+        'pages': [dict(page, photo=photo_names_by_page.get(page['page']))
+                  for page in sorted(pages, key=lambda page: page['page'])],
+        # Seluruh proses sejak start (di worker batch: termasuk siswa sebelumnya)
+        'peak_rss': peak_rss(),
+        'children_peak_rss': children_peak_rss(),
+        'zip': result.get('zip'),
+        'zip_size': result.get('zip_size'),
+        'profile_docx': result.get('profile'),
+    }
+    if output.report_path is not None:
+        write_run_report(output.report_path, result['metrics'])
+        result['report'] = output.report_path
+    return result
+
+
+def package_bytes(student, extract_mode="embedded", extract_workers=None, image_workers=None,
+                  cache=None, log=print):
+    """Bangun paket tanpa folder staging; mengembalikan (byte_zip, ringkasan)."""
+    output = ArchiveOutput()
+    result = build_package(student, extract_mode=extract_mode, extract_workers=extract_workers,
+                           image_workers=image_workers, cache=cache, output=output, log=log)
+    return output.getvalue(), result
@@ -0,0 +1,316 @@
+"""
+Pembuat laporan Word (STEP 2).
+
+Template .docx bawaan python-docx dibaca sekali per proses, ditambah style
+paragraf laporan (REPORT_STYLES), lalu dipakai ulang untuk setiap siswa.
+Font, ukuran, tebal/miring dan warna hanya didefinisikan di styles.xml;
+paragraf di document.xml cukup merujuk ID style-nya.
+"""
+
+import hashlib
+import io
+from functools import lru_cache
+from pathlib import Path
+
+from .content import biodata
+
+
+# Style paragraf laporan (semua Arial, turunan Normal). ID style di
+# styles.xml = nama tanpa spasi, mis. 'PKL Judul' -> PKLJudul.
+REPORT_STYLES = {
+    'PKL Judul Sampul': {'size': 16, 'bold': True, 'align': 'center'},
+    'PKL Judul Perusahaan': {'size': 16, 'bold': True, 'align': 'center', 'color': (46, 117, 182)},
+    'PKL Judul': {'size': 14, 'bold': True, 'align': 'center'},
+    'PKL Judul Sekolah': {'size': 13, 'bold': True, 'align': 'center'},
+    'PKL Judul Kecil': {'size': 12, 'bold': True, 'align': 'center'},
+    'PKL Subbab': {'size': 12, 'bold': True},
+    'PKL Isi': {'size': 12},
+    'PKL Isi Kecil': {'size': 11},
+    'PKL Motto': {'size': 12, 'italic': True, 'align': 'center'},
+    'PKL Motto Sumber': {'size': 11, 'italic': True, 'align': 'center'},
+    'PKL Bullet': {'size': 12},
+    'PKL Bullet Kecil': {'size': 11},
+    'PKL Tabel': {'size': 11},
+    'PKL Tabel Label': {'size': 11, 'bold': True},
+    'PKL Foto': {'size': 11, 'align': 'center'},
+    'PKL Keterangan Foto': {'size': 10, 'italic': True, 'align': 'center'},
+}
+
+# Lebar cetak foto di Lampiran. Foto yang disematkan adalah thumbnail JPEG
+# 800 px dari STEP 1B (pklgen.images), jadi ~250 dpi di ukuran ini; foto
+# 150 dpi ukuran halaman penuh tidak pernah masuk docx.
+PHOTO_WIDTH_INCHES = 3.2
+
+
+def add_report_styles(doc):
+    """Definisikan REPORT_STYLES di styles.xml ``doc``."""
+    from docx.enum.style import WD_STYLE_TYPE
+    from docx.shared import Pt, RGBColor
+
+    for name, spec in REPORT_STYLES.items():
+        style = doc.styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+        style.base_style = doc.styles['Normal']
+        style.quick_style = True
+        style.font.name = 'Arial'
+        style.font.size = Pt(spec['size'])
+        if spec.get('bold'):
+            style.font.bold = True
+        if spec.get('italic'):
+            style.font.italic = True
+        if spec.get('color'):
+            style.font.color.rgb = RGBColor(*spec['color'])
+        if spec.get('align'):
+            style.paragraph_format.alignment = _alignment(spec['align'])
+
+
+def _alignment(align):
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+
+    return {'left': None, 'center': WD_ALIGN_PARAGRAPH.CENTER, 'right': WD_ALIGN_PARAGRAPH.RIGHT,
+            'justify': WD_ALIGN_PARAGRAPH.JUSTIFY}[align]
+
+
+@lru_cache(maxsize=None)
+def _template_bytes():
+    from docx import Document
+    from docx.api import _default_docx_path
+
+    doc = Document(_default_docx_path())
+    add_report_styles(doc)
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+@lru_cache(maxsize=None)
+def report_fingerprint():
+    """Hash source modul ini + report_template; berubah jika tata letak laporan diubah."""
+    digest = hashlib.sha256()
+    for path in (Path(__file__), Path(__file__).with_name('report_template.py')):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def new_document():
+    from docx import Document
+
+    return Document(io.BytesIO(_template_bytes()))
+
+
+def report_sections(student, photos=()):
+    """Tata letak laporan sebagai data: [(kunci, pesan_log, [blok, ...]), ...].
+
+    ``photos`` = byte JPEG foto dokumentasi (berurutan) untuk Lampiran;
+    kosong = tanpa Lampiran. Isi ``photos`` hanya diteruskan ke blok
+    'image', jadi renderer lain boleh memakai objek lain (pklgen.site
+    memakai entri galeri).
+
+    Blok (tuple, elemen pertama = jenis; style = nama di REPORT_STYLES):
+    - ('para', teks, style, perataan_atau_None): perataan di luar style-nya
+    - ('bullet', teks, style): paragraf "• teks"
+    - ('blank', teks): paragraf polos tanpa format ('' atau '\\n')
+    - ('page_break',)
+    - ('table', baris, style_sel, style_kolom_pertama, rata_tengah); sel None = kosong
+    - ('image', bytes_jpeg, style, lebar_inci)
+
+    Dipakai oleh build_report() (python-docx), pklgen.report_template
+    (fragmen XML yang sudah dikompilasi) dan pklgen.site (index.html).
+    """
+    blank, page_break = ('blank', ''), ('page_break',)
+
+    def heading(text, style='PKL Judul'):
+        return ('para', text, style, None)
+
+    def text(value, style='PKL Isi', align=None):
+        return ('para', value, style, align)
+
+    sampul = [
+        heading('LAPORAN', 'PKL Judul Sampul'),
+        heading('PRAKTIK KERJA LAPANGAN', 'PKL Judul Sampul'),
+        blank,
+        heading('DI'),
+        heading(student['perusahaan'].upper(), 'PKL Judul Perusahaan'),
+        ('blank', '\n'),
+        heading('Disusun Oleh:', 'PKL Judul Kecil'),
+        heading(student['nama'].upper()),
+        text(f"NIS: {student['nis']}", align='center'),
+        text(f"Kelas {student['kelas']} - {student['program_keahlian']}", align='center'),
+        ('blank', '\n'),
+        heading(f"UPTD {student['sekolah'].upper()}", 'PKL Judul Sekolah'),
+        text(student['dinas'], 'PKL Isi Kecil', align='center'),
+        text(f"PROVINSI {student['provinsi'].upper()}", 'PKL Isi Kecil', align='center'),
+        heading(f"TAHUN {student['tahun']}", 'PKL Judul Kecil'),
+    ]
+
+    # Sel yang tidak terisi (pengesahan < 4 teks) dibiarkan kosong: None
+    pengesahan = (list(student['pengesahan'][:4]) + [None] * 4)[:4]
+    lembar_pengesahan = [
+        page_break,
+        heading('LEMBAR PENGESAHAN'),
+        blank,
+        text(f"Laporan Praktik Kerja Lapangan (PKL) ini disusun sebagai salah satu syarat untuk memenuhi kegiatan pembelajaran di {student['sekolah']}. Laporan ini telah disetujui dan disahkan pada:", align='justify'),
+        blank,
+        text('Hari/Tanggal : ____________________'),
+        text(f"Tempat       : {student['kota']}"),
+        blank,
+        ('table', (tuple(pengesahan[0:2]), tuple(pengesahan[2:4])), 'PKL Tabel', 'PKL Tabel', True),
+    ]
+
+    biodata_peserta = [
+        page_break,
+        heading('BIODATA PESERTA PKL'),
+        blank,
+        ('table', tuple(tuple(row) for row in biodata(student)), 'PKL Tabel', 'PKL Tabel Label', False),
+    ]
+
+    motto = [page_break, heading('MOTTO'), blank]
+    motto += [text(line, 'PKL Motto') for line in student['motto']]
+    motto += [blank, text(student['motto_sumber'], 'PKL Motto Sumber')]
+
+    bab1 = [
+        page_break,
+        heading('BAB I'),
+        heading('PENDAHULUAN'),
+        blank,
+        text('A. Latar Belakang', 'PKL Subbab'),
+        text(student['latar_belakang'], align='justify'),
+        blank,
+        text('B. Tujuan', 'PKL Subbab'),
+    ]
+    bab1 += [('bullet', line, 'PKL Bullet') for line in student['tujuan']]
+
+    bab2 = [
+        page_break,
+        heading('BAB II'),
+        heading('GAMBARAN UMUM INDUSTRI'),
+        blank,
+        text(f"A. Profil {student['perusahaan']}", 'PKL Subbab'),
+        text(student['profil'], align='justify'),
+        blank,
+        text('B. Visi dan Misi', 'PKL Subbab'),
+        text(f"Visi: {student['visi']}", 'PKL Isi Kecil', align='justify'),
+        blank,
+        text('C. Analisis SWOT', 'PKL Subbab'),
+    ]
+    bab2 += [text(line, 'PKL Isi Kecil') for line in student['swot']]
+
+    bab3 = [
+        page_break,
+        heading('BAB III'),
+        heading('PELAKSANAAN PKL'),
+        blank,
+        text('A. Kegiatan yang Dilakukan', 'PKL Subbab'),
+    ]
+    bab3 += [('bullet', line, 'PKL Bullet Kecil') for line in student['kegiatan']]
+    bab3 += [blank, text('B. Kompetensi yang Diperoleh', 'PKL Subbab')]
+    bab3 += [text(line, 'PKL Isi Kecil') for line in student['kompetensi']]
+
+    bab4 = [
+        page_break,
+        heading('BAB IV'),
+        heading('PENUTUP'),
+        blank,
+        text('A. Kesimpulan', 'PKL Subbab'),
+        text(student['kesimpulan'], align='justify'),
+        blank,
+        text('B. Saran', 'PKL Subbab'),
+    ]
+    bab4 += [text(line, 'PKL Isi Kecil') for line in student['saran']]
+
+    sections = [
+        ('sampul', "   → Membuat halaman sampul...", sampul),
+        ('pengesahan', "   → Membuat lembar pengesahan...", lembar_pengesahan),
+        ('biodata', "   → Membuat biodata...", biodata_peserta),
+        ('motto', "   → Membuat motto dan kata pengantar...", motto),
+        ('bab1', "   → Membuat BAB I...", bab1),
+        ('bab2', "   → Membuat BAB II...", bab2),
+        ('bab3', "   → Membuat BAB III...", bab3),
+        ('bab4', "   → Membuat BAB IV...", bab4),
+    ]
+
+    if photos:
+        lampiran = [
+            page_break,
+            heading('LAMPIRAN'),
+            heading('DOKUMENTASI KEGIATAN PKL', 'PKL Judul Kecil'),
+            blank,
+        ]
+        for no, data in enumerate(photos, start=1):
+            lampiran += [
+                ('image', data, 'PKL Foto', PHOTO_WIDTH_INCHES),
+                text(f"Foto {no}. Kegiatan PKL di {student['perusahaan']}", 'PKL Keterangan Foto'),
+            ]
+        sections.append(('lampiran', "   → Membuat lampiran foto...", lampiran))
+    return sections
+
+
+def report_styles(doc):
+    """{nama: ID style} REPORT_STYLES di ``doc``.
+
+    Setiap penugasan paragraph.style di python-docx menelusuri seluruh
+    styles.xml (~350 KB di template bawaan) mencari style default; ID
+    cukup dicari sekali lalu ditulis langsung ke <w:pStyle>.
+    """
+    return {name: doc.styles[name].style_id for name in REPORT_STYLES}
+
+
+def add_block(doc, block, styles=None):
+    """Tambahkan satu blok report_sections() ke ``doc`` lewat python-docx.
+
+    Tidak ada format langsung di run: semua lewat style paragraf.
+    ``styles`` = hasil report_styles(doc) (opsional, mempercepat).
+    """
+    if styles is None:
+        styles = report_styles(doc)
+    kind = block[0]
+    if kind == 'para':
+        _, text, style, align = block
+        p = doc.add_paragraph(text)
+        p._p.style = styles[style]
+        if align:
+            p.alignment = _alignment(align)
+    elif kind == 'bullet':
+        _, text, style = block
+        doc.add_paragraph(f'• {text}')._p.style = styles[style]
+    elif kind == 'image':
+        from docx.shared import Inches
+
+        _, data, style, width = block
+        p = doc.add_paragraph()
+        p._p.style = styles[style]
+        # python-docx memakai ulang image part jika byte-nya sama (SHA1)
+        p.add_run().add_picture(io.BytesIO(data), width=Inches(width))
+    elif kind == 'blank':
+        doc.add_paragraph(block[1])
+    elif kind == 'page_break':
+        doc.add_page_break()
+    elif kind == 'table':
+        _, rows, style, label_style, centered = block
+        table = doc.add_table(rows=len(rows), cols=len(rows[0]))
+        table.style = 'Table Grid'
+        for i, row in enumerate(rows):
+            for j, text in enumerate(row):
+                if text is None:
+                    continue
+                p = table.rows[i].cells[j].paragraphs[0]
+                p._p.style = styles[label_style if j == 0 else style]
+                if centered:
+                    p.alignment = _alignment('center')
+                p.add_run(text)
+    else:
+        raise ValueError(f"Jenis blok laporan tidak dikenal: {kind!r}")
+
+
+def build_report(student, photos=(), log=print):
+    """Bangun dokumen Word laporan PKL untuk satu siswa (python-docx).
+
+    Jalur referensi; pipeline memakai pklgen.report_template.render_report()
+    yang menghasilkan dokumen yang sama jauh lebih cepat.
+    """
+    doc = new_document()
+    styles = report_styles(doc)
+    for _, message, blocks in report_sections(student, photos):
+        log(message)
+        for block in blocks:
+            add_block(doc, block, styles)
+    return doc
@@ -0,0 +1,257 @@
+"""
+Template laporan Word yang sudah dikompilasi (STEP 2, jalur cepat).
+
+build_report() membangun dokumen lewat python-docx: setiap paragraf, run
+dan properti font adalah manipulasi elemen lxml satu per satu, lalu
+doc.save() men-deflate ulang ~800 KB styles.xml bawaan template. Untuk
+batch, pekerjaan itu hampir seluruhnya sama untuk setiap siswa.
+
+Di sini python-docx hanya dipakai sekali per proses per bentuk blok:
+
+- Setiap blok report_sections() dengan teks diganti sentinel dirender
+  sekali oleh python-docx (add_block), lalu XML-nya disimpan sebagai
+  fragmen: potongan XML tetap berselang-seling dengan slot teks.
+- Semua part docx selain word/document.xml, relasinya dan
+  [Content_Types].xml disimpan sekali sebagai ZIP yang sudah terkompresi.
+- Foto Lampiran: paragraf gambar dikompilasi sekali dengan slot untuk
+  id shape, rId dan ukuran. Relasi dan content type bergantung hanya pada
+  jumlah foto berbeda, jadi dibuat python-docx sekali per jumlah itu.
+  Foto yang sama (SHA1) memakai satu image part, seperti add_picture().
+
+Per siswa tinggal menyambung fragmen dengan teks yang sudah di-escape,
+lalu menambahkan word/document.xml (dan foto) ke salinan ZIP statis tersebut.
+Hasilnya document.xml yang identik byte-per-byte dengan build_report().
+"""
+
+import io
+import re
+import zipfile
+from functools import lru_cache
+from xml.sax.saxutils import escape, unescape
+
+from .report import add_block, build_report, new_document, report_sections, report_styles
+
+DOCUMENT_PART = 'word/document.xml'
+DOCUMENT_RELS_PART = 'word/_rels/document.xml.rels'
+CONTENT_TYPES_PART = '[Content_Types].xml'
+
+_SENTINEL = '@@PKL{}@@'
+# Seluruh <w:t> yang berisi sentinel (bisa diapit teks tetap, mis. "• ")
+_SLOT_RE = re.compile(r'<w:t>([^<]*?)@@PKL(\d+)@@([^<]*)</w:t>')
+_XMLNS_RE = re.compile(r' xmlns:\w+="[^"]*"')
+_RUN_SPLIT_RE = re.compile(r'([\t\r\n])')
+# Karakter kontrol lain ditolak lxml; blok seperti itu dirender langsung
+# oleh python-docx supaya error-nya sama
+_INVALID_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+# Atribut paragraf gambar yang berbeda per foto
+_SHAPE_ID_RE = re.compile(r'(<wp:docPr id=")\d+(" name="Picture )\d+(")')
+_EMBED_RE = re.compile(r'(r:embed=")rId\d+(")')
+_EXTENT_RE = re.compile(r'( cx=")\d+(" cy=")\d+(")')
+
+
+@lru_cache(maxsize=None)
+def _scratch():
+    """(dokumen kosong, style-nya) untuk merender blok; elemen dibuang setelah diserialisasi."""
+    doc = new_document()
+    return doc, report_styles(doc)
+
+
+@lru_cache(maxsize=None)
+def _skeleton():
+    """(ZIP part statis, XML sebelum isi body, XML sesudah isi body)."""
+    from docx.opc.oxml import serialize_part_xml
+
+    doc = new_document()
+    xml = serialize_part_xml(doc.element).decode('utf-8')
+    body_start = xml.index('<w:body>') + len('<w:body>')
+    head, tail = xml[:body_start], xml[xml.index('<w:sectPr', body_start):]
+
+    saved = io.BytesIO()
+    doc.save(saved)
+    static = io.BytesIO()
+    dynamic = (DOCUMENT_PART, DOCUMENT_RELS_PART, CONTENT_TYPES_PART)
+    with zipfile.ZipFile(saved) as src, zipfile.ZipFile(static, 'w', zipfile.ZIP_DEFLATED) as dst:
+        for info in src.infolist():
+            if info.filename not in dynamic:
+                dst.writestr(info, src.read(info))
+    return static.getvalue(), head, tail
+
+
+def _dummy_jpeg(index):
+    """JPEG kecil yang berbeda per ``index`` (hanya untuk membuat relasi)."""
+    from PIL import Image
+
+    buf = io.BytesIO()
+    # Lebar berbeda -> byte (dan SHA1) berbeda; warna mirip bisa ter-encode sama
+    Image.new('RGB', (index + 1, 1)).save(buf, 'JPEG')
+    return buf.getvalue()
+
+
+@lru_cache(maxsize=None)
+def _package_parts(count):
+    """([Content_Types].xml, document.xml.rels, [(rId, nama_part), ...]) untuk ``count`` foto berbeda."""
+    doc = new_document()
+    media = []
+    for index in range(count):
+        # Langkah yang sama dengan add_picture(), tanpa menyentuh document.xml
+        rid, _ = doc.part.get_or_add_image(io.BytesIO(_dummy_jpeg(index)))
+        media.append((rid, doc.part.related_parts[rid].partname.lstrip('/')))
+    saved = io.BytesIO()
+    doc.save(saved)
+    with zipfile.ZipFile(saved) as zf:
+        return zf.read(CONTENT_TYPES_PART), zf.read(DOCUMENT_RELS_PART), media
+
+
+def _strip_root_xmlns(xml):
+    """Buang deklarasi namespace di tag pembuka; di document.xml sudah ada di <w:document>.
+
+    Deklarasi di elemen yang lebih dalam (mis. a:/pic: di <wp:inline>) juga
+    ditulis python-docx, jadi dibiarkan.
+    """
+    end = xml.index('>')
+    return _XMLNS_RE.sub('', xml[:end]) + xml[end:]
+
+
+def _render_xml(block):
+    """XML satu blok persis seperti yang ditulis python-docx di document.xml."""
+    from lxml import etree
+
+    doc, styles = _scratch()
+    body = doc.element.body
+    before = len(body)
+    add_block(doc, block, styles)
+    # Blok baru disisipkan sebelum <w:sectPr> (elemen terakhir body)
+    new = list(body)[before - 1:len(body) - 1]
+    xml = ''.join(_strip_root_xmlns(etree.tostring(el, encoding='unicode')) for el in new)
+    for el in new:
+        body.remove(el)
+    return xml
+
+
+def _template_block(block):
+    """(blok dengan teks diganti sentinel, daftar teks asli)."""
+    kind = block[0]
+    if kind in ('para', 'bullet'):
+        return (kind, _SENTINEL.format(0)) + block[2:], [block[1]]
+    if kind == 'table':
+        texts, rows = [], []
+        for row in block[1]:
+            cells = []
+            for text in row:
+                if text is None:
+                    cells.append(None)
+                else:
+                    cells.append(_SENTINEL.format(len(texts)))
+                    texts.append(text)
+            rows.append(tuple(cells))
+        return (kind, tuple(rows)) + block[2:], texts
+    return block, []
+
+
+_fragments = {}
+
+
+def _fragment(template):
+    """[xml_tetap, (awalan, indeks_teks, akhiran), xml_tetap, ...]"""
+    parts = _fragments.get(template)
+    if parts is None:
+        split = _SLOT_RE.split(_render_xml(template))
+        parts = split[::4]
+        for i, slot in enumerate(range(1, len(split), 4)):
+            parts.insert(2 * i + 1, (unescape(split[slot]), int(split[slot + 1]),
+                                     unescape(split[slot + 2])))
+        _fragments[template] = parts
+    return parts
+
+
+@lru_cache(maxsize=None)
+def _image_fragment(style, width):
+    """Paragraf gambar dengan slot {sid}/{rid}/{cx}/{cy} (format str.format)."""
+    xml = _render_xml(('image', _dummy_jpeg(0), style, width))
+    # XML python-docx tidak pernah berisi kurung kurawal
+    xml = _SHAPE_ID_RE.sub(r'\1{sid}\2{sid}\3', xml)
+    xml = _EMBED_RE.sub(r'\1{rid}\2', xml)
+    return _EXTENT_RE.sub(r'\1{cx}\2{cy}\3', xml)
+
+
+def run_content(text):
+    """Isi <w:r> untuk ``text`` dengan aturan yang sama seperti run.text python-docx.
+
+    \t -> <w:tab/>, \n/\r -> <w:br/>, potongan teks lain -> <w:t> (dengan
+    xml:space="preserve" jika diawali/diakhiri spasi).
+    """
+    out = []
+    for piece in _RUN_SPLIT_RE.split(text):
+        if piece == '\t':
+            out.append('<w:tab/>')
+        elif piece in ('\r', '\n'):
+            out.append('<w:br/>')
+        elif piece:
+            space = ' xml:space="preserve"' if len(piece.strip()) < len(piece) else ''
+            out.append(f'<w:t{space}>{escape(piece)}</w:t>')
+    return ''.join(out)
+
+
+def block_xml(block):
+    """XML satu blok: dari fragmen terkompilasi jika bisa, selain itu python-docx."""
+    template, texts = _template_block(block)
+    if any(not text or _INVALID_RE.search(text) for text in texts):
+        # Teks kosong: python-docx tidak membuat run sama sekali
+        return _render_xml(block)
+    out = _fragment(template)[:]
+    for i in range(1, len(out), 2):
+        prefix, index, suffix = out[i]
+        out[i] = run_content(prefix + texts[index] + suffix)
+    return ''.join(out)
+
+
+def _load_photos(photos):
+    """[(sha1, Image python-docx)] per foto; None jika ada yang bukan JPEG."""
+    from docx.image.image import Image
+
+    images = [Image.from_blob(data) for data in photos]
+    if any(image.ext != 'jpg' for image in images):
+        return None
+    return [(image.sha1, image) for image in images]
+
+
+def render_report(student, photos=(), log=print):
+    """Byte .docx laporan ``student``; isi sama dengan build_report()."""
+    from docx.shared import Inches
+
+    photos = list(photos)
+    images = _load_photos(photos) if photos else []
+    if images is None:
+        # Relasi dikompilasi untuk .jpg saja; format lain lewat python-docx
+        out = io.BytesIO()
+        build_report(student, photos, log=log).save(out)
+        return out.getvalue()
+
+    static, head, tail = _skeleton()
+    content_types, rels, parts = _package_parts(len({sha1 for sha1, _ in images}))
+    xml = [head]
+    media = {}  # sha1 -> (indeks part, image)
+    shape_id = 0
+    for _, message, blocks in report_sections(student, photos):
+        log(message)
+        for block in blocks:
+            if block[0] != 'image':
+                xml.append(block_xml(block))
+                continue
+            sha1, image = images[shape_id]
+            shape_id += 1
+            index, _ = media.setdefault(sha1, (len(media), image))
+            cx, cy = image.scaled_dimensions(Inches(block[3]), None)
+            xml.append(_image_fragment(block[2], block[3]).format(
+                sid=shape_id, rid=parts[index][0], cx=cx, cy=cy))
+    xml.append(tail)
+
+    out = io.BytesIO(static)
+    with zipfile.ZipFile(out, 'a', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(CONTENT_TYPES_PART, content_types)
+        zf.writestr(DOCUMENT_RELS_PART, rels)
+        zf.writestr(DOCUMENT_PART, ''.join(xml).encode('utf-8'))
+        for (_, name), (_, image) in zip(parts, sorted(media.values(), key=lambda item: item[0])):
+            # JPEG sudah terkompresi
+            zf.writestr(name, image.blob, zipfile.ZIP_STORED)
+    return out.getvalue()
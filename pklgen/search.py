@@ -0,0 +1,271 @@
+"""
+Halaman angkatan + indeks pencarian statis untuk semua paket hasil batch.
+
+    <output>/index.html            halaman pencarian (satu file, tanpa server)
+    <output>/search/meta.json      daftar shard, stopword, bobot field
+    <output>/search/docs.json      [nama, nis, program keahlian, tempat PKL, tautan]
+    <output>/search/<xx>.json      kata berawalan <xx> -> posting
+
+Indeks terbalik dibuat dari data siswa (roster), bukan dari docx/HTML yang
+sudah jadi: nama/NIS, biodata sekolah dan tempat PKL, kompetensi, kegiatan
+dan SWOT. Data pribadi (telepon, alamat, orang tua, TTL) tidak diindeks.
+
+Kata di-shard berdasarkan dua huruf pertamanya, jadi browser hanya
+mengunduh meta.json, docs.json dan satu shard per kata yang diketik (kata
+boleh belum lengkap: pencarian berdasarkan awalan). Posting setiap kata
+berupa [selisih_id_dok, bobot, ...] (id dokumen naik, disimpan sebagai
+selisih supaya JSON-nya pendek). Beberapa kata digabung AND, hasil
+diurutkan berdasarkan jumlah bobot.
+
+fetch() tidak jalan dari file:// di kebanyakan browser: buka lewat GitHub
+Pages atau ``python -m http.server`` di folder output.
+"""
+
+import html
+import json
+import re
+import time
+import unicodedata
+from pathlib import Path
+
+from .site import HTML_CSS, minify_css, minify_js
+
+SEARCH_DIR = "search"
+SEARCH_VERSION = 1
+# Panjang awalan kata untuk nama shard (juga panjang minimal kata yang dicari)
+SHARD_PREFIX = 2
+# Berapa hasil yang ditampilkan halaman pencarian
+MAX_RESULTS = 50
+
+# (field, kunci data siswa, bobot per kemunculan)
+SEARCH_FIELDS = (
+    ('nama', ('nama', 'nis'), 8),
+    ('biodata', ('kelas', 'program_keahlian', 'sekolah', 'kota', 'provinsi', 'perusahaan',
+                 'perusahaan_keterangan', 'tempat_pkl', 'periode_pkl', 'tahun'), 4),
+    ('kompetensi', ('kompetensi',), 3),
+    ('kegiatan', ('kegiatan',), 2),
+    ('swot', ('swot',), 1),
+)
+
+STOPWORDS = frozenset("""
+adalah akan and atau bagi dalam dan dari dengan di ini itu juga ke oleh pada
+para sebagai secara serta the untuk yang
+""".split())
+
+_WORD = re.compile(r"[0-9a-z]+")
+_COMBINING = re.compile("[\u0300-\u036f]")
+
+
+def tokenize(text):
+    """Kata yang diindeks dari ``text`` (huruf kecil, tanpa diakritik, tanpa stopword).
+
+    Sama dengan tokens() di COHORT_SCRIPT, supaya kata yang diketik di
+    browser cocok dengan kata di indeks.
+    """
+    text = _COMBINING.sub("", unicodedata.normalize("NFKD", text.lower()))
+    return [word for word in _WORD.findall(text) if len(word) >= SHARD_PREFIX and word not in STOPWORDS]
+
+
+def _field_text(student, keys):
+    parts = []
+    for key in keys:
+        value = student.get(key, "")
+        parts.extend(value if isinstance(value, list) else [value])
+    return " ".join(str(part) for part in parts)
+
+
+def build_index(entries):
+    """Indeks terbalik untuk ``entries`` = [(student, tautan_index_html), ...].
+
+    Mengembalikan (docs, shards): ``docs`` = baris docs.json, ``shards`` =
+    {awalan: {kata: [selisih_id, bobot, ...]}}.
+    """
+    docs = []
+    postings = {}
+    for doc_id, (student, href) in enumerate(entries):
+        docs.append([student['nama'], student['nis'], student.get('program_keahlian', ''),
+                     student.get('tempat_pkl', ''), href])
+        weights = {}
+        for _, keys, weight in SEARCH_FIELDS:
+            for word in tokenize(_field_text(student, keys)):
+                weights[word] = weights.get(word, 0) + weight
+        for word, weight in weights.items():
+            postings.setdefault(word, []).append((doc_id, weight))
+
+    shards = {}
+    for word in sorted(postings):
+        flat, last = [], 0
+        for doc_id, weight in postings[word]:
+            flat += (doc_id - last, weight)
+            last = doc_id
+        shards.setdefault(word[:SHARD_PREFIX], {})[word] = flat
+    return docs, shards
+
+
+def _dump(data):
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _write_if_changed(path, data):
+    # Shard yang tidak berubah tidak ditulis ulang (mtime/ETag di hosting statis tetap)
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+def write_cohort_site(output_root, entries, title="Laporan PKL"):
+    """Tulis index.html angkatan + indeks pencarian ke ``output_root``.
+
+    ``entries`` = [(student, tautan_index_html_relatif), ...]. Shard lama
+    yang tidak dipakai lagi dihapus. Mengembalikan statistik (jumlah
+    dokumen, kata, shard, byte, detik).
+    """
+    start = time.perf_counter()
+    root = Path(output_root)
+    search_dir = root / SEARCH_DIR
+    search_dir.mkdir(parents=True, exist_ok=True)
+
+    docs, shards = build_index(entries)
+    files = {f"{prefix}.json": _dump(words) for prefix, words in shards.items()}
+    files["docs.json"] = _dump(docs)
+    files["meta.json"] = _dump({
+        'version': SEARCH_VERSION,
+        'docs': len(docs),
+        'prefix': SHARD_PREFIX,
+        'shards': sorted(shards),
+        'stop': sorted(STOPWORDS),
+        'fields': {name: weight for name, _, weight in SEARCH_FIELDS},
+    })
+    written = 0
+    for name, data in files.items():
+        written += _write_if_changed(search_dir / name, data)
+    for path in search_dir.glob("*.json"):
+        if path.name not in files:
+            path.unlink()
+    _write_if_changed(root / "index.html", render_cohort_html(title, len(docs)).encode("utf-8"))
+
+    shard_sizes = [len(data) for name, data in files.items() if name not in ("docs.json", "meta.json")]
+    return {
+        'docs': len(docs),
+        'terms': sum(len(words) for words in shards.values()),
+        'shards': len(shards),
+        'written': written,
+        'bytes': sum(len(data) for data in files.values()),
+        'shard_bytes_max': max(shard_sizes, default=0),
+        'seconds': time.perf_counter() - start,
+    }
+
+
+COHORT_CSS = HTML_CSS + """
+header input {
+    width: 100%;
+    max-width: 600px;
+    margin-top: 20px;
+    padding: 12px 18px;
+    font-size: 1.1em;
+    border: 2px solid #667eea;
+    border-radius: 30px;
+}
+section ol { list-style: none; }
+section li { padding: 12px 0; border-bottom: 1px solid #eee; }
+section li a { font-weight: bold; color: #2e75b6; text-decoration: none; }
+section li small { display: block; color: #7f8c8d; }
+"""
+
+# Ditulis untuk minify_js(): titik koma dan kurung kurawal lengkap, string
+# tanpa spasi di sekitar tanda baca
+COHORT_SCRIPT = """
+var q = document.getElementById('q');
+var out = document.getElementById('hasil');
+var info = document.getElementById('info');
+var index = null;
+var shards = {};
+function json(url) {
+    return fetch(url).then(function (r) { return r.json(); });
+}
+function load() {
+    if (!index) { index = Promise.all([json('search/meta.json'), json('search/docs.json')]); }
+    return index;
+}
+function tokens(s, m) {
+    var words = s.toLowerCase().normalize('NFKD').replace(/[\\u0300-\\u036f]/g, '').match(/[0-9a-z]+/g) || [];
+    return words.filter(function (w) { return w.length >= m.prefix && m.stop.indexOf(w) < 0; });
+}
+function shard(m, p) {
+    if (m.shards.indexOf(p) < 0) { return Promise.resolve({}); }
+    if (!shards[p]) { shards[p] = json('search/' + p + '.json'); }
+    return shards[p];
+}
+function scores(part, w) {
+    var found = {};
+    Object.keys(part).forEach(function (t) {
+        if (t.lastIndexOf(w, 0) !== 0) { return; }
+        var list = part[t];
+        var d = 0;
+        for (var i = 0; i < list.length; i += 2) { d += list[i]; found[d] = (found[d] || 0) + list[i + 1]; }
+    });
+    return found;
+}
+function show(docs, total) {
+    var ids = Object.keys(total).sort(function (a, b) { return total[b] - total[a]; });
+    out.textContent = '';
+    ids.slice(0, MAX_RESULTS).forEach(function (id) {
+        var d = docs[id];
+        var li = document.createElement('li');
+        var a = document.createElement('a');
+        var small = document.createElement('small');
+        a.href = d[4];
+        a.textContent = d[0];
+        small.textContent = [d[1], d[2], d[3]].join(' \\u00b7 ');
+        li.appendChild(a);
+        li.appendChild(small);
+        out.appendChild(li);
+    });
+    info.textContent = ids.length + ' hasil';
+}
+function search() {
+    var text = q.value;
+    load().then(function (r) {
+        var m = r[0];
+        var words = tokens(text, m);
+        if (!words.length) { out.textContent = ''; info.textContent = ''; return; }
+        return Promise.all(words.map(function (w) { return shard(m, w.slice(0, m.prefix)); })).then(function (parts) {
+            if (text !== q.value) { return; }
+            var total = null;
+            words.forEach(function (w, i) {
+                var found = scores(parts[i], w);
+                if (!total) { total = found; return; }
+                var both = {};
+                Object.keys(total).forEach(function (d) { if (d in found) { both[d] = total[d] + found[d]; } });
+                total = both;
+            });
+            show(r[1], total);
+        });
+    });
+}
+q.addEventListener('input', search);
+q.addEventListener('focus', load);
+if (q.value) { search(); }
+"""
+
+COHORT_STYLE_MIN = minify_css(COHORT_CSS)
+COHORT_SCRIPT_MIN = minify_js(COHORT_SCRIPT).replace("MAX_RESULTS", str(MAX_RESULTS))
+
+
+def render_cohort_html(title, count):
+    """index.html angkatan: kotak pencarian di atas indeks di search/."""
+    title = html.escape(title)
+    return (
+        '<!DOCTYPE html><html lang="id"><head><meta charset="UTF-8">'
+        '<meta name="viewport" content="width=device-width,initial-scale=1">'
+        f'<title>{title}</title><style>{COHORT_STYLE_MIN}</style></head>'
+        f'<body><main><header><h1>🔎 {title}</h1><p>{count} laporan siswa</p>'
+        '<input id="q" type="search" placeholder="Cari nama, kegiatan, kompetensi, tempat PKL..." autofocus>'
+        '</header><section><p id="info"></p><ol id="hasil"></ol>'
+        '<noscript>Pencarian butuh JavaScript.</noscript></section></main>'
+        f'<script>{COHORT_SCRIPT_MIN}</script></body></html>\n'
+    )
@@ -0,0 +1,570 @@
+"""
+Template README.md, index.html dan file pendukung (STEP 3-5).
+
+Template README.md dan file pendukung di-compile sekali saat modul
+di-import lalu diisi per siswa dengan string.Template ($nama, $nis, ...);
+bagian daftar README (SWOT, kegiatan, kompetensi, saran, dokumentasi)
+dibuat dari data siswa dan nama foto hasil ekstraksi.
+index.html dirender dari tata letak laporan Word (pklgen.report.
+report_sections), jadi isi setiap bagiannya sama dengan docx; semua teks
+di-escape dan hasilnya sudah diminifikasi.
+"""
+
+import html
+import re
+from string import Template
+
+from .content import docx_filename
+from .report import REPORT_STYLES, report_sections
+
+README_TEMPLATE = Template("""# 📘 LAPORAN PRAKTIK KERJA LAPANGAN (PKL)
+## $PERUSAHAAN - $perusahaan_keterangan
+
+<div align="center">
+
+**Oleh: $NAMA**  
+**NIS: $nis**  
+**Kelas $kelas - $program_keahlian**
+
+**UPTD $sekolah**  
+**Provinsi $provinsi**
+
+[![GitHub Pages](https://img.shields.io/badge/GitHub-Pages-blue?style=for-the-badge&logo=github)](https://github.com)
+[![Status](https://img.shields.io/badge/Status-Completed-success?style=for-the-badge)](README.md)
+
+</div>
+
+---
+
+## 📋 Navigasi Cepat
+
+| [🏠 Beranda](#-beranda) | [🏢 Profil](#-profil-industri) | [📊 SWOT](#-analisis-swot) | [💼 Kegiatan](#-kegiatan) |
+|:---:|:---:|:---:|:---:|
+| [🛠️ Kompetensi](#️-kompetensi) | [📸 Dokumentasi](#-dokumentasi) | [📝 Kesimpulan](#-kesimpulan) | [📥 Download](#-download) |
+
+---
+
+## 🏠 Beranda
+
+Selamat datang di dokumentasi lengkap PKL di **$perusahaan**, $perusahaan_keterangan!
+
+### 📊 Statistik PKL
+
+```
+✅ Periode: $periode_pkl
+✅ Tempat: $tempat_pkl
+✅ Kegiatan: $jumlah_kegiatan jenis
+✅ Dokumentasi: $jumlah_foto foto
+```
+
+---
+
+## 🏢 Profil Industri
+
+### $perusahaan
+
+**Status:** $perusahaan_keterangan  
+**Lokasi:** $kota, $provinsi  
+**Direktur:** $direktur
+
+$profil
+
+#### 🎯 Visi
+$visi_md
+
+---
+
+## 📊 Analisis SWOT
+
+$swot_md
+
+---
+
+## 💼 Kegiatan
+
+### 🔧 Kegiatan Utama
+
+$kegiatan_md
+
+---
+
+## 🛠️ Kompetensi
+
+$kompetensi_md
+
+---
+
+## 📸 Dokumentasi
+
+$dokumentasi_md
+
+---
+
+## 📝 Kesimpulan
+
+$kesimpulan_md
+
+### 💡 Saran
+$saran_md
+
+---
+
+## 📥 Download
+
+[![Download DOCX](https://img.shields.io/badge/Download-Laporan%20Lengkap-success?style=for-the-badge)]($docx_name)
+
+---
+
+<div align="center">
+
+**© $tahun $nama - PKL $sekolah**
+
+*Dibuat dengan ❤️ untuk dokumentasi PKL*
+
+</div>
+""")
+
+# index.html: satu file, tanpa CSS/JS eksternal. CSS dan JS ditulis rapi di
+# sini lalu diminifikasi sekali saat modul di-import; markup dibuat tanpa
+# spasi/indentasi oleh render_html().
+HTML_CSS = """
+* { margin: 0; padding: 0; box-sizing: border-box; }
+[hidden] { display: none !important; }
+body {
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    min-height: 100vh;
+    padding: 20px;
+    color: #2c3e50;
+    line-height: 1.6;
+}
+main { max-width: 1200px; margin: 0 auto; }
+header, section {
+    background: rgba(255,255,255,0.95);
+    border-radius: 15px;
+    box-shadow: 0 10px 30px rgba(0,0,0,0.2);
+}
+header { padding: 30px; text-align: center; margin-bottom: 30px; }
+header h1 { font-size: 2em; line-height: 1.2; }
+header p, header h3 { color: #7f8c8d; }
+h2 { text-align: center; margin-bottom: 10px; }
+h2.co { color: #2e75b6; }
+h3 { margin: 15px 0 5px; }
+.c { text-align: center; }
+.j { text-align: justify; }
+.i { font-style: italic; }
+.b { font-weight: bold; }
+ul { margin: 5px 0 10px 25px; }
+table { width: 100%; border-collapse: collapse; margin: 15px 0; }
+td, th { border: 1px solid #ccc; padding: 8px; vertical-align: top; text-align: left; }
+td.c { text-align: center; }
+nav {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+    gap: 20px;
+    margin-bottom: 30px;
+}
+nav a {
+    background: white;
+    border-radius: 15px;
+    padding: 30px;
+    text-align: center;
+    transition: all 0.3s ease;
+    box-shadow: 0 5px 15px rgba(0,0,0,0.1);
+    text-decoration: none;
+    color: inherit;
+    display: block;
+}
+nav a:hover, nav a:focus { transform: translateY(-10px); box-shadow: 0 15px 30px rgba(0,0,0,0.2); }
+nav .icon { font-size: 3em; margin-bottom: 15px; }
+section { padding: 40px; animation: fadeIn 0.5s; }
+@keyframes fadeIn {
+    from { opacity: 0; transform: translateY(20px); }
+    to { opacity: 1; transform: translateY(0); }
+}
+.back {
+    display: inline-block;
+    background: #e74c3c;
+    color: white;
+    padding: 10px 20px;
+    border-radius: 5px;
+    margin-bottom: 20px;
+    text-decoration: none;
+}
+.back:hover { background: #c0392b; }
+.gallery {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+    gap: 20px;
+    margin: 30px 0;
+}
+figure { text-align: center; font-size: 0.9em; font-style: italic; }
+picture { display: block; }
+figure img {
+    width: 100%;
+    height: 250px;
+    object-fit: cover;
+    border-radius: 10px;
+    box-shadow: 0 5px 15px rgba(0,0,0,0.2);
+    background: #eee;
+}
+footer { text-align: center; color: white; padding: 20px; margin-top: 30px; }
+"""
+
+# Navigasi lewat hash (#bab1, ...): tombol back browser dan tautan langsung
+# ke satu bagian ikut berfungsi. Gambar di bagian yang tersembunyi hanya
+# punya data-src/data-srcset; baru dimuat saat bagiannya dibuka, atau lebih
+# awal saat kartu navigasinya disorot/difokus.
+HTML_SCRIPT = """
+var nav = document.getElementById('nav');
+function load(s) {
+    s.querySelectorAll('[data-src],[data-srcset]').forEach(function (e) {
+        if (e.dataset.srcset) { e.srcset = e.dataset.srcset; e.removeAttribute('data-srcset'); }
+        if (e.dataset.src) { e.src = e.dataset.src; e.removeAttribute('data-src'); }
+    });
+}
+function target(hash) {
+    var s = hash.length > 1 && document.getElementById(hash.slice(1));
+    return s && s.tagName === 'SECTION' ? s : null;
+}
+function show() {
+    var s = target(location.hash);
+    document.querySelectorAll('section').forEach(function (e) { e.hidden = e !== s; });
+    nav.hidden = !!s;
+    if (s) { load(s); }
+    scrollTo(0, 0);
+}
+function preload(e) {
+    var a = e.target.closest && e.target.closest('a');
+    var s = a && target(a.hash || '');
+    if (s) { load(s); }
+}
+nav.addEventListener('pointerover', preload);
+nav.addEventListener('focusin', preload);
+addEventListener('hashchange', show);
+show();
+"""
+
+
+def minify_css(css):
+    """CSS tanpa komentar dan spasi yang tidak perlu (dipakai juga pklgen.search)."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{}:;,>])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def minify_js(js):
+    """Gabungkan baris script dan buang spasi di sekitar tanda baca.
+
+    Hanya untuk script yang ditulis dengan titik koma dan kurung kurawal
+    lengkap (baris boleh digabung) dan string tanpa spasi di sekitar tanda
+    baca, seperti HTML_SCRIPT dan pklgen.search.COHORT_SCRIPT.
+    """
+    js = "".join(line.strip() for line in js.splitlines())
+    return re.sub(r"\s*([{}()\[\];,=:?<>!&|+])\s*", r"\1", js)
+
+
+HTML_STYLE_MIN = minify_css(HTML_CSS)
+HTML_SCRIPT_MIN = minify_js(HTML_SCRIPT)
+
+# Kartu navigasi per bagian laporan (kunci report_sections): ikon, judul,
+# keterangan. Sampul menjadi header halaman, bukan kartu.
+HTML_NAV = {
+    'pengesahan': ('✍️', 'Pengesahan', 'Lembar pengesahan'),
+    'biodata': ('👤', 'Biodata', 'Peserta PKL'),
+    'motto': ('💬', 'Motto', 'Kata penyemangat'),
+    'bab1': ('🏠', 'Pendahuluan', 'Latar belakang & tujuan'),
+    'bab2': ('🏢', 'Profil Industri', 'Profil, visi & SWOT'),
+    'bab3': ('💼', 'Kegiatan', 'Kegiatan & kompetensi'),
+    'bab4': ('📝', 'Penutup', 'Kesimpulan & saran'),
+    'lampiran': ('📸', 'Dokumentasi', 'Galeri foto'),
+}
+
+# Style laporan (REPORT_STYLES) yang menjadi judul; sisanya <p>
+HTML_HEADINGS = {
+    'PKL Judul Sampul': 'h1',
+    'PKL Judul Perusahaan': 'h2',
+    'PKL Judul': 'h2',
+    'PKL Judul Sekolah': 'h3',
+    'PKL Judul Kecil': 'h3',
+    'PKL Subbab': 'h3',
+}
+
+GITIGNORE = """__pycache__/
+*.pyc
+.DS_Store
+Thumbs.db
+*.tmp
+"""
+
+QUICKSTART = """# ⚡ Quick Start
+
+## Upload ke GitHub (5 Menit)
+
+1. Buka https://github.com/new
+2. Nama: `pkl-laporan`
+3. Public ✅
+4. Upload semua file dari folder `PKL_Complete_Package`
+5. Settings → Pages → Enable (main, root)
+6. Done! Akses di `https://username.github.io/pkl-laporan`
+
+## Tips
+- Buat QR Code untuk presentasi
+- Share link di LinkedIn
+- Add to portfolio
+"""
+
+LICENSE_TEMPLATE = Template("""MIT License
+
+Copyright (c) $tahun $nama - $sekolah
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction.
+""")
+
+
+def template_values(student):
+    """Nilai placeholder template untuk satu siswa."""
+    values = {key: value for key, value in student.items() if isinstance(value, str)}
+    values.update(
+        NAMA=student['nama'].upper(),
+        PERUSAHAAN=student['perusahaan'].upper(),
+        visi_kutipan=student['visi'].rstrip('.'),
+        docx_name=docx_filename(student),
+    )
+    return values
+
+
+def template_inputs(template, values):
+    """Teks template + hanya nilai yang benar-benar dipakai template itu.
+
+    Dipakai manifest build: README tidak perlu dibuat ulang jika yang
+    berubah hanya data yang tidak muncul di README (mis. alamat).
+    """
+    names = set()
+    for match in template.pattern.finditer(template.template):
+        name = match.group('named') or match.group('braced')
+        if name:
+            names.add(name)
+    return template.template, {name: values.get(name) for name in sorted(names)}
+
+
+# Judul dan ikon item "Label: a, b, c" di SWOT/kompetensi README
+README_LABELS = {
+    'Strengths': ('💪', '✅'),
+    'Weaknesses': ('⚠️', '⚠️'),
+    'Opportunities': ('🌟', '🎯'),
+    'Threats': ('⚡', '⚠️'),
+    'Hard Skills': ('💻', '✅'),
+    'Soft Skills': ('🎯', '⭐'),
+}
+
+
+def _labelled_md(items):
+    """["Strengths: a, b", ...] -> subjudul ### per label + daftar poin."""
+    lines = []
+    for item in items:
+        label, sep, rest = item.partition(':')
+        if not sep:
+            lines.append(f"- {item}")
+            continue
+        label = label.strip()
+        heading_icon, bullet = README_LABELS.get(label, ('📌', '-'))
+        if lines:
+            lines.append("")
+        lines.append(f"### {heading_icon} {label}")
+        points = [point.strip() for point in rest.split(',') if point.strip()]
+        lines.extend(f"- {bullet} {point[:1].upper()}{point[1:]}" for point in points)
+    return "\n".join(lines)
+
+
+def _quote_md(text, template='{}'):
+    """Blockquote markdown; teks multi-baris (mis. dari prefill PDF) tetap satu kutipan."""
+    return "\n>\n".join(f"> {template.format(line.strip())}" for line in text.split("\n") if line.strip())
+
+
+def readme_values(student, photo_names=()):
+    """Nilai README_TEMPLATE: template_values() + bagian daftar dari data siswa.
+
+    ``photo_names`` = foto hasil STEP 1 ("images/foto_1.jpg", ...) untuk
+    bagian Dokumentasi.
+    """
+    # foto_2 sebelum foto_10, sama dengan galeri index.html
+    photo_names = sorted(photo_names, key=lambda name: (len(name), name))
+    values = template_values(student)
+    values.update(
+        jumlah_kegiatan=str(len(student['kegiatan'])),
+        jumlah_foto=str(len(photo_names)),
+        visi_md=_quote_md(values['visi_kutipan'], '"{}"'),
+        kesimpulan_md=_quote_md(student['kesimpulan'], '*{}*'),
+        swot_md=_labelled_md(student['swot']),
+        kegiatan_md="\n".join(f"{i}. {item}" for i, item in enumerate(student['kegiatan'], start=1)),
+        kompetensi_md=_labelled_md(student['kompetensi']),
+        saran_md="\n".join(f"- {item}" for item in student['saran']),
+        dokumentasi_md="\n".join(
+            [f"![Kegiatan {i}]({name})" for i, name in enumerate(photo_names, start=1)]
+            + ["", f"*{len(photo_names)} foto dokumentasi tersedia di folder images/*" if photo_names
+               else "*Belum ada foto dokumentasi*"]
+        ).lstrip("\n"),
+    )
+    return values
+
+
+def render_readme(student, photo_names=None):
+    """README.md; ``photo_names`` = foto hasil STEP 1 (None = foto_1..8 default)."""
+    if photo_names is None:
+        photo_names = [name for name, _ in default_gallery()]
+    return README_TEMPLATE.substitute(readme_values(student, photo_names))
+
+
+# Lebar kolom galeri (lihat .gallery di HTML_CSS) untuk atribut sizes
+GALLERY_SIZES = "(max-width: 700px) 100vw, 400px"
+
+
+def default_gallery():
+    """Entri galeri foto_1..8 tanpa thumbnail (sebelum foto diekstrak)."""
+    return [(f"images/foto_{i}.jpg", []) for i in range(1, 9)]
+
+
+def picture_html(entry, alt):
+    """<picture>/<img> satu foto galeri yang baru dimuat saat bagiannya dibuka.
+
+    ``entry`` = (nama_foto, [(lebar, jpeg, webp), ...]) dari
+    pklgen.images.gallery_entries(); tanpa thumbnail dipakai foto aslinya.
+    """
+    photo_name, thumbs = entry
+    alt = html.escape(alt)
+    if not thumbs:
+        return f'<img data-src="{photo_name}" alt="{alt}" loading="lazy" decoding="async">'
+    webp_srcset = ", ".join(f"{webp} {width}w" for width, _, webp in thumbs)
+    jpeg_srcset = ", ".join(f"{jpeg} {width}w" for width, jpeg, _ in thumbs)
+    return (f'<picture><source type="image/webp" data-srcset="{webp_srcset}" sizes="{GALLERY_SIZES}">'
+            f'<img data-src="{thumbs[-1][1]}" data-srcset="{jpeg_srcset}" sizes="{GALLERY_SIZES}" '
+            f'alt="{alt}" loading="lazy" decoding="async"></picture>')
+
+
+def _text_html(value):
+    return "<br>".join(html.escape(line) for line in value.split("\n"))
+
+
+def _para_html(text, style, align):
+    tag = HTML_HEADINGS.get(style, 'p')
+    spec = REPORT_STYLES.get(style, {})
+    classes = []
+    if style == 'PKL Judul Perusahaan':
+        classes.append('co')
+    align = align or spec.get('align')
+    if tag == 'p' and align in ('center', 'justify'):
+        classes.append(align[0])
+    if tag == 'p' and spec.get('italic'):
+        classes.append('i')
+    if tag == 'p' and spec.get('bold'):
+        classes.append('b')
+    attr = f' class="{" ".join(classes)}"' if classes else ''
+    return f"<{tag}{attr}>{_text_html(text)}</{tag}>"
+
+
+def _table_html(rows, style, first_style, center):
+    td = '<td class="c">' if center else '<td>'
+    out = ["<table>"]
+    for row in rows:
+        out.append("<tr>")
+        for col, value in enumerate(row):
+            # Kolom pertama dengan style lain (label biodata) menjadi <th>
+            if col == 0 and first_style != style:
+                out.append(f"<th>{_text_html(value or '')}</th>")
+            else:
+                out.append(f"{td}{_text_html(value or '')}</td>")
+        out.append("</tr>")
+    out.append("</table>")
+    return "".join(out)
+
+
+def blocks_html(blocks):
+    """Blok report_sections() sebagai HTML (blok 'image' berisi entri galeri).
+
+    Bullet berurutan menjadi satu <ul>, foto + keterangannya menjadi
+    <figure> di dalam satu <div class="gallery">. Baris kosong dan page
+    break tidak dirender (jarak diatur CSS).
+    """
+    out, group = [], None
+
+    def open_group(kind):
+        nonlocal group
+        if group != kind:
+            if group:
+                out.append({'ul': '</ul>', 'gallery': '</div>'}[group])
+            if kind:
+                out.append({'ul': '<ul>', 'gallery': '<div class="gallery">'}[kind])
+            group = kind
+
+    i = 0
+    while i < len(blocks):
+        block = blocks[i]
+        kind = block[0]
+        if kind == 'bullet':
+            open_group('ul')
+            out.append(f"<li>{_text_html(block[1])}</li>")
+        elif kind == 'image':
+            open_group('gallery')
+            caption = ''
+            if i + 1 < len(blocks) and blocks[i + 1][0] == 'para' and blocks[i + 1][2] == 'PKL Keterangan Foto':
+                i += 1
+                caption = blocks[i][1]
+            out.append(f"<figure>{picture_html(block[1], caption)}"
+                       f"<figcaption>{html.escape(caption)}</figcaption></figure>")
+        elif kind in ('para', 'table'):
+            open_group(None)
+            out.append(_para_html(*block[1:]) if kind == 'para' else _table_html(*block[1:]))
+        i += 1
+    open_group(None)
+    return "".join(out)
+
+
+def render_html(student, gallery=None):
+    """index.html satu file yang sudah diminifikasi.
+
+    Setiap bagian dibuat dari report_sections() (tata letak laporan Word
+    yang sama); ``gallery`` = entri untuk Lampiran seperti hasil
+    pklgen.images.gallery_entries() (None = foto_1..8 default).
+    """
+    sections = report_sections(student, gallery or default_gallery())
+    values = {key: html.escape(value) for key, value in template_values(student).items()}
+
+    header = ""
+    cards, bodies = [], []
+    for key, _, blocks in sections:
+        if key not in HTML_NAV:
+            header = blocks_html(blocks)
+            continue
+        icon, title, subtitle = HTML_NAV[key]
+        cards.append(f'<a href="#{key}"><div class="icon">{icon}</div><h3>{title}</h3><p>{subtitle}</p></a>')
+        bodies.append(f'<section id="{key}" hidden><a class="back" href="#">← Kembali</a>'
+                      f'{blocks_html(blocks)}</section>')
+    cards.append(f'<a href="{values["docx_name"]}" download><div class="icon">📥</div>'
+                 f'<h3>Download</h3><p>Laporan DOCX</p></a>')
+
+    return (
+        '<!DOCTYPE html><html lang="id"><head><meta charset="UTF-8">'
+        '<meta name="viewport" content="width=device-width,initial-scale=1">'
+        f'<title>Laporan PKL - {values["nama"]}</title><style>{HTML_STYLE_MIN}</style></head>'
+        f'<body><main><header>{header}</header><nav id="nav">{"".join(cards)}</nav>{"".join(bodies)}'
+        f'<footer><p>© {values["tahun"]} {values["nama"]} - {values["sekolah"]}</p>'
+        '<p>Dibuat dengan ❤️ untuk PKL</p></footer></main>'
+        f'<script>{HTML_SCRIPT_MIN}</script></body></html>\n'
+    )
+
+
+def render_license(student):
+    return LICENSE_TEMPLATE.substitute(template_values(student))
+
+
+def support_files(student):
+    """File pendukung STEP 5: {nama_file: isi}."""
+    return {
+        '.gitignore': GITIGNORE,
+        'QUICKSTART.md': QUICKSTART,
+        'LICENSE': render_license(student),
+    }
@@ -0,0 +1,345 @@
+"""
+Mode --watch: bangun ulang paket begitu konten, template atau PDF sumber
+diubah, dan muat ulang browser lewat server HTTP lokal.
+
+    python generate_all_pkl.py --watch          # buka http://127.0.0.1:8000/
+
+Yang dipantau: pklgen/content.py (DEFAULT_STUDENT), template laporan dan
+situs (report.py, report_template.py, site.py) dan PDF sumber. Di Linux
+lewat inotify (ctypes, tanpa dependensi); di OS lain mtime file dicek
+setiap POLL_INTERVAL detik.
+
+Modul yang berubah di-reload di proses ini dan nama yang diimpor modul
+pklgen lain darinya ("from .content import ...") diarahkan ke objek baru,
+lalu build_package() inkremental dijalankan lagi: hanya step yang inputnya
+berubah yang ditulis ulang (lihat pklgen.manifest). Modul lain tidak
+di-reload, jadi cache-nya (template docx, python-docx, Pillow) tetap
+hangat dan edit teks sampai index.html tertulis hanya puluhan milidetik.
+Begitu index.html ditulis, sebelum docx dan ZIP selesai, server mengirim
+event reload (Server-Sent Events) ke halaman yang sedang dibuka.
+
+Server hanya menyajikan folder paket. Script live reload disisipkan ke
+HTML saat dikirim; file di disk dan di ZIP tidak berubah.
+"""
+
+import ctypes
+import importlib
+import json
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+# Modul konten/template yang dipantau
+WATCHED_MODULES = ('content', 'report', 'report_template', 'site')
+# Modul dengan state saat import (cache, CSS gabungan) yang dibuat dari modul
+# lain: ikut di-reload jika modul itu berubah
+RELOAD_WITH = {
+    'report': ('report_template',),
+    'site': ('search',),
+}
+# Urutan reload: setiap modul setelah modul yang diimpornya
+RELOAD_ORDER = ('content', 'report', 'report_template', 'site', 'search')
+# Editor menyimpan file dalam beberapa tulisan/rename: event yang datang
+# dalam jeda ini digabung jadi satu rebuild
+DEBOUNCE = 0.02
+POLL_INTERVAL = 0.1
+# Komentar SSE berkala supaya koneksi browser yang sudah ditutup terdeteksi
+KEEPALIVE = 15
+EVENTS_PATH = "/__livereload"
+
+# inotify(7)
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+# Antrian event kernel penuh (wd = -1): event yang hilang tidak diketahui
+IN_Q_OVERFLOW = 0x4000
+_EVENT = struct.Struct("iIII")
+
+LIVERELOAD_SCRIPT = (
+    "<script>new EventSource('" + EVENTS_PATH + "').onmessage=function(e){"
+    "var p=decodeURIComponent(location.pathname.slice(1))||'index.html';"
+    "if(p.slice(-1)==='/'){p+='index.html';}"
+    "if(JSON.parse(e.data).indexOf(p)>=0){location.reload();}};</script>"
+)
+
+
+def watched_files(pdf_path):
+    """File yang memicu rebuild: modul konten/template + PDF sumber."""
+    package_dir = Path(__file__).parent
+    return [package_dir / f"{name}.py" for name in WATCHED_MODULES] + [Path(pdf_path)]
+
+
+def reload_modules(changed):
+    """Reload modul pklgen untuk file ``changed`` (+ RELOAD_WITH) dan perbarui importirnya.
+
+    Di modul pklgen lain, nama global yang masih menunjuk objek lama dari
+    modul yang di-reload (hasil "from .x import y", nama sama) diganti
+    objek barunya. Mengembalikan nama modul yang di-reload. SyntaxError dan
+    error lain saat import diteruskan; modul yang gagal tetap versi lama.
+    """
+    names = {Path(path).stem for path in changed} & set(RELOAD_ORDER)
+    for name in list(names):
+        names.update(RELOAD_WITH.get(name, ()))
+    prefix = f"{__package__}."
+    reloaded = []
+    old_globals = []
+    for name in RELOAD_ORDER:
+        module = sys.modules.get(prefix + name)
+        if name in names and module is not None:
+            before = dict(vars(module))
+            importlib.reload(module)
+            old_globals.append((before, module))
+            reloaded.append(name)
+    for module_name, module in list(sys.modules.items()):
+        if not module_name.startswith(prefix) or module_name[len(prefix):] in reloaded:
+            continue
+        namespace = vars(module)
+        for key, value in list(namespace.items()):
+            for before, new_module in old_globals:
+                if not key.startswith("__") and before.get(key) is value and hasattr(new_module, key):
+                    namespace[key] = getattr(new_module, key)
+    return reloaded
+
+
+class _Inotify:
+    """inotify pada folder file yang dipantau (rename oleh editor tetap terdeteksi)."""
+
+    def __init__(self, paths):
+        libc = ctypes.CDLL(None, use_errno=True)
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1")
+        self._dirs = {}
+        self._paths = {path.resolve() for path in paths}
+        for folder in {path.parent for path in self._paths}:
+            wd = libc.inotify_add_watch(self._fd, os.fsencode(folder), IN_CLOSE_WRITE | IN_MOVED_TO)
+            if wd < 0:
+                os.close(self._fd)
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch {folder}")
+            self._dirs[wd] = folder
+
+    def read(self, timeout):
+        """File dipantau yang berubah dalam ``timeout`` detik (None = tunggu terus).
+
+        Jika antrian event inotify meluap, semua file dipantau dianggap
+        berubah (rebuild penuh), karena event yang hilang tidak diketahui.
+        """
+        if not select.select([self._fd], [], [], timeout)[0]:
+            return set()
+        changed = set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                changed.update(self._paths)
+                continue
+            folder = self._dirs.get(wd)
+            if folder is None:
+                # Watch yang sudah dilepas (IN_IGNORED) atau event sisa
+                continue
+            path = folder / os.fsdecode(name)
+            if path in self._paths:
+                changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self._fd)
+
+
+class _Poller:
+    """Pengganti inotify: cek (mtime, ukuran) setiap POLL_INTERVAL detik."""
+
+    def __init__(self, paths):
+        self._stats = {path.resolve(): self._stat(path) for path in paths}
+
+    @staticmethod
+    def _stat(path):
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def read(self, timeout):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = set()
+            for path, before in self._stats.items():
+                now = self._stat(path)
+                if now != before:
+                    self._stats[path] = now
+                    changed.add(path)
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+            time.sleep(POLL_INTERVAL if deadline is None else min(POLL_INTERVAL, max(deadline - time.monotonic(), 0)))
+
+    def close(self):
+        pass
+
+
+class FileWatcher:
+    """Menunggu perubahan pada ``paths``; inotify di Linux, polling di OS lain."""
+
+    def __init__(self, paths):
+        try:
+            self._backend = _Inotify(paths)
+            self.method = "inotify"
+        except (OSError, AttributeError):
+            # Bukan Linux (libc tanpa inotify_init1) atau batas inotify habis
+            self._backend = _Poller(paths)
+            self.method = "polling"
+
+    def wait(self):
+        """Blok sampai ada perubahan; mengembalikan (file_berubah, waktu_deteksi)."""
+        changed = set()
+        while not changed:
+            changed = self._backend.read(None)
+        detected = time.perf_counter()
+        while True:
+            more = self._backend.read(DEBOUNCE)
+            if not more:
+                return changed, detected
+            changed |= more
+
+    def close(self):
+        self._backend.close()
+
+
+class _Handler(SimpleHTTPRequestHandler):
+    """File statis folder paket + event reload di EVENTS_PATH."""
+
+    def do_GET(self):
+        if self.path == EVENTS_PATH:
+            return self._events()
+        path = Path(self.translate_path(self.path))
+        if path.is_dir() and self.path.endswith("/"):
+            path = path / "index.html"
+        if path.suffix == ".html" and path.is_file():
+            return self._html(path)
+        return super().do_GET()
+
+    def end_headers(self):
+        # Selalu ambil versi terbaru setelah reload
+        self.send_header("Cache-Control", "no-store")
+        super().end_headers()
+
+    def _html(self, path):
+        text = path.read_text(encoding="utf-8")
+        at = text.rfind("</body>")
+        at = len(text) if at < 0 else at
+        body = (text[:at] + LIVERELOAD_SCRIPT + text[at:]).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _events(self):
+        server = self.server
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        seen = len(server.changes)
+        try:
+            while not server.closing:
+                with server.changed:
+                    server.changed.wait_for(lambda: len(server.changes) > seen or server.closing, KEEPALIVE)
+                    names = sorted({name for batch in server.changes[seen:] for name in batch})
+                    seen = len(server.changes)
+                message = f"data: {json.dumps(names)}\n\n" if names else ": ping\n\n"
+                self.wfile.write(message.encode("utf-8"))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LiveReloadServer:
+    """Server HTTP folder ``root`` di thread latar; notify() memuat ulang halaman yang terbuka."""
+
+    def __init__(self, root, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self._httpd = ThreadingHTTPServer((host, port), partial(_Handler, directory=str(root)))
+        self._httpd.daemon_threads = True
+        self._httpd.changes = []
+        self._httpd.changed = threading.Condition()
+        self._httpd.closing = False
+        host, port = self._httpd.server_address[:2]
+        self.url = f"http://{host}:{port}/"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="pkl-livereload", daemon=True)
+        self._thread.start()
+
+    def notify(self, names):
+        """Kirim ``names`` (path relatif yang baru ditulis) ke semua halaman yang terbuka."""
+        with self._httpd.changed:
+            self._httpd.changes.append(list(names))
+            self._httpd.changed.notify_all()
+
+    def close(self):
+        with self._httpd.changed:
+            self._httpd.closing = True
+            self._httpd.changed.notify_all()
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+def watch_package(build, paths, output_dir, host=DEFAULT_HOST, port=DEFAULT_PORT, log=print):
+    """Jalankan ``build(on_step)`` setiap kali salah satu ``paths`` berubah, sampai Ctrl+C.
+
+    ``build`` = fungsi yang menjalankan build_package(..., on_step=on_step)
+    dengan data dari modul yang sudah di-reload; mengembalikan hasilnya.
+    Error saat reload atau build dicetak dan watcher jalan terus.
+    """
+    try:
+        server = LiveReloadServer(output_dir, host, port)
+    except OSError as e:
+        log(f"❌ Server live reload tidak bisa dijalankan di {host}:{port}: {e}")
+        return 1
+    watcher = FileWatcher(paths)
+    log(f"👀 Memantau {len(paths)} file ({watcher.method}); live reload di {server.url}")
+    log("   Ctrl+C untuk berhenti")
+    try:
+        while True:
+            changed, detected = watcher.wait()
+            stamp = time.strftime("%H:%M:%S")
+            log(f"🔄 [{stamp}] {', '.join(sorted(path.name for path in changed))} berubah")
+            written = {}
+
+            def on_step(step, names):
+                written[step] = time.perf_counter() - detected
+                server.notify(names)
+
+            try:
+                reload_modules(changed)
+                result = build(on_step)
+            except Exception as e:
+                log(f"   ❌ {type(e).__name__}: {e}")
+                continue
+            if not written:
+                log("   ↷ Tidak ada output yang berubah")
+                continue
+            steps = ", ".join(f"{step} {seconds * 1000:.0f} ms" for step, seconds in written.items())
+            log(f"   ✅ {steps} (total {(time.perf_counter() - detected) * 1000:.0f} ms, "
+                f"build {result['elapsed'] * 1000:.0f} ms)")
+    except KeyboardInterrupt:
+        log("")
+        log("👋 Watch dihentikan")
+    finally:
+        watcher.close()
+        server.close()
+    return 0
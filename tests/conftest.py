@@ -0,0 +1,23 @@
+"""Fixture bersama: PDF sintetis kecil (benchmarks.synthetic), tanpa poppler/jaringan."""
+
+import pytest
+
+from benchmarks.synthetic import write_pdf
+from pklgen.content import AUTO_PAGES, DEFAULT_STUDENT
+
+# Foto di halaman awal: nomor foto tidak boleh diturunkan dari nomor halaman
+EARLY_PHOTO_PAGES = (3, 4, 5, 9)
+
+
+@pytest.fixture
+def early_photo_pdf(tmp_path):
+    return write_pdf(tmp_path / "laporan.pdf", 12, EARLY_PHOTO_PAGES, photo_size=(400, 560))
+
+
+@pytest.fixture
+def student(early_photo_pdf):
+    return dict(DEFAULT_STUDENT, pdf=str(early_photo_pdf), halaman_foto=AUTO_PAGES)
+
+
+def quiet(msg):
+    pass
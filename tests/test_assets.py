@@ -0,0 +1,56 @@
+from PIL import Image
+
+from pklgen.assets import ASSET_DIR, dedupe_batch, dhash, near_duplicates
+
+from .conftest import quiet
+
+
+def _photo(path, size=(320, 240), quality=90):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    img = Image.linear_gradient('L').resize(size).convert('RGB')
+    img.save(path, quality=quality)
+    return path
+
+
+def _package(root, name, files):
+    package_dir = root / name / "PKL_Complete_Package"
+    for rel, data in files.items():
+        path = package_dir / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return package_dir
+
+
+def test_dedupe_links_identical_files(tmp_path):
+    a = _package(tmp_path, "a", {"LICENSE": b"MIT\n", "README.md": b"a"})
+    b = _package(tmp_path, "b", {"LICENSE": b"MIT\n", "README.md": b"b"})
+    stats = dedupe_batch(tmp_path, [a, b], log=quiet)
+    assert stats['files'] == 4 and stats['unique'] == 3 and stats['linked'] == 1
+    assert (a / "LICENSE").samefile(b / "LICENSE")
+    assert (tmp_path / ASSET_DIR).is_dir()
+
+
+def test_dedupe_skips_unreadable_photos(tmp_path):
+    # Placeholder kosong (pdf2image tidak terpasang) + file rusak + foto asli
+    a = _package(tmp_path, "a", {"images/foto_1.jpg": b"", "images/foto_2.jpg": b"bukan jpeg"})
+    b = _package(tmp_path, "b", {"images/foto_1.jpg": b""})
+    _photo(a / "images" / "foto_3.jpg")
+    _photo(b / "images" / "foto_2.jpg", size=(300, 225), quality=60)
+    messages = []
+    stats = dedupe_batch(tmp_path, [a, b], log=messages.append)
+
+    assert sorted(stats['unreadable']) == ["a/PKL_Complete_Package/images/foto_1.jpg",
+                                           "a/PKL_Complete_Package/images/foto_2.jpg",
+                                           "b/PKL_Complete_Package/images/foto_1.jpg"]
+    # Satu baris log per isi yang rusak, bukan per file
+    assert len([msg for msg in messages if "dHash dilewati" in msg]) == 2
+    # Foto yang bisa dibaca tetap dibandingkan
+    assert [pair[:2] for pair in stats['near_duplicates']] == [
+        ("a/PKL_Complete_Package/images/foto_3.jpg", "b/PKL_Complete_Package/images/foto_2.jpg")]
+
+
+def test_near_duplicates_ignores_same_package_and_same_content(tmp_path):
+    bits = dhash(_photo(tmp_path / "x.jpg"))
+    photos = [("a/1", "a", "d1", bits), ("a/2", "a", "d2", bits ^ 1),
+              ("b/1", "b", "d1", bits), ("c/1", "c", "d3", bits ^ 0xFF)]
+    assert near_duplicates(photos) == [("a/2", "b/1", 1)]
@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from pklgen.content import (AUTO_PAGES, DEFAULT_STUDENT, ROSTER_DEFAULTS, default_fields, format_pages,
+                            load_roster, parse_pages, student_from_record)
+
+RECORD = {'nama': 'Rina', 'nis': '0070000002', 'perusahaan': 'PT Maju Jaya', 'direktur': 'Budi Santoso'}
+
+
+def test_parse_and_format_pages():
+    assert parse_pages('3,7,27-30') == [3, 7, 27, 28, 29, 30]
+    assert parse_pages('27-29|31') == [27, 28, 29, 31]
+    assert parse_pages(' Auto ') == AUTO_PAGES
+    assert format_pages([31, 27, 28, 29]) == '27-29, 31'
+
+
+def test_roster_row_does_not_inherit_default_company_text():
+    student = student_from_record(RECORD)
+    kelvin = ('Sinar Alam', 'Alvian Howend', 'Yamaha', 'Muhammad Sapei')
+    for key in ROSTER_DEFAULTS:
+        text = json.dumps(student[key], ensure_ascii=False)
+        assert not any(name in text for name in kelvin), key
+    assert 'Budi Santoso' in student['pengesahan'][2]
+    assert 'PT Maju Jaya' in student['pengesahan'][2]
+    assert 'PT Maju Jaya' in student['latar_belakang']
+    assert 'PT Maju Jaya' in student['kesimpulan']
+    assert student['tempat_pkl'] == 'PT Maju Jaya'
+    # Data pribadi juga tidak diwarisi, data sekolah tetap
+    assert student['alamat'] == '-'
+    assert student['sekolah'] == DEFAULT_STUDENT['sekolah']
+
+
+def test_roster_values_win_over_placeholders():
+    student = student_from_record(dict(RECORD, visi='Bengkel terbaik', swot='S: a|W: b', halaman_foto='5-6'))
+    assert student['visi'] == 'Bengkel terbaik'
+    assert student['swot'] == ['S: a', 'W: b']
+    assert student['halaman_foto'] == [5, 6]
+    assert 'visi' not in default_fields(student)
+    assert {'profil', 'latar_belakang', 'kesimpulan'} <= default_fields(student)
+
+
+def test_roster_requires_company():
+    with pytest.raises(ValueError, match='perusahaan'):
+        student_from_record({'nama': 'Rina', 'nis': '1'})
+
+
+def test_load_roster_csv_and_jsonl(tmp_path):
+    csv_path = tmp_path / 'roster.csv'
+    csv_path.write_text('nama,nis,perusahaan,orang_tua,kegiatan\n'
+                        'Rina,1,PT Maju Jaya,Ayah: A\\nIbu: B,Servis|Ganti oli\n', encoding='utf-8')
+    jsonl_path = tmp_path / 'roster.jsonl'
+    jsonl_path.write_text(json.dumps(dict(RECORD, kegiatan=['Servis', 'Ganti oli'])) + '\n\n', encoding='utf-8')
+
+    (from_csv,) = load_roster(csv_path)
+    (from_jsonl,) = load_roster(jsonl_path)
+    assert from_csv['orang_tua'] == 'Ayah: A\nIbu: B'
+    assert from_csv['kegiatan'] == from_jsonl['kegiatan'] == ['Servis', 'Ganti oli']
+    (tmp_path / 'roster.txt').write_text('Rina', encoding='utf-8')
+    with pytest.raises(ValueError):
+        load_roster(tmp_path / 'roster.txt')
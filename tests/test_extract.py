@@ -0,0 +1,80 @@
+import json
+import re
+import shutil
+
+import pytest
+
+from benchmarks.synthetic import write_pdf
+from pklgen.content import AUTO_PAGES, DEFAULT_STUDENT
+from pklgen.extract import detect_photo_pages, extract_batched, extract_photos, page_runs, photo_filenames
+from pklgen.pipeline import build_package, package_bytes, plan_package
+
+from .conftest import EARLY_PHOTO_PAGES, quiet
+
+
+def test_photo_filenames_follow_photo_order():
+    assert photo_filenames([9, 3, 5, 4]) == {3: "foto_1.jpg", 4: "foto_2.jpg", 5: "foto_3.jpg", 9: "foto_4.jpg"}
+    # Halaman laporan lama (27-34) tetap foto_1..8
+    assert list(photo_filenames(range(27, 35)).values()) == [f"foto_{i}.jpg" for i in range(1, 9)]
+
+
+def test_explicit_pages_keep_page_numbers():
+    # --pages 27 30 34 tetap foto_1, foto_4, foto_8 seperti versi lama
+    assert photo_filenames([34, 27, 30]) == {27: "foto_1.jpg", 30: "foto_4.jpg", 34: "foto_8.jpg"}
+    # Halaman hasil deteksi selalu berurutan mulai dari foto_1
+    assert photo_filenames([27, 30, 34], detected=True) == {27: "foto_1.jpg", 30: "foto_2.jpg", 34: "foto_3.jpg"}
+    # Ada halaman sebelum 27: nomor halaman - 26 tidak bisa dipakai
+    assert list(photo_filenames([3, 30]).values()) == ["foto_1.jpg", "foto_2.jpg"]
+
+
+def test_package_names_explicit_and_detected_pages(tmp_path):
+    pdf = write_pdf(tmp_path / "laporan.pdf", 32, (28, 31), photo_size=(400, 560))
+    student = dict(DEFAULT_STUDENT, pdf=str(pdf), halaman_foto=[28, 31])
+    explicit = build_package(student, tmp_path / "pilih", log=quiet)
+    assert [page['photo'] for page in explicit['metrics']['pages']] == ["foto_2.jpg", "foto_5.jpg"]
+    assert (tmp_path / "pilih" / "images" / "foto_5.jpg").exists()
+
+    _, detected = package_bytes(dict(student, halaman_foto=AUTO_PAGES), log=quiet)
+    assert [page['photo'] for page in detected['metrics']['pages']] == ["foto_1.jpg", "foto_2.jpg"]
+
+
+def test_page_runs_merges_small_gaps():
+    assert page_runs([1, 2, 3, 6, 7, 20]) == [(1, 7), (20, 20)]
+    assert page_runs([5, 1, 5]) == [(1, 1), (5, 5)]
+    assert page_runs([1, 4], max_gap=1) == [(1, 1), (4, 4)]
+
+
+def test_detected_pages_below_27(early_photo_pdf, tmp_path):
+    pages = detect_photo_pages(early_photo_pdf)
+    assert pages == list(EARLY_PHOTO_PAGES)
+    extracted = extract_photos(early_photo_pdf, pages, tmp_path, log=quiet)
+    assert [path.name for path in extracted.values()] == ["foto_1.jpg", "foto_2.jpg", "foto_3.jpg", "foto_4.jpg"]
+
+
+def test_package_uses_same_names_everywhere(student, tmp_path):
+    output_dir = tmp_path / "PKL_Complete_Package"
+    result = build_package(student, output_dir, log=quiet)
+
+    names = [f"foto_{i}.jpg" for i in range(1, 5)]
+    assert sorted(path.name for path in (output_dir / "images").glob("foto_*.jpg")) == names
+    assert not list((output_dir / "images").glob("foto_-*"))
+    assert [page['photo'] for page in result['metrics']['pages']] == names
+    report = json.loads(result['report'].read_text(encoding="utf-8"))
+    assert [page['photo'] for page in report['pages']] == names
+
+    # Semua gambar yang dirujuk index.html ada di paket
+    html = (output_dir / "index.html").read_text(encoding="utf-8")
+    referenced = set(re.findall(r'images/[^"\s,]+', html))
+    assert referenced
+    assert all((output_dir / name).exists() for name in referenced)
+
+    explicit = dict(student, halaman_foto=list(EARLY_PHOTO_PAGES))
+    plan = {step: planned for step, _, planned in plan_package(explicit, output_dir)}
+    assert plan['extract'] == [f"images/{name}" for name in names]
+
+
+@pytest.mark.skipif(shutil.which("pdftoppm") is None, reason="poppler (pdftoppm) tidak terpasang")
+def test_batched_render_moves_pages_and_cleans_up(early_photo_pdf, tmp_path):
+    extracted = extract_batched(early_photo_pdf, list(EARLY_PHOTO_PAGES), tmp_path, dpi=30, log=quiet)
+    assert [path.name for path in extracted.values()] == ["foto_1.jpg", "foto_2.jpg", "foto_3.jpg", "foto_4.jpg"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["foto_1.jpg", "foto_2.jpg", "foto_3.jpg", "foto_4.jpg"]
@@ -0,0 +1,62 @@
+import sys
+
+from benchmarks.synthetic import write_pdf
+from pklgen import ocr
+from pklgen.content import AUTO_PAGES, DEFAULT_STUDENT, student_from_record
+from pklgen.extract import open_embedded
+
+from .conftest import quiet
+
+SECTION_LINES = [
+    "BAB I PENDAHULUAN",
+    "1.1 Latar Belakang",
+    "Praktik Kerja Lapangan adalah kegiatan wajib bagi siswa SMK untuk",
+    "mengenal dunia kerja secara langsung di perusahaan mitra sekolah.",
+    "1.2 Tujuan",
+]
+
+
+def test_prefill_skips_detected_photo_pages(tmp_path):
+    pdf = write_pdf(tmp_path / "laporan.pdf", 8, (5, 6), photo_size=(400, 560), page_text={2: SECTION_LINES})
+    student = student_from_record({'nama': 'Rina', 'nis': '1', 'perusahaan': 'PT Maju Jaya',
+                                   'pdf': str(pdf), 'halaman_foto': AUTO_PAGES})
+    prefilled, filled, stats = ocr.prefill_student(student, workers=1, log=quiet)
+    assert stats['pages'] == 6
+    assert filled == ['latar_belakang']
+    assert prefilled['latar_belakang'].startswith("Praktik Kerja Lapangan adalah")
+
+
+def test_ocr_error_only_empties_that_page(monkeypatch):
+    def ocr_page(pdf_path, page_num, lang):
+        if page_num == 2:
+            raise RuntimeError("tesseract gagal")
+        return f"teks {page_num}"
+
+    monkeypatch.setattr(ocr, "ocr_page", ocr_page)
+    assert ocr._ocr_page_or_error("x.pdf", 1, "eng") == ("teks 1", None)
+    assert ocr._ocr_page_or_error("x.pdf", 2, "eng") == ("", "RuntimeError: tesseract gagal")
+
+
+def test_page_digest_depends_on_content_not_file(tmp_path):
+    a = write_pdf(tmp_path / "a.pdf", 3, (2,))
+    b = write_pdf(tmp_path / "b.pdf", 3, (2,))
+    c = write_pdf(tmp_path / "c.pdf", 3, (2,), photo_size=(200, 150))
+    digests = {}
+    for path in (a, b, c):
+        with open_embedded(path) as reader:
+            digests[path.name] = [ocr.page_digest(page) for page in reader.pages]
+    assert digests["a.pdf"] == digests["b.pdf"]
+    assert digests["a.pdf"][1][1] == 1
+    assert digests["a.pdf"][1] != digests["c.pdf"][1]
+    assert digests["a.pdf"][0] == digests["c.pdf"][0]
+
+
+def test_cli_prefill_without_pypdf_keeps_default_text(monkeypatch, early_photo_pdf):
+    import generate_all_pkl
+
+    monkeypatch.setitem(sys.modules, "pypdf", None)
+    logged = []
+    args = generate_all_pkl.parse_args(["--prefill", "--no-cache", "--pdf", str(early_photo_pdf), "--pages", "auto"])
+    student = generate_all_pkl.make_student(args, log=logged.append)
+    assert student['latar_belakang'] == DEFAULT_STUDENT['latar_belakang']
+    assert any("pypdf tidak terpasang" in line for line in logged)
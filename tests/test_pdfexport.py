@@ -0,0 +1,71 @@
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from pklgen import pdfexport
+from pklgen.batch import _init_worker
+from pklgen.pdfexport import PdfExportError, _alive, _convert_cli, _desktop, _free_port
+
+posix_only = pytest.mark.skipif(sys.platform == "win32", reason="process group POSIX")
+
+PARENT_DESKTOP = "desktop-induk"
+
+
+def _script(path, body):
+    path.write_text("#!/bin/sh\n" + body)
+    path.chmod(0o755)
+    return str(path)
+
+
+@posix_only
+def test_cli_timeout_kills_whole_process_group(tmp_path):
+    # Seperti soffice -> soffice.bin: wrapper yang menunggu proses anak
+    pid_file = tmp_path / "child.pid"
+    soffice = _script(tmp_path / "soffice", f"sleep 30 &\necho $! > {pid_file}\nwait\n")
+    start = time.monotonic()
+    with pytest.raises(PdfExportError, match="dihentikan"):
+        _convert_cli(soffice, "file:///tmp/profil", tmp_path / "a.docx", tmp_path / "a.pdf", timeout=0.5)
+    assert time.monotonic() - start < 10
+    child = int(pid_file.read_text())
+    for _ in range(50):
+        try:
+            os.kill(child, 0)
+        except ProcessLookupError:
+            break
+        time.sleep(0.05)
+    else:
+        pytest.fail("proses anak soffice masih hidup")
+
+
+@posix_only
+def test_cli_failure_is_reported(tmp_path):
+    soffice = _script(tmp_path / "soffice", "echo rusak >&2\nexit 3\n")
+    with pytest.raises(PdfExportError, match=r"\(3\): rusak"):
+        _convert_cli(soffice, "file:///tmp/profil", tmp_path / "a.docx", tmp_path / "a.pdf")
+
+
+def test_dead_converter_is_not_alive():
+    assert not _alive(None)
+    assert not _alive(_free_port())
+
+
+def _worker_desktop(port):
+    try:
+        return _desktop(port)
+    except Exception as e:
+        # uno tidak terpasang / soffice tidak ada: worker mencoba koneksi sendiri
+        return type(e).__name__
+
+
+@posix_only
+def test_forked_worker_does_not_reuse_parent_uno_bridge(monkeypatch):
+    port = _free_port()
+    monkeypatch.setitem(pdfexport._desktops, (os.getpid(), port), PARENT_DESKTOP)
+    assert _desktop(port) == PARENT_DESKTOP
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("fork"),
+                             initializer=_init_worker, initargs=(None, None)) as pool:
+        assert pool.submit(_worker_desktop, port).result() != PARENT_DESKTOP
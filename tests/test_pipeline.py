@@ -0,0 +1,66 @@
+import io
+import zipfile
+
+import pytest
+
+from pklgen.manifest import MANIFEST_NAME
+from pklgen.packager import PackageZip
+from pklgen.pipeline import STEPS, build_package, package_bytes
+
+from .conftest import quiet
+
+
+def _zip_names(path_or_bytes):
+    source = io.BytesIO(path_or_bytes) if isinstance(path_or_bytes, bytes) else path_or_bytes
+    with zipfile.ZipFile(source) as zf:
+        return {info.filename: info.compress_type for info in zf.infolist() if not info.is_dir()}
+
+
+def test_rebuild_skips_unchanged_steps(student, tmp_path):
+    output_dir = tmp_path / "PKL_Complete_Package"
+    first = build_package(student, output_dir, log=quiet)
+    assert first['skipped'] == []
+
+    again = build_package(student, output_dir, log=quiet)
+    assert again['skipped'] == [step for step in STEPS if step in first['timings']]
+
+    # Hanya visi yang berubah: foto dan file pendukung tidak dibuat ulang
+    edited = build_package(dict(student, visi="Visi baru yang lain."), output_dir, log=quiet)
+    assert {'extract', 'images', 'support'} <= set(edited['skipped'])
+    assert not {'docx', 'html', 'readme', 'zip'} & set(edited['skipped'])
+    assert "Visi baru yang lain" in (output_dir / "README.md").read_text(encoding="utf-8")
+
+    # Output yang dihapus dari folder dibuat ulang
+    (output_dir / "index.html").unlink()
+    rebuilt = build_package(dict(student, visi="Visi baru yang lain."), output_dir, log=quiet)
+    assert 'html' not in rebuilt['skipped']
+    assert (output_dir / "index.html").exists()
+
+
+def test_zip_matches_folder_and_stores_compressed_files(student, tmp_path):
+    output_dir = tmp_path / "PKL_Complete_Package"
+    result = build_package(student, output_dir, log=quiet)
+    names = _zip_names(result['zip'])
+    on_disk = {path.relative_to(output_dir).as_posix() for path in output_dir.rglob("*")
+               if path.is_file() and path.name != MANIFEST_NAME}
+    assert set(names) == on_disk
+    assert all(kind == zipfile.ZIP_STORED for name, kind in names.items() if name.endswith((".jpg", ".docx")))
+    assert names["README.md"] == zipfile.ZIP_DEFLATED
+
+    data, in_memory = package_bytes(student, log=quiet)
+    assert set(_zip_names(data)) == set(names)
+    assert in_memory['photos'] == result['photos']
+
+
+def test_package_zip_keeps_old_archive_on_error(tmp_path):
+    zip_path = tmp_path / "paket.zip"
+    with PackageZip(zip_path) as zf:
+        zf.add_bytes("a/README.md", "lama")
+    with pytest.raises(RuntimeError):
+        with PackageZip(zip_path) as zf:
+            zf.add_bytes("a/README.md", "baru")
+            raise RuntimeError("gagal di tengah")
+    assert not (tmp_path / "paket.zip.tmp").exists()
+    with zipfile.ZipFile(zip_path) as zf:
+        assert zf.read("a/README.md") == b"lama"
+        assert "a/" in zf.namelist()
@@ -0,0 +1,52 @@
+import json
+
+from pklgen.content import student_from_record
+from pklgen.search import SEARCH_DIR, build_index, tokenize, write_cohort_site
+
+
+def _entries():
+    rina = student_from_record({'nama': 'Rina Ayu', 'nis': '1', 'perusahaan': 'PT Maju Jaya',
+                                'alamat': 'Jalan Rahasia', 'kegiatan': 'Servis berkala|Ganti oli'})
+    budi = student_from_record({'nama': 'Budi', 'nis': '2', 'perusahaan': 'Bengkel Zeta Servis'})
+    return [(rina, "rina/index.html"), (budi, "budi/index.html")]
+
+
+def _lookup(shards, word):
+    flat = shards[word[:2]][word]
+    doc_id, docs = 0, []
+    for delta, weight in zip(flat[::2], flat[1::2]):
+        doc_id += delta
+        docs.append(doc_id)
+    return docs
+
+
+def test_tokenize_folds_diacritics_and_drops_stopwords():
+    assert tokenize("Perbaikan Mesin dan Rém") == ["perbaikan", "mesin", "rem"]
+
+
+def test_index_shards_by_prefix_with_delta_postings():
+    docs, shards = build_index(_entries())
+    assert [doc[0] for doc in docs] == ["Rina Ayu", "Budi"]
+    assert all(word.startswith(prefix) for prefix, words in shards.items() for word in words)
+    assert _lookup(shards, "jaya") == [0]
+    assert _lookup(shards, "zeta") == [1]
+    assert _lookup(shards, "servis") == [0, 1]
+    assert _lookup(shards, "rina") == [0]
+    # Data pribadi tidak diindeks
+    assert "rahasia" not in shards.get("ra", {})
+
+
+def test_cohort_site_rewrites_only_changed_shards(tmp_path):
+    entries = _entries()
+    first = write_cohort_site(tmp_path, entries)
+    search_dir = tmp_path / SEARCH_DIR
+    meta = json.loads((search_dir / "meta.json").read_text(encoding="utf-8"))
+    assert sorted(path.stem for path in search_dir.glob("*.json")) == sorted(meta['shards'] + ["docs", "meta"])
+    assert first['written'] == first['shards'] + 2
+
+    assert write_cohort_site(tmp_path, entries)['written'] == 0
+    # Siswa kedua dihapus: shard yang hanya berisi katanya ikut dihapus
+    removed = set(build_index(entries)[1]) - set(build_index(entries[:1])[1])
+    assert removed
+    write_cohort_site(tmp_path, entries[:1])
+    assert not removed & {path.stem for path in search_dir.glob("*.json")}
@@ -0,0 +1,41 @@
+import re
+
+from pklgen.content import student_from_record
+from pklgen.pipeline import build_package, plan_package
+from pklgen.site import minify_css, minify_js, render_readme
+
+from .conftest import EARLY_PHOTO_PAGES, quiet
+
+
+def test_readme_uses_student_lists_and_photo_names():
+    student = student_from_record({'nama': 'Rina', 'nis': '1', 'perusahaan': 'PT Maju Jaya',
+                                   'swot': 'Strengths: lokasi ramai, harga murah|Threats: pesaing',
+                                   'kegiatan': 'Servis berkala|Ganti ban'})
+    readme = render_readme(student, ['images/foto_2.jpg', 'images/foto_10.jpg', 'images/foto_1.jpg'])
+    assert 'Yamaha' not in readme and 'Sinar Alam' not in readme
+    assert '### 💪 Strengths\n- ✅ Lokasi ramai\n- ✅ Harga murah' in readme
+    assert '1. Servis berkala\n2. Ganti ban' in readme
+    assert re.findall(r'\]\((images/[^)]+)\)', readme) == [
+        'images/foto_1.jpg', 'images/foto_2.jpg', 'images/foto_10.jpg']
+    assert '*3 foto dokumentasi' in readme
+    assert '*Belum ada foto dokumentasi*' in render_readme(student, [])
+
+
+def test_readme_follows_extracted_photos(student, tmp_path):
+    output_dir = tmp_path / "PKL_Complete_Package"
+    build_package(student, output_dir, log=quiet)
+    readme = (output_dir / "README.md").read_text(encoding="utf-8")
+    linked = re.findall(r'\]\((images/[^)]+)\)', readme)
+    assert linked == [f"images/foto_{i}.jpg" for i in range(1, len(EARLY_PHOTO_PAGES) + 1)]
+    assert all((output_dir / name).exists() for name in linked)
+
+    # Foto lain -> README dibuat ulang
+    fewer = dict(student, halaman_foto=list(EARLY_PHOTO_PAGES[:2]))
+    fresh = {step: is_fresh for step, is_fresh, _ in plan_package(fewer, output_dir)}
+    assert not fresh['readme']
+    assert fresh['support']
+
+
+def test_minify_helpers():
+    assert minify_css("a { color: red; }\n/* x */ b > i { margin: 0 }") == "a{color:red}b>i{margin:0}"
+    assert minify_js("if (a) {\n    b = 1;\n}\n") == "if(a){b=1;}"
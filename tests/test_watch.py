@@ -0,0 +1,49 @@
+import os
+import sys
+
+import pytest
+
+from pklgen.watch import _EVENT, IN_CLOSE_WRITE, IN_Q_OVERFLOW, FileWatcher, _Inotify
+
+linux_only = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify hanya di Linux")
+
+
+def _event(wd, mask, name=b""):
+    name = name + b"\0" * (-len(name) % 16) if name else b""
+    return _EVENT.pack(wd, mask, 0, len(name)) + name
+
+
+@linux_only
+def test_inotify_reports_watched_file(tmp_path):
+    watched, other = tmp_path / "content.py", tmp_path / "lain.py"
+    watched.write_text("a")
+    watcher = FileWatcher([watched])
+    try:
+        assert watcher.method == "inotify"
+        other.write_text("b")
+        watched.write_text("c")
+        changed, _ = watcher.wait()
+        assert changed == {watched.resolve()}
+    finally:
+        watcher.close()
+
+
+@linux_only
+def test_inotify_overflow_and_unknown_watch(tmp_path):
+    paths = [tmp_path / "content.py", tmp_path / "site.py"]
+    for path in paths:
+        path.write_text("")
+    inotify = _Inotify(paths)
+    os.close(inotify._fd)
+    read_fd, write_fd = os.pipe()
+    inotify._fd = read_fd
+    try:
+        # Event untuk watch yang sudah dilepas (wd tidak dikenal) dilewati
+        os.write(write_fd, _event(999, IN_CLOSE_WRITE, b"content.py"))
+        assert inotify.read(0) == set()
+        # Antrian meluap (wd = -1): semua file dianggap berubah
+        os.write(write_fd, _event(-1, IN_Q_OVERFLOW))
+        assert inotify.read(0) == {path.resolve() for path in paths}
+    finally:
+        inotify.close()
+        os.close(write_fd)